@@ -33,6 +33,21 @@ class Conf(_config.ConfigNamespace):
         cfgtype="string",
     )
 
+    sampler_cache = _config.ConfigItem(
+        True,
+        description=(
+            "Whether to cache distribution functions and sampling tables "
+            "across samplers of equal potentials."
+        ),
+        cfgtype="boolean",
+    )
+
+    sampler_cache_size = _config.ConfigItem(
+        32,
+        description="Maximum number of items in the sampler cache.",
+        cfgtype="integer",
+    )
+
 
 conf = Conf()
 # /class
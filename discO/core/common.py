@@ -155,6 +155,17 @@ class CommonBase(metaclass=ABCMeta):
 
     # /def
 
+    def __reduce__(self) -> tuple:
+        """Pickle, e.g. to send to a worker process.
+
+        Unpickling skips ``__new__``, which dispatches on the registry, and
+        restores the instance ``__dict__``.
+
+        """
+        return object.__new__, (self.__class__,), self.__dict__
+
+    # /def
+
     #################################################################
     # Running
 
@@ -23,14 +23,18 @@ import typing as T
 from types import MappingProxyType, ModuleType
 
 # THIRD PARTY
+import astropy.coordinates as coord
+import astropy.units as u
 import numpy as np
 
 # PROJECT-SPECIFIC
 import discO.type_hints as TH
 from .common import CommonBase
+from .sample import SampleArrays
 from discO.utils.coordinates import (
     resolve_framelike,
     resolve_representationlike,
+    transform_to,
 )
 from discO.utils.pbar import get_progress_bar
 
@@ -211,11 +215,54 @@ class PotentialFitter(CommonBase):
 
     # /def
 
+    def fit_chunks(
+        self,
+        chunks: T.Iterable[T.Union[TH.CoordinateType, SampleArrays]],
+        **kwargs,
+    ) -> object:
+        """Fit a sample given in chunks, e.g. from ``sample_chunks``.
+
+        By default the chunks are joined and fit with ``__call__``.
+        Subclasses that can accumulate the fit, like SCF expansions,
+        should override this method to consume the chunks one at a time,
+        so that the sample need never be whole in memory.
+
+        Parameters
+        ----------
+        chunks : iterable of |SkyCoord| or `~discO.core.sample.SampleArrays`
+            Each of shape (nchunk, ), with masses.
+        **kwargs
+            passed to fitting potential.
+
+        Returns
+        -------
+        Potential : object
+
+        """
+
+        def in_frame(chunk) -> SampleArrays:
+            if isinstance(chunk, SampleArrays):
+                if chunk.frame is None:
+                    return chunk
+                return chunk.transform_to(self.frame)
+
+            return SampleArrays.from_coord(
+                transform_to(chunk, self.frame),
+                mass=getattr(chunk, "mass", None),
+            )
+
+        sample = SampleArrays.concatenate(map(in_frame, chunks))
+
+        return self(sample, **kwargs)
+
+    # /def
+
     def _run_iter(
         self,
         sample: TH.CoordinateType,
         mass: T.Optional[TH.QuantityType] = None,
         *,
+        weights: T.Optional[np.ndarray] = None,
         progress: bool = True,
         **kwargs,
     ) -> object:
@@ -234,6 +281,10 @@ class PotentialFitter(CommonBase):
             can have shape (nsamp, ) or (nsamp, niter)
         mass : `~astropy.units.Quantity`
             The mass.
+        weights : (nsamp, niter) array or None (optional, keyword-only)
+            Multiplicities of the particles in each iteration, eg. from a
+            multinomial draw when bootstrapping. Each iteration is fit with
+            ``mass * weights[:, i]``. `sample` must have shape (nsamp, ).
         **kwargs
             passed to fitting potential.
 
@@ -242,13 +293,40 @@ class PotentialFitter(CommonBase):
         Potential : object
 
         """
-        if mass is None:
+        if mass is None and isinstance(sample, SampleArrays):
+            mass = sample.masses * SampleArrays.units["masses"]
+        elif mass is None:
             mass = sample.mass
 
+        if weights is not None:
+            weights = self._resolve_weights(sample, weights)
+
+            with get_progress_bar(progress, weights.shape[1]) as pbar:
+                for weight in weights.T:
+                    pbar.update(1)
+                    yield self(sample, mass=mass * weight, **kwargs)
+
+            return  # prevent going to next thing
+
+        # arrays are split into iterations, without building coordinates.
+        if isinstance(sample, SampleArrays):
+            mass = mass.to_value(SampleArrays.units["masses"])
+            sample = sample._replace(
+                masses=np.broadcast_to(mass, sample.shape),
+            )
+
+            samples = sample.split()
+            with get_progress_bar(progress, len(samples)) as pbar:
+                for samp in samples:
+                    pbar.update(1)
+                    yield self(samp, **kwargs)
+
+            return  # prevent going to next thing
+
         N, *iterations = sample.shape
 
         # get samples into the correct frame
-        sample = sample.transform_to(self.frame)
+        sample = transform_to(sample, self.frame)
         sample.mass = mass
 
         # get # iterations (& reshape no-iteration samples)
@@ -301,6 +379,7 @@ class PotentialFitter(CommonBase):
 
         **kwargs
             passed to fitting potential.
+            ``weights`` is passed to ``_run_iter``.
 
         Returns
         -------
@@ -333,6 +412,7 @@ class PotentialFitter(CommonBase):
 
         **kwargs
             passed to fitting potential.
+            ``weights`` is passed to ``_run_iter``.
 
         Returns
         -------
@@ -348,6 +428,94 @@ class PotentialFitter(CommonBase):
     #######################################################
     # Utils
 
+    @staticmethod
+    def _resolve_weights(
+        sample: TH.CoordinateType,
+        weights: np.ndarray,
+    ) -> np.ndarray:
+        """Resolve the bootstrap weights.
+
+        Parameters
+        ----------
+        sample : :class:`~astropy.coordinates.SkyCoord` instance
+            Must have shape (nsamp, ).
+        weights : (nsamp, ) or (nsamp, niter) array
+
+        Returns
+        -------
+        (nsamp, niter) array
+
+        Raises
+        ------
+        ValueError
+            If `sample` is not 1D or the shape of `weights` doesn't match.
+
+        """
+        if len(sample.shape) != 1:
+            raise ValueError("weights need a sample of shape (nsamp, ).")
+
+        weights = np.asanyarray(weights)
+        if weights.shape[0] != sample.shape[0] or weights.ndim > 2:
+            raise ValueError("weights must have shape (nsamp, [niter]).")
+
+        return weights.reshape((sample.shape[0], -1))
+
+    # /def
+
+    def _cartesian_positions(
+        self,
+        sample: T.Union[TH.CoordinateType, SampleArrays],
+        mass: T.Optional[TH.QuantityType] = None,
+        frame: TH.OptFrameType = None,
+    ) -> T.Tuple[TH.QuantityType, TH.QuantityType]:
+        """Cartesian positions and masses of a sample, in the fit frame.
+
+        `~discO.core.sample.SampleArrays` are used directly, without building
+        coordinates, if in the fit frame or a static transformation away.
+
+        Parameters
+        ----------
+        sample : |SkyCoord| or `~discO.core.sample.SampleArrays`
+            Must have shape (nsamp, ).
+        mass : |Quantity| or None (optional)
+            If None (default), the mass of `sample`.
+        frame : |CoordinateFrame| or None (optional)
+            The fit frame. If None (default), ``self.frame``.
+
+        Returns
+        -------
+        position : (3, nsamp) |Quantity|
+        mass : (nsamp, ) |Quantity|
+
+        """
+        frame = self.frame if frame is None else frame
+
+        if isinstance(sample, SampleArrays):
+            if mass is None and sample.masses is not None:
+                mass = u.Quantity(
+                    sample.masses,
+                    SampleArrays.units["masses"],
+                    copy=False,
+                )
+            if sample.frame is not None:
+                sample = sample.transform_to(frame)
+            position = u.Quantity(
+                sample.positions.T,
+                SampleArrays.units["positions"],
+                copy=False,
+            )
+            return position, mass
+
+        elif mass is None:
+            mass = sample.mass
+
+        sample = transform_to(sample, frame)
+        position = sample.represent_as(coord.CartesianRepresentation).xyz
+
+        return position, mass
+
+    # /def
+
     def __repr__(self):
         s = super().__repr__()
         s += f"\n\tframe: {self.frame}"
@@ -15,6 +15,8 @@ __all__ = [
     # specific classes
     "RVS_Continuous",
     "GaussianMeasurementError",
+    "CovarianceMeasurementError",
+    "ObservableMeasurementError",
     # utilities
     "xpercenterror_factory",
 ]
@@ -25,7 +27,6 @@ __all__ = [
 
 # BUILT-IN
 import abc
-import copy
 import inspect
 import typing as T
 from collections.abc import Mapping
@@ -49,14 +50,23 @@ from astropy.utils.decorators import classproperty
 import discO.type_hints as TH
 from .common import CommonBase
 from .sample import RandomLike  # TODO move to type-hints
+from .sample import SampleArrays
 from discO.utils import resolve_framelike, resolve_representationlike
+from discO.utils.coordinates import transform_to
 from discO.utils.pbar import get_progress_bar
+from discO.utils.random import resolve_random
 
 ##############################################################################
 # PARAMETERS
 
 _MEASURE_REGISTRY: T.Dict[str, CommonBase] = dict()  # key : measurer
 
+# proper motion [mas / yr] x distance [kpc] -> velocity [km / s]
+_PM_TO_VELOCITY: float = (1 * u.mas / u.yr * u.kpc).to_value(
+    u.km / u.s,
+    u.dimensionless_angles(),
+)
+
 CERR_Type = T.Union[
     T.Callable,
     TH.CoordinateType,
@@ -311,6 +321,11 @@ class MeasurementErrorSampler(CommonBase, metaclass=abc.ABCMeta):
 
         N, *iterations = c.shape
 
+        if iterations and isinstance(c, SampleArrays):
+            c = c.split()  # iterate through the columns, like ``c.T``
+        elif iterations:
+            c = c.T
+
         # TODO! fold this into the "with_progress bar" bit
         # depends on the shape of "c": (Nsamples,) or (Nsamples, Niter)?
         if not iterations:  # only (Nsamples, )
@@ -328,7 +343,7 @@ class MeasurementErrorSampler(CommonBase, metaclass=abc.ABCMeta):
         c_errs = self._distribute_c_err(c_err, iterations)
 
         with get_progress_bar(progress, iterations) as pbar:
-            for samp, err in zip(c.T, c_errs):
+            for samp, err in zip(c, c_errs):
                 pbar.update(1)
                 yield self(
                     samp,
@@ -403,6 +418,9 @@ class MeasurementErrorSampler(CommonBase, metaclass=abc.ABCMeta):
                 ),
             )
 
+            if isinstance(c, SampleArrays):
+                return SampleArrays.stack(samples)
+
             sample = concatenate(samples).reshape(c.shape)
             # transfer mass & potential # TODO! better
             sample.mass = getattr(c, "mass", None)
@@ -454,8 +472,7 @@ class MeasurementErrorSampler(CommonBase, metaclass=abc.ABCMeta):
         run_func = self._run_batch if batch else self._run_iter
 
         # need to resolve RandomState
-        if not isinstance(random, np.random.RandomState):
-            random = np.random.RandomState(random)
+        random = resolve_random(random)
 
         return run_func(
             c, c_err=c_err, random=random, progress=progress, **kwargs
@@ -800,15 +817,58 @@ class RVS_Continuous(MeasurementErrorSampler, method="rvs"):
         # Setup
 
         # set as RandomState. see 'RandomState' docs for details
-        if not isinstance(random, np.random.RandomState):
-            random = np.random.RandomState(random)
+        random = resolve_random(random)
 
         # the rvs parameters
-        ps = copy.deepcopy(self.params)
-        ps.update(**params)
+        ps = dict(self.params, **params)  # the RVS doesn't modify them
+
+        if isinstance(c, SampleArrays):
+            return self._resample_arrays(c, c_err, random=random, **ps)
+
+        # get "c" into the correct frame and representation type
+        cc, rep = self._transform(c)
+
+        # scale, from `c_err`
+        scale = self._parse_c_err(c_err, cc)
+
+        # draw realization, in the frame
+        new_cc = self._resample(rep, scale, random=random, **ps)
+
+        # make SkyCoord from new realization, preserving original shape
+        new_sc = SkyCoord(
+            new_cc.reshape(c.shape),
+            copy=False,
+        )
+
+        # need to transfer metadata.
+        # TODO! more generally, probably need different method for new_c
+        new_sc.potential = getattr(c, "potential", None)
+        new_sc.mass = getattr(c, "mass", None)
+
+        return new_sc
+
+    # /def
+
+    def _transform(
+        self,
+        c: TH.CoordinateType,
+    ) -> T.Tuple[TH.FrameType, TH.RepresentationType]:
+        """Transform `c` to the frame and representation type.
+
+        Parameters
+        ----------
+        c : |CoordinateFrame| or |SkyCoord|
 
+        Returns
+        -------
+        cc : |CoordinateFrame|
+            In ``frame`` and ``representation_type``.
+        rep : |Representation|
+            The data of `cc`.
+
+        """
         # get "c" into the correct frame
-        cc = c.transform_to(self.frame)
+        cc = transform_to(c, self.frame)
 
         # get "cc" into the correct representation type
         rep = cc.data.represent_as(self.representation_type)
@@ -817,33 +877,50 @@ class RVS_Continuous(MeasurementErrorSampler, method="rvs"):
             representation_type=self.representation_type,
         )
 
+        return cc, rep
+
+    # /def
+
+    def _resample(
+        self,
+        rep: TH.RepresentationType,
+        scale: T.Union[float, np.ndarray],
+        *,
+        random: RandomLike,
+        **params,
+    ) -> TH.FrameType:
+        """Resample a flat representation, in one draw.
+
+        Parameters
+        ----------
+        rep : |Representation|
+            In ``representation_type``, of shape (N, ).
+        scale : float or (N, ncomponents) ndarray
+            The scale of the errors.
+        random : |RandomState| or `~numpy.random.Generator` (keyword-only)
+        **params
+            Parameters into the RVS.
+
+        Returns
+        -------
+        |CoordinateFrame|
+            In ``frame`` and ``representation_type``.
+
+        """
         # for re-building
         units = rep._units
         attr_classes = rep.attr_classes
 
-        # ----------------
-        # Resample
-
         # loc, must be ndarray (N, 3)
         pos = rep._values.view(dtype=np.float64).reshape(rep.shape[0], -1)
-        # scale, from `c_err`
-        scale = self._parse_c_err(c_err, cc)
 
         # draw realization
         # this will have no units. We will need to add those
-        ba = self._rvs_sig.bind_partial(
-            **ps, loc=pos, scale=scale, size=pos.shape, random_state=random
-        )
-        ba.apply_defaults()
-
-        new_pos = self.rvs.rvs(*ba.args, **ba.kwargs)
+        new_pos = self._draw(pos, scale, random=random, **params)
 
         # deal with branch cuts
         new_posT = self._fix_branch_cuts(new_pos.T, rep.__class__, units)
 
-        # ----------------
-        # Cleanup
-
         # re-build representation
         new_rep = rep.__class__(
             **{
@@ -852,22 +929,320 @@ class RVS_Continuous(MeasurementErrorSampler, method="rvs"):
             }
         )
         # make coordinate
-        new_cc = self.frame.realize_frame(
+        return self.frame.realize_frame(
             new_rep,
             representation_type=self.representation_type,
         )
-        # make SkyCoord from new realization, preserving original shape
-        new_sc = SkyCoord(
-            new_cc.reshape(c.shape),
-            copy=False,
+
+    # /def
+
+    def _run_batch(
+        self,
+        c: TH.SkyCoordType,
+        c_err: TH.CoordinateType = None,
+        *,
+        random: T.Optional[RandomLike] = None,
+        # extra
+        progress: bool = False,
+        **kwargs,
+    ) -> TH.SkyCoordType:
+        """Draw a realization given measurement error, vectorized.
+
+        A (Nsamples, Niter) sample is resampled as one block: it is
+        transformed once, the noise is drawn at once, the branch cuts are
+        fixed once, and one |SkyCoord| is built. The columns are drawn in
+        order, so the realization is the same as from ``_run_iter``.
+
+        Parameters
+        ----------
+        c : :class:`~astropy.coordinates.SkyCoord` instance
+        c_err : :class:`~astropy.coordinates.SkyCoord` instance
+
+        **kwargs
+            Parameters into the RVS.
+
+        Returns
+        -------
+        :class:`~astropy.coordinates.SkyCoord`
+
+        Other Parameters
+        ----------------
+        random : `~numpy.random.RandomState` or int (optional, keyword-only)
+            The random number generator or generator seed.
+        progress : bool (optional, keyword-only)
+            Ignored, there being one step.
+
+        """
+        if len(c.shape) == 1:  # (Nsamples, )
+            return super()._run_batch(
+                c,
+                c_err=c_err,
+                random=random,
+                progress=progress,
+                **kwargs,
+            )
+
+        random = resolve_random(random)
+        c_err = self.c_err if c_err is None else c_err
+        if c_err is None:
+            raise ValueError
+
+        # the rvs parameters
+        ps = dict(self.params, **kwargs)
+
+        N, iterations = c.shape
+
+        if isinstance(c, SampleArrays):
+            c = self._arrays_to_frame(c)
+            # the columns, end to end
+            columns = c._replace(
+                positions=np.swapaxes(c.positions, 0, 1),
+                velocities=None,
+            )
+            scale = self._arrays_scale(columns, c_err)
+
+            if scale is None:  # round-trip through coordinates
+                new_c = self._run_batch(
+                    c.to_coord(),
+                    c_err=c_err,
+                    random=random,
+                    **kwargs,
+                )
+                return SampleArrays.from_coord(new_c)
+
+            positions = self._draw(
+                columns.positions,
+                scale,
+                random=random,
+                **ps,
+            )
+            return c._replace(
+                positions=np.swapaxes(positions, 0, 1),
+                velocities=None,
+            )
+
+        # the columns, end to end, in the frame and representation type
+        cc, rep = self._transform(c.T.ravel())
+        scale = self._parse_c_err_batch(c_err, cc, iterations)
+
+        new_cc = self._resample(rep, scale, random=random, **ps)
+
+        # make SkyCoord from new realization, in the original shape
+        sample = SkyCoord(new_cc.reshape(iterations, N).T, copy=False)
+
+        # transfer mass & potential
+        sample.mass = getattr(c, "mass", None)
+        sample.potential = getattr(c, "potential", None)
+
+        return sample
+
+    # /def
+
+    def _parse_c_err_batch(
+        self,
+        c_err: CERR_Type,
+        cc: TH.CoordinateType,
+        iterations: int,
+    ) -> T.Union[float, np.ndarray]:
+        """Parse ``c_err`` for all the columns of a sample, end to end.
+
+        Parameters
+        ----------
+        c_err : coord-like or callable or |Quantity| or float
+            For one column or, if coord-like, for all.
+        cc : |CoordinateFrame|
+            The columns of the sample, end to end.
+        iterations : int
+            The number of columns.
+
+        Returns
+        -------
+        float or :class:`~numpy.ndarray`
+
+        Raises
+        ------
+        ValueError
+            If the shapes of `c_err` and `cc` don't match.
+
+        """
+        N = len(cc) // iterations
+        self._distribute_c_err(c_err, iterations)  # checks shape & type
+
+        if isinstance(
+            c_err,
+            (SkyCoord, BaseCoordinateFrame, BaseRepresentation),
+        ):
+            if c_err.size == N:  # the same for each column
+                return np.tile(
+                    self._parse_c_err(c_err.ravel(), cc[:N]),
+                    (iterations, 1),
+                )
+            return self._parse_c_err(c_err.T.ravel(), cc)
+
+        elif (
+            np.isscalar(c_err)
+            or getattr(c_err, "unit", u.m) == u.percent
+            or not callable(c_err)
+        ):
+            return self._parse_c_err(c_err, cc)
+
+        # a callable is evaluated on each column
+        ncomponents = len(cc.data.components)
+        return np.concatenate(
+            [
+                np.broadcast_to(
+                    self._parse_c_err(c_err, cc[slice(i * N, (i + 1) * N)]),
+                    (N, ncomponents),
+                )
+                for i in range(iterations)
+            ],
         )
 
-        # need to transfer metadata.
-        # TODO! more generally, probably need different method for new_c
-        new_sc.potential = getattr(c, "potential", None)
-        new_sc.mass = getattr(c, "mass", None)
+    # /def
 
-        return new_sc
+    def _resample_arrays(
+        self,
+        c: SampleArrays,
+        c_err: T.Optional[CERR_Type] = None,
+        *,
+        random: np.random.RandomState,
+        **params,
+    ) -> SampleArrays:
+        """Draw a realization of `~discO.core.sample.SampleArrays`.
+
+        If the errors are Cartesian, in the frame of `c`, and `c_err` is a
+        number, array, or percent, the positions are resampled directly.
+        Otherwise `c` is converted to coordinates and back.
+        As with coordinates, the velocities are not resampled and are
+        dropped.
+
+        Parameters
+        ----------
+        c : `~discO.core.sample.SampleArrays`
+            Must have shape (N, ).
+        c_err : float or ndarray or |Quantity| or None (optional)
+            The scale of the errors, in the units of ``SampleArrays.units``
+            and radians for angles.
+        random : `~numpy.random.RandomState` (keyword-only)
+        **params
+            Parameters into the RVS.
+
+        Returns
+        -------
+        `~discO.core.sample.SampleArrays`
+
+        """
+        c_err = self.c_err if c_err is None else c_err
+        c = self._arrays_to_frame(c)
+        scale = self._arrays_scale(c, c_err)
+
+        if scale is None:  # round-trip through coordinates
+            new_c = self(c.to_coord(), c_err=c_err, random=random, **params)
+            return SampleArrays.from_coord(new_c)
+
+        positions = self._draw(c.positions, scale, random=random, **params)
+
+        return c._replace(positions=positions, velocities=None)
+
+    # /def
+
+    def _arrays_to_frame(self, c: SampleArrays) -> SampleArrays:
+        """Transform `~discO.core.sample.SampleArrays` for Cartesian errors.
+
+        Cartesian errors are drawn directly on the arrays, which need only be
+        in ``frame``. This is quickest for static transformations, which are
+        applied directly to the arrays.
+
+        Parameters
+        ----------
+        c : `~discO.core.sample.SampleArrays`
+
+        Returns
+        -------
+        `~discO.core.sample.SampleArrays`
+            In ``frame`` if the errors are Cartesian and `c` has a frame.
+            Otherwise `c`.
+
+        """
+        if (
+            self.representation_type is coord.CartesianRepresentation
+            and c.frame is not None
+        ):
+            c = c.transform_to(self.frame)
+
+        return c
+
+    # /def
+
+    def _arrays_scale(
+        self,
+        c: SampleArrays,
+        c_err: T.Optional[CERR_Type],
+    ) -> T.Union[float, np.ndarray, None]:
+        """The scale of the errors on `~discO.core.sample.SampleArrays`.
+
+        Parameters
+        ----------
+        c : `~discO.core.sample.SampleArrays`
+        c_err : float or ndarray or |Quantity| or None
+
+        Returns
+        -------
+        float or ndarray or None
+            None if `c` can't be resampled directly, because the errors are
+            not Cartesian in the frame of `c`, or `c_err` is not a number,
+            array, or percent.
+
+        """
+        if self.representation_type is coord.CartesianRepresentation and (
+            c.frame is None or self.frame.is_equivalent_frame(c.frame)
+        ):
+            if getattr(c_err, "unit", None) == u.percent:
+                return np.abs(c.positions) * c_err.to_value(u.one)
+            elif not hasattr(c_err, "unit") and (
+                np.isscalar(c_err) or isinstance(c_err, np.ndarray)
+            ):
+                return c_err
+
+        return None
+
+    # /def
+
+    def _draw(
+        self,
+        loc: np.ndarray,
+        scale: T.Union[float, np.ndarray],
+        *,
+        random: RandomLike,
+        **params,
+    ) -> np.ndarray:
+        """Draw from the RVS, one variate per element of `loc`.
+
+        Parameters
+        ----------
+        loc : ndarray
+        scale : float or ndarray
+            Broadcastable against `loc`.
+        random : |RandomState| or `~numpy.random.Generator` (keyword-only)
+        **params
+            Parameters into the RVS.
+
+        Returns
+        -------
+        ndarray
+            The shape of `loc`.
+
+        """
+        ba = self._rvs_sig.bind_partial(
+            **params,
+            loc=loc,
+            scale=scale,
+            size=loc.shape,
+            random_state=random,
+        )
+        ba.apply_defaults()
+
+        return self.rvs.rvs(*ba.args, **ba.kwargs)
 
     # /def
 
@@ -941,9 +1316,782 @@ class GaussianMeasurementError(RVS_Continuous, method="Gaussian"):
 
     # /def
 
+    def _draw(
+        self,
+        loc: np.ndarray,
+        scale: T.Union[float, np.ndarray],
+        *,
+        random: RandomLike,
+        **params,
+    ) -> np.ndarray:
+        """Draw Gaussian variates, one per element of `loc`.
+
+        Standard normal variates are drawn into the output array, then
+        scaled and shifted in place. This is what ``scipy.stats.norm.rvs``
+        does, with the same variates, but without its argument parsing.
+        If there are other parameters, it falls back to
+        ``scipy.stats.norm``.
+
+        Parameters
+        ----------
+        loc : ndarray
+        scale : float or ndarray
+            Broadcastable against `loc`.
+        random : |RandomState| or `~numpy.random.Generator` (keyword-only)
+        **params
+            Parameters into the RVS.
+
+        Returns
+        -------
+        ndarray
+            The shape of `loc`.
+
+        Raises
+        ------
+        ValueError
+            If `scale` is negative.
+
+        """
+        if params:
+            return super()._draw(loc, scale, random=random, **params)
+        elif np.any(np.less(scale, 0)):
+            raise ValueError("scale must be >= 0.")
+
+        if isinstance(random, np.random.Generator):
+            out = np.empty(loc.shape)
+            random.standard_normal(out=out)
+        else:  # RandomState can't draw into an array
+            out = random.standard_normal(loc.shape)
+
+        out *= scale
+        out += loc
+
+        return out
+
+    # /def
+
 
 # /class
 
+# -------------------------------------------------------------------
+
+
+class CovarianceMeasurementError(
+    GaussianMeasurementError, method="covariance"
+):
+    """Draw a realization given correlated Gaussian measurement errors.
+
+    The errors on each point are a full covariance matrix over the
+    components of ``representation_type``, eg. correlating the distance with
+    the sky position. All the covariances are factored with one (batched)
+    Cholesky decomposition and the correlated noise for every point is drawn
+    at once.
+
+    Parameters
+    ----------
+    c_err : ndarray or callable or None (optional, keyword-only)
+        The covariance, of shape (N, d, d) -- one matrix per point -- or
+        (d, d) -- shared by all points -- where d is the number of components
+        of ``representation_type``. The covariance is in the units of the
+        components, squared. If callable, it takes the coordinates ("c") and
+        returns the covariance.
+
+        The Cholesky factors of an array are cached, so the same array may be
+        reused across calls and iterations without being refactored. It
+        should not be modified in place.
+
+    frame: frame-like or None (optional, keyword-only)
+       The frame of the observational errors, ie the frame in which
+        the error function should be applied along each dimension.
+    representation_type: |Representation| or None (optional, keyword-only)
+        The coordinate representation in which to resample along each
+        dimension.
+
+    """
+
+    def __init__(
+        self,
+        c_err: T.Optional[CERR_Type] = None,
+        *,
+        representation_type: TH.OptRepresentationLikeType,
+        frame: TH.OptFrameLikeType = None,
+        **params,
+    ) -> None:
+        super().__init__(
+            c_err=c_err,
+            frame=frame,
+            representation_type=representation_type,
+            **params,
+        )
+        self._factors = (None, None)  # (covariance, Cholesky factors)
+
+    # /def
+
+    #################################################################
+    # Sampling
+
+    def _draw(
+        self,
+        loc: np.ndarray,
+        scale: np.ndarray,
+        *,
+        random: RandomLike,
+        **params,
+    ) -> np.ndarray:
+        """Draw correlated Gaussian variates about `loc`.
+
+        Parameters
+        ----------
+        loc : (..., d) ndarray
+        scale : (N, d, d) or (d, d) ndarray
+            The Cholesky factors. If (N, d, d), ``loc`` must hold a whole
+            number of blocks of N points, eg. (iterations * N, d), and each
+            block is drawn with the same factors.
+        random : |RandomState| or `~numpy.random.Generator` (keyword-only)
+        **params
+            Must be empty.
+
+        Returns
+        -------
+        ndarray
+            The shape of `loc`.
+
+        Raises
+        ------
+        TypeError
+            If there are parameters.
+
+        """
+        if params:
+            raise TypeError(f"unexpected parameters {tuple(params)}.")
+
+        if isinstance(random, np.random.Generator):
+            z = np.empty(loc.shape)
+            random.standard_normal(out=z)
+        else:  # RandomState can't draw into an array
+            z = random.standard_normal(loc.shape)
+
+        # blocks of points, broadcast against the factors
+        z = z.reshape((-1,) + scale.shape[:-1])
+        noise = np.matmul(scale, z[..., None])[..., 0]
+
+        return loc + noise.reshape(loc.shape)
+
+    # /def
+
+    # ===============================================================
+    # Utils
+
+    def _cholesky(self, cov: np.ndarray, n: int, d: int) -> np.ndarray:
+        """The Cholesky factors of the covariance, cached.
+
+        Parameters
+        ----------
+        cov : (N, d, d) or (d, d) ndarray
+        n : int
+            The number of points. Must be a multiple of N.
+        d : int
+            The number of components.
+
+        Returns
+        -------
+        (N, d, d) or (d, d) ndarray
+            Lower-triangular.
+
+        Raises
+        ------
+        ValueError
+            - If the shape of `cov` doesn't match `n` and `d`.
+            - If the covariances are not positive-definite.
+
+        """
+        if (
+            cov.ndim not in (2, 3)
+            or cov.shape[-2:] != (d, d)
+            or (cov.ndim == 3 and (len(cov) == 0 or n % len(cov)))
+        ):
+            raise ValueError(
+                f"the covariance must have shape (N, {d}, {d}) or "
+                f"({d}, {d}), not {cov.shape}.",
+            )
+        elif cov is self._factors[0]:
+            return self._factors[1]
+
+        try:
+            factors = np.linalg.cholesky(cov)
+        except np.linalg.LinAlgError:
+            raise ValueError("the covariance must be positive-definite.")
+
+        self._factors = (cov, factors)
+
+        return factors
+
+    # /def
+
+    def _covariance(
+        self,
+        c_err: T.Optional[CERR_Type],
+        c: T.Union[TH.CoordinateType, SampleArrays],
+    ) -> np.ndarray:
+        """The covariance from ``c_err``, given ``c``.
+
+        Parameters
+        ----------
+        c_err : ndarray or callable or None
+        c : |CoordinateFrame| or |SkyCoord| or `~discO.core.sample.SampleArrays`
+
+        Returns
+        -------
+        ndarray
+
+        Raises
+        ------
+        TypeError
+            If `c_err` is not an array or callable.
+
+        """
+        if c_err is None:
+            c_err = self.c_err
+
+        if callable(c_err):
+            c_err = c_err(c)
+
+        if not isinstance(c_err, np.ndarray) or hasattr(c_err, "unit"):
+            raise TypeError(
+                "`c_err` must be a covariance array or a callable "
+                f"returning one, not {type(c_err)}.",
+            )
+
+        return c_err
+
+    # /def
+
+    def _distribute_c_err(self, c_err, iterations: int):
+        # a covariance array is shared by all the iterations
+        if isinstance(c_err, np.ndarray) and not hasattr(c_err, "unit"):
+            return [c_err] * iterations
+
+        return super()._distribute_c_err(c_err, iterations)
+
+    # /def
+
+    def _parse_c_err(
+        self,
+        c_err: T.Optional[CERR_Type],
+        c: TH.CoordinateType,
+    ) -> np.ndarray:
+        """The Cholesky factors of the covariance ``c_err``, given ``c``.
+
+        Parameters
+        ----------
+        c_err : ndarray or callable or None (optional)
+        c : |CoordinateFrame| or |SkyCoord|
+
+        Returns
+        -------
+        :class:`~numpy.ndarray`
+
+        """
+        cov = self._covariance(c_err, c)
+        return self._cholesky(cov, len(c), len(c.data.components))
+
+    # /def
+
+    def _parse_c_err_batch(
+        self,
+        c_err: CERR_Type,
+        cc: TH.CoordinateType,
+        iterations: int,
+    ) -> np.ndarray:
+        """The Cholesky factors for all the columns of a sample, end to end.
+
+        An array is factored once and broadcast over the columns. A callable
+        is evaluated on each column.
+
+        Parameters
+        ----------
+        c_err : ndarray or callable
+        cc : |CoordinateFrame|
+            The columns of the sample, end to end.
+        iterations : int
+            The number of columns.
+
+        Returns
+        -------
+        :class:`~numpy.ndarray`
+
+        """
+        if not callable(c_err):
+            return self._parse_c_err(c_err, cc)
+
+        N = len(cc) // iterations
+        d = len(cc.data.components)
+        return np.concatenate(
+            [
+                np.broadcast_to(
+                    self._parse_c_err(c_err, cc[slice(i * N, (i + 1) * N)]),
+                    (N, d, d),
+                )
+                for i in range(iterations)
+            ],
+        )
+
+    # /def
+
+    def _arrays_scale(
+        self,
+        c: SampleArrays,
+        c_err: T.Optional[CERR_Type],
+    ) -> T.Optional[np.ndarray]:
+        """The Cholesky factors on `~discO.core.sample.SampleArrays`.
+
+        Parameters
+        ----------
+        c : `~discO.core.sample.SampleArrays`
+        c_err : ndarray or callable or None
+
+        Returns
+        -------
+        ndarray or None
+            None if `c` can't be resampled directly, because the errors are
+            not Cartesian in the frame of `c`.
+
+        """
+        if self.representation_type is coord.CartesianRepresentation and (
+            c.frame is None or self.frame.is_equivalent_frame(c.frame)
+        ):
+            *_, n, d = c.positions.shape
+            return self._cholesky(self._covariance(c_err, c), n, d)
+
+        return None
+
+    # /def
+
+
+# /class
+
+
+# -------------------------------------------------------------------
+
+
+class ObservableMeasurementError(MeasurementErrorSampler, method="observable"):
+    """Draw a realization given Gaussian errors on the observables.
+
+    The sample is mapped to the observables of ``frame`` -- the sky position,
+    parallax, proper motions, and radial velocity, as seen from its origin --
+    perturbed there, and mapped back. Both mappings are closed-form array
+    operations on the Cartesian positions and velocities, so the sample
+    need not be built into coordinates, and the whole (N, iterations)
+    sample is perturbed in one draw.
+
+    Parameters
+    ----------
+    c_err : mapping or callable or None (optional, keyword-only)
+        The errors on the observables, by name (see ``observables``).
+        Observables without an error are not perturbed. The errors may be
+        scalars or arrays of shape (N, ), as a |Quantity|, or a number in
+        ``units``. A |Quantity| with units of percent is a fractional error.
+        If callable, it takes the sample and returns the mapping.
+
+    frame: frame-like (optional, keyword-only)
+        The frame of the observer, at its origin. Default is ICRS.
+    representation_type: |Representation| (optional, keyword-only)
+        The representation type of the realization coordinates.
+        Default is Cartesian.
+
+    Raises
+    ------
+    ValueError
+        If `frame` is None.
+
+    Notes
+    -----
+    Perturbed declinations beyond the poles are continuous in the mapping
+    back, so need no branch cut. Negative parallaxes, which have no
+    distance, are folded to positive.
+
+    """
+
+    observables: T.Tuple[str, ...] = (
+        "ra",
+        "dec",
+        "parallax",
+        "pm_ra_cosdec",
+        "pm_dec",
+        "radial_velocity",
+    )
+    units = MappingProxyType(
+        dict(
+            ra=u.deg,
+            dec=u.deg,
+            parallax=u.mas,
+            pm_ra_cosdec=u.mas / u.yr,
+            pm_dec=u.mas / u.yr,
+            radial_velocity=u.km / u.s,
+        ),
+    )
+    # the units of the observables in the mappings
+    _units = MappingProxyType(dict(units, ra=u.rad, dec=u.rad))
+
+    def __init__(
+        self,
+        c_err: T.Optional[CERR_Type] = None,
+        *,
+        frame: TH.FrameLikeType = "icrs",
+        representation_type: TH.RepresentationLikeType = "cartesian",
+        **kwargs,
+    ) -> None:
+        if frame is None:
+            raise ValueError("the observables need a `frame`.")
+
+        super().__init__(
+            c_err=c_err,
+            frame=frame,
+            representation_type=representation_type,
+            **kwargs,
+        )
+
+    # /def
+
+    #################################################################
+    # Sampling
+
+    def __call__(
+        self,
+        c: T.Union[TH.CoordinateType, SampleArrays],
+        c_err: T.Optional[CERR_Type] = None,
+        *,
+        random: T.Optional[RandomLike] = None,
+        **kwargs,
+    ) -> T.Union[TH.SkyCoordType, SampleArrays]:
+        """Draw a realization given the errors on the observables.
+
+        Parameters
+        ----------
+        c : |SkyCoord| or |CoordinateFrame| or `~discO.core.sample.SampleArrays`
+            Of shape (N, ) or (N, iterations).
+        c_err : mapping or callable or None (optional)
+            The errors. If None (default), ``c_err``.
+        **kwargs
+            Ignored.
+
+        Returns
+        -------
+        |SkyCoord| or `~discO.core.sample.SampleArrays`
+            The type and shape of `c`, in ``frame``.
+
+        Other Parameters
+        ----------------
+        random : `~numpy.random.RandomState` or int (optional, keyword-only)
+            The random number generator or generator seed.
+
+        Raises
+        ------
+        ValueError
+            If there are no errors.
+
+        """
+        random = resolve_random(random)
+        c_err = self.c_err if c_err is None else c_err
+        if c_err is None:
+            raise ValueError("there are no errors.")
+        elif callable(c_err):
+            c_err = c_err(c)
+
+        if isinstance(c, SampleArrays):
+            arrs = c.transform_to(self.frame)
+        else:
+            arrs = SampleArrays.from_coord(
+                transform_to(c, self.frame),
+                mass=getattr(c, "mass", None),
+            )
+
+        # the columns, end to end
+        if len(arrs.shape) == 2:
+            arrs = arrs._replace(
+                positions=np.swapaxes(arrs.positions, 0, 1),
+                velocities=(
+                    None
+                    if arrs.velocities is None
+                    else np.swapaxes(arrs.velocities, 0, 1)
+                ),
+            )
+
+        obs = self._to_observables(arrs.positions, arrs.velocities)
+        obs = self._perturb(obs, c_err, random=random)
+        positions, velocities = self._from_observables(obs)
+
+        if len(arrs.shape) == 2:
+            positions = np.swapaxes(positions, 0, 1)
+            if velocities is not None:
+                velocities = np.swapaxes(velocities, 0, 1)
+
+        new = arrs._replace(positions=positions, velocities=velocities)
+        if isinstance(c, SampleArrays):
+            return new
+
+        new_sc = new.to_coord(self.representation_type)
+        new_sc.mass = getattr(c, "mass", None)
+        new_sc.potential = getattr(c, "potential", None)
+
+        return new_sc
+
+    # /def
+
+    def _run_batch(
+        self,
+        c: T.Union[TH.CoordinateType, SampleArrays],
+        c_err: T.Optional[CERR_Type] = None,
+        *,
+        random: T.Optional[RandomLike] = None,
+        # extra
+        progress: bool = False,
+        **kwargs,
+    ) -> T.Union[TH.SkyCoordType, SampleArrays]:
+        """Draw a realization given the errors, vectorized.
+
+        A (Nsamples, Niter) sample is perturbed in one draw, in the order of
+        ``_run_iter``, so the realization is the same. Callable errors are
+        evaluated on each column, as in ``_run_iter``.
+
+        Parameters
+        ----------
+        c : |SkyCoord| or |CoordinateFrame| or `~discO.core.sample.SampleArrays`
+        c_err : mapping or callable or None (optional)
+        **kwargs
+            Ignored.
+
+        Returns
+        -------
+        |SkyCoord| or `~discO.core.sample.SampleArrays`
+
+        Other Parameters
+        ----------------
+        random : `~numpy.random.RandomState` or int (optional, keyword-only)
+            The random number generator or generator seed.
+        progress : bool (optional, keyword-only)
+            Whether to show a progress bar, if iterating.
+
+        """
+        c_err = self.c_err if c_err is None else c_err
+        if len(c.shape) == 1 or callable(c_err):
+            return super()._run_batch(
+                c,
+                c_err=c_err,
+                random=random,
+                progress=progress,
+                **kwargs,
+            )
+
+        return self(c, c_err=c_err, random=random, **kwargs)
+
+    # /def
+
+    def _perturb(
+        self,
+        obs: T.Dict[str, np.ndarray],
+        c_err: T.Mapping,
+        *,
+        random: RandomLike,
+    ) -> T.Dict[str, np.ndarray]:
+        """Perturb the observables, in one draw.
+
+        Parameters
+        ----------
+        obs : dict
+            The observables, in ``_units``, of shape (..., N).
+        c_err : mapping
+        random : |RandomState| or `~numpy.random.Generator` (keyword-only)
+
+        Returns
+        -------
+        dict
+
+        """
+        scales = self._parse_c_err(c_err, obs)
+        if not scales:
+            return obs
+
+        # the draws for each column, in turn, so columns can be drawn alone
+        *shape, N = obs["parallax"].shape
+        shape = (*shape, len(scales), N)
+        if isinstance(random, np.random.Generator):
+            z = np.empty(shape)
+            random.standard_normal(out=z)
+        else:  # RandomState can't draw into an array
+            z = random.standard_normal(shape)
+
+        obs = dict(obs)
+        for i, (name, scale) in enumerate(scales.items()):
+            obs[name] = obs[name] + scale * z[..., i, :]
+
+        return obs
+
+    # /def
+
+    # ===============================================================
+    # Utils
+
+    def _parse_c_err(
+        self,
+        c_err: T.Mapping,
+        obs: T.Dict[str, np.ndarray],
+    ) -> T.Dict[str, T.Union[float, np.ndarray]]:
+        """The scales of the errors on the observables.
+
+        Parameters
+        ----------
+        c_err : mapping
+        obs : dict
+            The observables, in ``_units``.
+
+        Returns
+        -------
+        dict
+            In ``_units`` and the order of ``observables``. Observables
+            without an error, or not in `obs` (the velocities of a sample
+            without them), are left out.
+
+        Raises
+        ------
+        TypeError
+            If `c_err` is not a mapping.
+        ValueError
+            If a key of `c_err` is not an observable.
+
+        """
+        if not isinstance(c_err, Mapping):
+            raise TypeError(
+                f"`c_err` must be a mapping of observables, not {c_err}.",
+            )
+        elif not set(c_err).issubset(self.observables):
+            raise ValueError(
+                f"`c_err` keys {set(c_err) - set(self.observables)} are "
+                f"not in {self.observables}.",
+            )
+
+        scales = dict()
+        for name in self.observables:
+            if name not in c_err or name not in obs:
+                continue
+
+            err = c_err[name]
+            unit = getattr(err, "unit", None)
+            if unit == u.percent:
+                scale = np.abs(obs[name]) * err.to_value(u.one)
+            elif unit is not None:
+                scale = err.to_value(self._units[name])
+            else:
+                scale = err * self.units[name].to(self._units[name])
+
+            scales[name] = scale
+
+        return scales
+
+    # /def
+
+    @staticmethod
+    def _to_observables(
+        positions: np.ndarray,
+        velocities: T.Optional[np.ndarray],
+    ) -> T.Dict[str, np.ndarray]:
+        """Map Cartesian positions and velocities to observables.
+
+        Parameters
+        ----------
+        positions : (..., 3) ndarray
+            In kpc.
+        velocities : (..., 3) ndarray or None
+            In km / s.
+
+        Returns
+        -------
+        dict
+            In ``_units``. Without the velocity observables if
+            `velocities` is None.
+
+        """
+        x, y, z = np.ascontiguousarray(np.moveaxis(positions, -1, 0))
+        R = np.hypot(x, y)
+        d = np.hypot(R, z)
+
+        obs = dict(
+            ra=np.arctan2(y, x),
+            dec=np.arctan2(z, R),
+            parallax=1 / d,
+        )
+
+        if velocities is not None:
+            # from ratios, not trig, as with ``arctan2`` on the axes
+            cos_ra = np.divide(x, R, out=np.ones_like(R), where=R > 0)
+            sin_ra = np.divide(y, R, out=np.zeros_like(R), where=R > 0)
+            cos_dec = np.divide(R, d, out=np.ones_like(d), where=d > 0)
+            sin_dec = np.divide(z, d, out=np.zeros_like(d), where=d > 0)
+            vx, vy, vz = np.ascontiguousarray(np.moveaxis(velocities, -1, 0))
+
+            v_R = cos_ra * vx + sin_ra * vy  # cylindrical radial
+            obs["pm_ra_cosdec"] = (cos_ra * vy - sin_ra * vx) / (
+                _PM_TO_VELOCITY * d
+            )
+            obs["pm_dec"] = (cos_dec * vz - sin_dec * v_R) / (
+                _PM_TO_VELOCITY * d
+            )
+            obs["radial_velocity"] = cos_dec * v_R + sin_dec * vz
+
+        return obs
+
+    # /def
+
+    @staticmethod
+    def _from_observables(
+        obs: T.Dict[str, np.ndarray],
+    ) -> T.Tuple[np.ndarray, T.Optional[np.ndarray]]:
+        """Map observables to Cartesian positions and velocities.
+
+        Parameters
+        ----------
+        obs : dict
+            In ``_units``.
+
+        Returns
+        -------
+        positions : (..., 3) ndarray
+            In kpc.
+        velocities : (..., 3) ndarray or None
+            In km / s. None if `obs` has no velocity observables.
+
+        """
+        d = 1 / np.abs(obs["parallax"])
+        cos_ra, sin_ra = np.cos(obs["ra"]), np.sin(obs["ra"])
+        cos_dec, sin_dec = np.cos(obs["dec"]), np.sin(obs["dec"])
+
+        positions = np.stack(
+            (d * cos_dec * cos_ra, d * cos_dec * sin_ra, d * sin_dec),
+            axis=-1,
+        )
+
+        if "radial_velocity" not in obs:
+            return positions, None
+
+        v_ra = _PM_TO_VELOCITY * d * obs["pm_ra_cosdec"]
+        v_dec = _PM_TO_VELOCITY * d * obs["pm_dec"]
+        v_R = cos_dec * obs["radial_velocity"] - sin_dec * v_dec
+
+        velocities = np.stack(
+            (
+                cos_ra * v_R - sin_ra * v_ra,
+                sin_ra * v_R + cos_ra * v_ra,
+                sin_dec * obs["radial_velocity"] + cos_dec * v_dec,
+            ),
+            axis=-1,
+        )
+
+        return positions, velocities
+
+    # /def
+
+
+# /class
 
 ######################################################################
 # Utility Functions
@@ -6,6 +6,7 @@
 __all__ = [
     "Pipeline",
     "PipelineResult",
+    "ColumnarPipelineResult",
 ]
 
 
@@ -13,11 +14,18 @@ __all__ = [
 # IMPORTS
 
 # BUILT-IN
+import os
+import pickle
+import queue
+import threading
 import typing as T
 import weakref
+from concurrent.futures import Executor
+from itertools import repeat
 
 # THIRD PARTY
 import astropy.coordinates as coord
+import astropy.units as u
 import numpy as np
 import typing_extensions as TE
 
@@ -28,7 +36,22 @@ from .measurement import CERR_Type, MeasurementErrorSampler
 from .residual import ResidualMethod
 from .sample import PotentialSampler, RandomLike
 from .wrapper import PotentialWrapper
+from discO.utils.cache import hash_key
+from discO.utils.parallel import map_context
 from discO.utils.pbar import get_progress_bar
+from discO.utils.random import (
+    resolve_random,
+    spawn_generators,
+    spawn_random_states,
+)
+from discO.utils.vectorfield import BaseVectorField, CartesianVectorField
+
+##############################################################################
+# PARAMETERS
+
+_STREAM_STAGES: T.Tuple[str, ...] = ("sample", "measure", "fit", "residual")
+_STREAM_STOP = object()  # end-of-stream sentinel
+_STREAM_POLL: float = 0.1  # seconds between checks for a stopped stream
 
 ##############################################################################
 # CODE
@@ -210,18 +233,45 @@ class Pipeline:
         # We will make a pipeline result and then work thru it.
         result = PipelineResult(self)
 
-        # TODO! resolve_randomstate(random)
         # we need to resolve the random state now, so that an `int` isn't
         # set as the same random state each time
-        random = (
-            np.random.RandomState(random)
-            if not isinstance(random, np.random.RandomState)
-            else random
-        )
+        random = resolve_random(random)
+        sample_random, measure_random = _split_random(random)
 
-        # ----------
         # 1) sample
+        self._sample(
+            result,
+            n_or_sample,
+            total_mass=total_mass,
+            random=sample_random,
+            **kwargs,
+        )
+        # 2) measure
+        self._measure(result, c_err=c_err, random=measure_random, **kwargs)
+        # 3) fit
+        self._fit(result, **kwargs)
+        # 4) residual & 5) statistic
+        self._residual(result, observable=observable, **kwargs)
+
+        self._result: PipelineResult = result  # link to most recent result
+        return result[0]
+
+    # /defs
+
+    # -----------------------------------------------------------------
+    # Stages
+    # Each fills in its field(s) of a (1,) :class:`PipelineResult`.
 
+    def _sample(
+        self,
+        result: "PipelineResult",
+        n_or_sample: T.Union[int, TH.SkyCoordType],
+        *,
+        total_mass: TH.QuantityType = None,
+        random: T.Optional[RandomLike] = None,
+        **kwargs,
+    ) -> None:
+        """Sample the potential, or use the given sample."""
         if isinstance(n_or_sample, int):
             sample: TH.SkyCoordType = self.sampler(
                 n_or_sample,
@@ -236,57 +286,72 @@ class Pipeline:
 
         result["sample"][0] = sample
 
-        # ----------
-        # 2) measure
-        # optionally skip this step if c_err is False
+    # /def
 
+    def _measure(
+        self,
+        result: "PipelineResult",
+        *,
+        c_err: T.Union[CERR_Type, None, TE.Literal[False]] = None,
+        random: T.Optional[RandomLike] = None,
+        **kwargs,
+    ) -> None:
+        """Re-sample, given observational errors.
+
+        Optionally skip this step if `c_err` is False.
+
+        """
         if self.measurer is not None and c_err is not False:
 
-            sample: TH.SkyCoordType = self.measurer(
-                sample,
+            result["measured"][0] = self.measurer(
+                result["sample"][0],
                 random=random,
                 c_err=c_err,
                 **kwargs,
             )
-            result["measured"][0] = sample
 
-        # ----------
-        # 3) fit
-        # we force the fit to be in the same frame & representation type
-        # as the samples.
+    # /def
 
-        fit_pot: T.Any = self.fitter(sample, **kwargs)
-        result["fit"][0] = fit_pot
+    def _fit(self, result: "PipelineResult", **kwargs) -> None:
+        """Fit the (measured) sample.
 
-        # ----------
-        # 4) residual
-        # only if 3)
+        We force the fit to be in the same frame & representation type
+        as the samples.
 
+        """
+        sample: TH.SkyCoordType = result["measured"][0]
+        if sample is None:  # not measured
+            sample = result["sample"][0]
+
+        result["fit"][0] = self.fitter(sample, **kwargs)
+
+    # /def
+
+    def _residual(
+        self,
+        result: "PipelineResult",
+        *,
+        observable: T.Optional[str] = None,
+        **kwargs,
+    ) -> None:
+        """Residual of the fit and its statistic, if either is set."""
         if self.residualer is not None:
 
-            resid: T.Any = self.residualer(
-                fit_pot,
+            result["residual"][0] = self.residualer(
+                result["fit"][0],
                 original_potential=self.potential,
                 observable=observable,
                 **kwargs,
             )
-            result["residual"][0] = resid
-
-        # ----------
-        # 5) statistic
-        # only if 4)
 
         if self.statisticer is not None:
 
-            stat: T.Any = self.statisticer(resid, **kwargs)
-            result["statistic"][0] = stat
-
-        # ----------
-
-        self._result: PipelineResult = result  # link to most recent result
-        return result[0]
+            result["statistic"][0] = self.statisticer(
+                result["residual"][0],
+                **kwargs,
+            )
 
-    # /defs
+    # /def
 
     # -----------------------------------------------------------------
 
@@ -302,6 +367,13 @@ class Pipeline:
         # extra
         random: T.Optional[RandomLike] = None,
         progress: bool = True,
+        n_jobs: T.Optional[int] = None,
+        executor: T.Optional[Executor] = None,
+        stream: bool = False,
+        queue_size: T.Union[int, T.Mapping[str, int]] = 1,
+        checkpoint: T.Union[str, os.PathLike, None] = None,
+        start: T.Optional[int] = None,
+        stop: T.Optional[int] = None,
         **kwargs,
     ) -> object:
         """Run pipeline, yielding :class:`PipelineResult` over ``iterations``.
@@ -319,18 +391,67 @@ class Pipeline:
             Number of iterations. Must be > 0.
             Only used if `n_or_sample` is int.
 
-        random : int or |RandomState| or None (optional, keyword-only)
-            Random state or seed.
+        random : int or |RandomState| or Generator or None (optional, keyword-only)
+            Random state or seed. A `~numpy.random.Generator` gives the
+            sampler and the measurer independent child streams.
 
         original_pot : object or None (optional, keyword-only)
         observable : str or None (optional, keyword-only)
 
+        n_jobs : int or None (optional, keyword-only)
+            Number of worker processes over which to distribute the
+            iterations. None (default) runs serially, sharing `random`
+            between iterations. Otherwise each iteration gets its own random
+            state, spawned from `random`, so the results do not depend on
+            `n_jobs`. 1 runs serially, -1 uses all available cores.
+        executor : Executor or None (optional, keyword-only)
+            Executor over which to distribute the iterations.
+            Overrides `n_jobs`. The pipeline must be picklable for a
+            process-based executor.
+
+        stream : bool (optional, keyword-only)
+            Whether to run the sample, measure, fit and residual stages
+            concurrently, each in its own thread, handing iterations forward
+            through bounded queues. Sampling iteration i+1 then overlaps
+            fitting iteration i. Like with `n_jobs`, each iteration gets its
+            own random state. Can't be combined with `n_jobs` or `executor`.
+        queue_size : int or Mapping (optional, keyword-only)
+            The maximum number of iterations waiting after each stage, when
+            streaming. A Mapping is keyed by stage -- "sample", "measure",
+            "fit", "residual" -- with missing stages defaulting to 1.
+        checkpoint : path-like or None (optional, keyword-only)
+            File to which the arrays of each completed iteration are
+            appended, see :class:`ColumnarPipelineResult`. If it exists, the
+            run resumes: finished iterations are loaded, not re-run, and the
+            random state is restored from the checkpoint, ignoring `random`.
+            Like with `n_jobs`, each iteration gets its own random state, so
+            a resumed run is the same as an uninterrupted one. The
+            parameters that change the results, e.g. `c_err`, must be the
+            same.
+        start, stop : int or None (optional, keyword-only)
+            Run only iterations ``start`` to ``stop`` of the `iterations`,
+            e.g. to shard a run over hosts. Like with `n_jobs`, each
+            iteration gets its own random state, keyed by its index, so the
+            iterations are the same as in the full run with the same seed.
+
         Yields
         ------
         :class:`PipelineResult`
-            For each of ``iterations``
+            For each of ``iterations``, in order.
 
         """
+        # the parameters that change the results, for a checkpoint. The
+        # digest is None, and so not checked, if they can't be pickled.
+        n = getattr(n_or_sample, "shape", (n_or_sample,))[0]
+        sample = n_or_sample
+        if isinstance(n_or_sample, coord.SkyCoord):  # not its caches
+            sample = (
+                n_or_sample.frame.name,
+                n_or_sample.cartesian.get_xyz(),
+                getattr(n_or_sample, "mass", None),
+            )
+        digest = hash_key(sample, c_err, observable, kwargs)
+
         # reshape n_or_sample
         if isinstance(n_or_sample, int):
             n_or_sample = [n_or_sample] * iterations
@@ -348,25 +469,264 @@ class Pipeline:
 
         # iterate over number of iterations
         # for _ in tqdm(range(niter), desc="Running Pipeline...", total=niter):
-        with get_progress_bar(progress, iterations) as pbar:
+        if (
+            n_jobs is None
+            and executor is None
+            and not stream
+            and checkpoint is None
+            and start is None
+            and stop is None
+        ):
+
+            with get_progress_bar(progress, iterations) as pbar:
+
+                for arg in n_or_sample:
+                    pbar.update(1)
+
+                    yield self(
+                        arg,
+                        random=random,
+                        # observer
+                        c_err=c_err,
+                        # residual
+                        observable=observable,
+                        **kwargs,
+                    )
+
+            # /with
+
+            return
+
+        elif stream and (n_jobs is not None or executor is not None):
+            raise ValueError("can't both stream and distribute iterations.")
+
+        # Each iteration gets an independent random state, so the results
+        # don't depend on the number of workers, or the order of execution.
+        n_or_sample = list(n_or_sample)
+        kwargs = dict(c_err=c_err, observable=observable, **kwargs)
+
+        # only a slice of the iterations, e.g. a shard of a larger run.
+        shard = range(len(n_or_sample))[start:stop]
+        first = shard.start
+        iterations = len(n_or_sample)
+        n_or_sample = n_or_sample[start:stop]
+
+        # a checkpoint keeps the initial random state, so a resumed run
+        # re-spawns the same random states and skips finished iterations.
+        # The iterations are stored as rows of a columnar result.
+        done = 0
+        if checkpoint is not None:
+            run = dict(
+                n=n,
+                iterations=iterations,
+                start=shard.start,
+                stop=shard.stop,
+                parameters=digest,
+            )
+            store = _PipelineCheckpoint(checkpoint, random, run=run)
+            random = store.random
+            columns = ColumnarPipelineResult(self, len(n_or_sample))
+            done = store.restore(columns)
+
+        spawn = (
+            spawn_generators
+            if isinstance(random, np.random.Generator)
+            else spawn_random_states
+        )
+        # keyed by the iteration index, so the same as in the full run
+        randoms = spawn(random, len(n_or_sample), start=first)
+        todo = slice(done, None)
+
+        if stream:
+            results = self._run_stream(
+                n_or_sample[todo],
+                randoms[todo],
+                queue_size=queue_size,
+                **kwargs,
+            )
+        else:
+            results = self._run_map(
+                n_or_sample[todo],
+                randoms[todo],
+                n_jobs=n_jobs,
+                executor=executor,
+                **kwargs,
+            )
+
+        with get_progress_bar(progress, len(n_or_sample)) as pbar:
 
-            for arg in n_or_sample:
+            for i in range(done):
                 pbar.update(1)
 
-                yield self(
-                    arg,
-                    random=random,
-                    # observer
-                    c_err=c_err,
-                    # residual
-                    observable=observable,
-                    **kwargs,
-                )
+                fields = [columns.get(field, i) for field in columns._fields]
+                self._result = PipelineResult(self, *fields)
+                yield self._result[0]
+
+            for i, result in enumerate(results, start=done):  # in order
+                pbar.update(1)
+
+                if checkpoint is not None:
+                    columns[i] = result[0]
+                    store.append(columns, i)
+
+                self._result = result  # link to most recent result
+                yield result[0]
 
         # /with
 
     # /def
 
+    def _run_map(
+        self,
+        n_or_sample: T.Sequence[T.Union[int, TH.SkyCoordType]],
+        randoms: T.Sequence[np.random.RandomState],
+        *,
+        n_jobs: T.Optional[int] = None,
+        executor: T.Optional[Executor] = None,
+        **kwargs,
+    ) -> T.Iterator["PipelineResult"]:
+        """Distribute the iterations, yielding results in order.
+
+        Parameters
+        ----------
+        n_or_sample : Sequence
+            Number of sample points, or the sample, for each iteration.
+        randoms : Sequence[|RandomState|]
+            Random state for each iteration.
+        n_jobs : int or None (optional, keyword-only)
+            Number of worker processes. None or 1 runs serially.
+        executor : Executor or None (optional, keyword-only)
+            Overrides `n_jobs`.
+
+        Yields
+        ------
+        (1,) :class:`PipelineResult`
+
+        """
+        with map_context(n_jobs=n_jobs, executor=executor) as map_func:
+            results = map_func(
+                _run_iteration,
+                repeat(self),
+                n_or_sample,
+                randoms,
+                repeat(kwargs),
+            )
+
+            for fields in results:
+                yield PipelineResult(self, *fields)
+
+    # /def
+
+    def _run_stream(
+        self,
+        n_or_sample: T.Sequence[T.Union[int, TH.SkyCoordType]],
+        randoms: T.Sequence[np.random.RandomState],
+        *,
+        total_mass: TH.QuantityType = None,
+        c_err: T.Union[CERR_Type, None, TE.Literal[False]] = None,
+        observable: T.Optional[str] = None,
+        queue_size: T.Union[int, T.Mapping[str, int]] = 1,
+        **kwargs,
+    ) -> T.Iterator["PipelineResult"]:
+        """Run the stages concurrently, yielding results in order.
+
+        Each stage runs in its own thread and hands each iteration to the
+        next stage through a bounded queue, so at most ``queue_size``
+        iterations wait between stages. Errors are handed forward and raised
+        here. Closing the generator stops all the stages.
+
+        Parameters
+        ----------
+        n_or_sample : Sequence
+            Number of sample points, or the sample, for each iteration.
+        randoms : Sequence[|RandomState|]
+            Random state for each iteration.
+        queue_size : int or Mapping (optional, keyword-only)
+            The maximum number of iterations waiting after each stage.
+            A Mapping is keyed by stage, with missing stages defaulting to 1.
+
+        Yields
+        ------
+        (1,) :class:`PipelineResult`
+
+        Raises
+        ------
+        ValueError
+            If `queue_size` has unknown stages or sizes < 1.
+
+        """
+        sizes = dict.fromkeys(_STREAM_STAGES, 1)
+        if isinstance(queue_size, int):
+            sizes = dict.fromkeys(_STREAM_STAGES, queue_size)
+        elif not set(queue_size).issubset(_STREAM_STAGES):
+            raise ValueError(f"queue_size stages must be in {_STREAM_STAGES}")
+        else:
+            sizes.update(queue_size)
+
+        if any([size < 1 for size in sizes.values()]):
+            raise ValueError("queue sizes must be >= 1.")
+
+        # the stages. Each takes an item (result, n_or_sample, randoms),
+        # with randoms split between the sampler and measurer, as in
+        # ``__call__``.
+        stages = dict(
+            sample=lambda result, arg, random: self._sample(
+                result,
+                arg,
+                total_mass=total_mass,
+                random=random[0],
+                **kwargs,
+            ),
+            measure=lambda result, arg, random: self._measure(
+                result,
+                c_err=c_err,
+                random=random[1],
+                **kwargs,
+            ),
+            fit=lambda result, arg, random: self._fit(result, **kwargs),
+            residual=lambda result, arg, random: self._residual(
+                result,
+                observable=observable,
+                **kwargs,
+            ),
+        )
+        # skip stages that do nothing
+        if self.measurer is None or c_err is False:
+            stages.pop("measure")
+        if self.residualer is None:
+            stages.pop("residual")
+
+        # chain the stages through bounded queues
+        stop = threading.Event()
+        items = (
+            (PipelineResult(self), arg, _split_random(random))
+            for arg, random in zip(n_or_sample, randoms)
+        )
+        threads = []
+        for name, stage in stages.items():
+            outbox = queue.Queue(maxsize=sizes[name])
+            thread = threading.Thread(
+                target=_stream_stage,
+                args=(stage, items, outbox, stop),
+                name=f"discO-pipeline-{name}",
+                daemon=True,
+            )
+            threads.append(thread)
+            items = _iter_queue(outbox, stop)
+
+        for thread in threads:
+            thread.start()
+
+        try:
+            for result, _, _ in items:
+                yield result
+        finally:  # also on error or when closed early
+            stop.set()
+            for thread in threads:
+                thread.join()
+
+    # /def
+
     # ---------------------------------------------------------------
 
     def _run_batch(
@@ -383,6 +743,14 @@ class Pipeline:
         # residual
         observable: T.Optional[str] = None,
         progress: bool = False,
+        n_jobs: T.Optional[int] = None,
+        executor: T.Optional[Executor] = None,
+        stream: bool = False,
+        queue_size: T.Union[int, T.Mapping[str, int]] = 1,
+        checkpoint: T.Union[str, os.PathLike, None] = None,
+        start: T.Optional[int] = None,
+        stop: T.Optional[int] = None,
+        columnar: bool = False,
         **kwargs,
     ) -> object:
         """Call.
@@ -394,17 +762,42 @@ class Pipeline:
         iterations : int (optional)
             Number of iterations. Must be > 0.
 
-        random : int or |RandomState| or None (optional, keyword-only)
+        random : int or |RandomState| or Generator or None (optional, keyword-only)
             Random state or seed.
             In order that a sequence of samples is different in each element
             we here resolve random seeds into a |RandomState|.
+            A `~numpy.random.Generator` or `~numpy.random.SeedSequence`
+            spawns an independent `~numpy.random.Generator` per iteration.
 
         original_pot : object or None (optional, keyword-only)
         observable : str or None (optional, keyword-only)
 
+        n_jobs : int or None (optional, keyword-only)
+            Number of worker processes over which to distribute the
+            iterations. See ``_run_iter``.
+        executor : Executor or None (optional, keyword-only)
+            Executor over which to distribute the iterations.
+            Overrides `n_jobs`.
+        stream : bool (optional, keyword-only)
+            Whether to overlap the stages of consecutive iterations.
+            See ``_run_iter``.
+        queue_size : int or Mapping (optional, keyword-only)
+            The maximum number of iterations waiting after each stage,
+            when streaming.
+        checkpoint : path-like or None (optional, keyword-only)
+            File to which each completed iteration is appended, and from
+            which to resume. See ``_run_iter``.
+        start, stop : int or None (optional, keyword-only)
+            Run only this slice of the iterations, reproducing that slice of
+            the full run. See ``_run_iter``.
+        columnar : bool (optional, keyword-only)
+            Whether to gather the results in a
+            :class:`ColumnarPipelineResult` of dense arrays, rather than a
+            :class:`PipelineResult` of objects.
+
         Returns
         -------
-        :class:`PipelineResult`
+        :class:`PipelineResult` or :class:`ColumnarPipelineResult`
 
         """
         # reshape n_or_sample
@@ -413,19 +806,23 @@ class Pipeline:
                 iterations = 1
             else:
                 iterations = n_or_sample.shape[1]
+        size = len(range(iterations)[start:stop])
 
         # We will make a pipeline result and then work thru it.
-        results = np.recarray(
-            (iterations,),
-            dtype=[
-                ("sample", coord.SkyCoord),
-                ("measured", coord.SkyCoord),
-                ("fit", PotentialWrapper),
-                ("residual", object),
-                ("statistic", object),
-            ],
-        ).view(PipelineResult)
-        results._parent_ref = weakref.ref(self)
+        if columnar:
+            results = ColumnarPipelineResult(self, size)
+        else:
+            results = np.recarray(
+                (size,),
+                dtype=[
+                    ("sample", coord.SkyCoord),
+                    ("measured", coord.SkyCoord),
+                    ("fit", PotentialWrapper),
+                    ("residual", object),
+                    ("statistic", object),
+                ],
+            ).view(PipelineResult)
+            results._parent_ref = weakref.ref(self)
 
         run_gen = self._run_iter(
             n_or_sample,
@@ -435,6 +832,13 @@ class Pipeline:
             c_err=c_err,
             observable=observable,
             progress=progress,
+            n_jobs=n_jobs,
+            executor=executor,
+            stream=stream,
+            queue_size=queue_size,
+            checkpoint=checkpoint,
+            start=start,
+            stop=stop,
             **kwargs,
         )
 
@@ -462,6 +866,14 @@ class Pipeline:
         # extra
         batch: bool = False,
         progress: bool = True,
+        n_jobs: T.Optional[int] = None,
+        executor: T.Optional[Executor] = None,
+        stream: bool = False,
+        queue_size: T.Union[int, T.Mapping[str, int]] = 1,
+        checkpoint: T.Union[str, os.PathLike, None] = None,
+        start: T.Optional[int] = None,
+        stop: T.Optional[int] = None,
+        columnar: bool = False,
         **kwargs,
     ) -> object:
         """Call.
@@ -473,28 +885,60 @@ class Pipeline:
         iterations : int (optional)
             Number of iterations. Must be > 0.
 
-        random : int or |RandomState| or None (optional, keyword-only)
+        random : int or |RandomState| or Generator or None (optional, keyword-only)
             Random state or seed.
             In order that a sequence of samples is different in each element
             we here resolve random seeds into a |RandomState|.
+            A `~numpy.random.Generator` or `~numpy.random.SeedSequence`
+            spawns an independent `~numpy.random.Generator` per iteration.
 
         original_pot : object or None (optional, keyword-only)
         observable : str or None (optional, keyword-only)
 
+        n_jobs : int or None (optional, keyword-only)
+            Number of worker processes over which to distribute the
+            iterations. See ``_run_iter``.
+        executor : Executor or None (optional, keyword-only)
+            Executor over which to distribute the iterations.
+            Overrides `n_jobs`.
+        stream : bool (optional, keyword-only)
+            Whether to overlap the stages of consecutive iterations.
+            See ``_run_iter``.
+        queue_size : int or Mapping (optional, keyword-only)
+            The maximum number of iterations waiting after each stage,
+            when streaming.
+        checkpoint : path-like or None (optional, keyword-only)
+            File to which each completed iteration is appended, and from
+            which to resume. See ``_run_iter``.
+        start, stop : int or None (optional, keyword-only)
+            Run only this slice of the iterations, reproducing that slice of
+            the full run. See ``_run_iter``.
+        columnar : bool (optional, keyword-only)
+            Whether to gather the results in a
+            :class:`ColumnarPipelineResult` of dense arrays, rather than a
+            :class:`PipelineResult` of objects.
+            Requires `batch`.
+
         Returns
         -------
-        :class:`PipelineResult`
+        :class:`PipelineResult` or :class:`ColumnarPipelineResult`
+
+        Raises
+        ------
+        ValueError
+            If `columnar` is True and `batch` is False.
 
         """
+        if columnar and not batch:
+            raise ValueError("`columnar` requires `batch`.")
+
         run_func = self._run_batch if batch else self._run_iter
+        if batch:
+            kwargs["columnar"] = columnar
 
         # we need to resolve the random state now, so that an `int` isn't
         # set as the same random state each time
-        random = (
-            np.random.RandomState(random)
-            if not isinstance(random, np.random.RandomState)
-            else random
-        )
+        random = resolve_random(random)
 
         return run_func(
             n_or_sample,
@@ -504,6 +948,13 @@ class Pipeline:
             c_err=c_err,
             observable=observable,
             progress=progress,
+            n_jobs=n_jobs,
+            executor=executor,
+            stream=stream,
+            queue_size=queue_size,
+            checkpoint=checkpoint,
+            start=start,
+            stop=stop,
             **kwargs,
         )
 
@@ -537,6 +988,251 @@ class Pipeline:
 # /class
 
 
+# -------------------------------------------------------------------
+
+
+def _split_random(
+    random: T.Union[np.random.RandomState, np.random.Generator],
+) -> tuple:
+    """Random states for the sampler and the measurer.
+
+    A Generator gives the sampler and measurer independent streams.
+    A RandomState is shared, for backward compatibility.
+
+    """
+    if isinstance(random, np.random.Generator):
+        return tuple(spawn_generators(random, 2))
+    return random, random
+
+
+# /def
+
+
+def _run_iteration(
+    pipe: Pipeline,
+    n_or_sample: T.Union[int, TH.SkyCoordType],
+    random: np.random.RandomState,
+    kwargs: T.Mapping,
+) -> tuple:
+    """Run one iteration of a pipeline, e.g. in a worker process.
+
+    Returns
+    -------
+    tuple
+        The fields of the :class:`PipelineResult`.
+
+    """
+    return tuple(pipe(n_or_sample, random=random, **kwargs))
+
+
+# /def
+
+
+def _stream_stage(
+    stage: T.Callable,
+    items: T.Iterable[tuple],
+    outbox: queue.Queue,
+    stop: threading.Event,
+) -> None:
+    """Apply a pipeline stage to each item, handing it forward.
+
+    Errors, including from upstream stages, are handed forward to be
+    raised by the consumer.
+
+    """
+    try:
+        for item in items:
+            stage(*item)
+            _put_queue(outbox, item, stop)
+    except BaseException as error:
+        _put_queue(outbox, error, stop)
+    else:
+        _put_queue(outbox, _STREAM_STOP, stop)
+
+
+# /def
+
+
+def _put_queue(
+    outbox: queue.Queue,
+    item: T.Any,
+    stop: threading.Event,
+) -> None:
+    """Put into a bounded queue, unless the stream is stopped."""
+    while not stop.is_set():
+        try:
+            outbox.put(item, timeout=_STREAM_POLL)
+        except queue.Full:
+            continue
+        else:
+            return
+
+
+# /def
+
+
+def _iter_queue(inbox: queue.Queue, stop: threading.Event) -> T.Iterator:
+    """Iterate over a queue until the end of stream, raising errors."""
+    while not stop.is_set():
+        try:
+            item = inbox.get(timeout=_STREAM_POLL)
+        except queue.Empty:
+            continue
+
+        if item is _STREAM_STOP:
+            return
+        elif isinstance(item, BaseException):
+            raise item
+
+        yield item
+
+
+# /def
+
+# -------------------------------------------------------------------
+
+
+class _PipelineCheckpoint:
+    """Append-only on-disk store of completed pipeline iterations.
+
+    The file is a stream of pickles: a header with the initial random state
+    and the parameters of the run, then the arrays of each completed
+    iteration, in order, as a row of a :class:`ColumnarPipelineResult`.
+    The metadata of the columns, e.g. the frame, is stored once, with the
+    first row that has it. A truncated final record, e.g. from a crash
+    mid-write, is dropped when the file is opened.
+
+    Parameters
+    ----------
+    path : path-like
+        The checkpoint file. Resumed from if it exists.
+    random : int or |RandomState| or Generator or SeedSequence or None
+        Initial random state or seed, if not resuming.
+    run : dict or None (optional, keyword-only)
+        The parameters of the run, e.g. the iterations and the shard.
+        If None (default), not checked against the file.
+
+    Raises
+    ------
+    ValueError
+        - If the file exists, but is not a pipeline checkpoint.
+        - If it is the checkpoint of a run with other parameters.
+
+    """
+
+    def __init__(
+        self,
+        path: T.Union[str, os.PathLike],
+        random: T.Optional[RandomLike] = None,
+        *,
+        run: T.Optional[dict] = None,
+    ) -> None:
+        self.path = os.fspath(path)
+        self.rows: T.List[tuple] = []  # (columns, new metadata)
+        self._meta_keys: T.Set[str] = set()  # stored metadata
+
+        header = None
+        if os.path.exists(self.path):
+            header = self._load()
+
+        if header is None:  # new or empty
+            header = dict(version=2, random=resolve_random(random), run=run)
+
+            with open(self.path, "wb") as file:
+                self._dump(header, file)
+
+        # don't replay the iterations of another run
+        elif run is not None and header.get("run") != run:
+            raise ValueError(
+                f"{self.path} is the checkpoint of another run, with "
+                f"{header.get('run')}, not {run}.",
+            )
+
+        self.run = header.get("run")
+        self.random = header["random"]
+
+    # /def
+
+    def _load(self) -> T.Optional[dict]:
+        """Load the header and rows, dropping a truncated final record.
+
+        Returns
+        -------
+        dict or None
+            The header, or None if the file is empty.
+
+        """
+        if os.path.getsize(self.path) == 0:
+            return None
+
+        header, end = None, 0
+        with open(self.path, "rb") as file:
+            try:
+                header = pickle.load(file)
+                end = file.tell()
+                while True:
+                    self.rows.append(pickle.load(file))
+                    end = file.tell()
+            except (EOFError, pickle.UnpicklingError):
+                pass
+
+        # don't overwrite anything else
+        if not (isinstance(header, dict) and header.get("version") == 2):
+            raise ValueError(f"{self.path} is not a pipeline checkpoint.")
+
+        with open(self.path, "r+b") as file:
+            file.truncate(end)
+
+        for _, meta in self.rows:
+            self._meta_keys.update(meta)
+
+        return header
+
+    # /def
+
+    @staticmethod
+    def _dump(obj: T.Any, file: T.BinaryIO) -> None:
+        pickle.dump(obj, file, protocol=pickle.HIGHEST_PROTOCOL)
+        file.flush()
+        os.fsync(file.fileno())
+
+    # /def
+
+    def append(self, columns: "ColumnarPipelineResult", index: int) -> None:
+        """Append a completed iteration, from its row of `columns`."""
+        meta = {
+            k: v for k, v in columns._meta.items() if k not in self._meta_keys
+        }
+        row = (columns._get_row(index), meta)
+
+        with open(self.path, "ab") as file:
+            self._dump(row, file)
+        self.rows.append(row)
+        self._meta_keys.update(meta)
+
+    # /def
+
+    def restore(self, columns: "ColumnarPipelineResult") -> int:
+        """Set the stored iterations as the first rows of `columns`.
+
+        Returns
+        -------
+        int
+            The number of iterations restored.
+
+        """
+        rows = self.rows[: len(columns)]
+        for i, (row, meta) in enumerate(rows):
+            columns._meta.update(meta)
+            columns._set_row(i, row)
+
+        return len(rows)
+
+    # /def
+
+
+# /class
+
 #####################################################################
 
 
@@ -600,5 +1296,544 @@ class PipelineResult(np.recarray):
     # Plotting
 
 
+# -------------------------------------------------------------------
+
+
+class ColumnarPipelineResult:
+    r"""Columnar :class:`~discO.core.Pipeline` evaluation result.
+
+    Rather than one object per iteration for each field, like
+    :class:`PipelineResult`, the results are stored in dense arrays with a
+    leading iteration axis:
+
+    - samples (and measured samples) as (iterations, N, 6) Cartesian
+      positions & velocities -- (iterations, N, 3) without velocities --
+      and their masses as (iterations, N).
+    - the numeric fit coefficients, if the fits have coefficients. The fits
+      are rebuilt from these and the first fit, so aren't kept. Fits that
+      can't be rebuilt are kept in an object column.
+    - vector-field residuals as (iterations, 3, \*grid shape) Cartesian
+      components, evaluated on the grid of the first iteration.
+    - statistics as (iterations, \*shape).
+
+    |SkyCoord|, fit, and vector-field views of an iteration are built on
+    access, e.g. ``result[i]``, which is a record like that of
+    :class:`PipelineResult`.
+
+    Parameters
+    ----------
+    pipe : :class:`Pipeline`
+    iterations : int
+        The number of iterations.
+
+    """
+
+    _fields: T.Tuple[str, ...] = (
+        "sample",
+        "measured",
+        "fit",
+        "residual",
+        "statistic",
+    )
+
+    def __init__(self, pipe: Pipeline, iterations: int) -> None:
+        self._parent_ref = weakref.ref(pipe)
+        self._iterations = iterations
+
+        # allocated on first assignment, when the shapes are known
+        self._columns: T.Dict[str, T.Any] = dict()
+        self._meta: T.Dict[str, T.Dict[str, T.Any]] = dict()
+
+    # /def
+
+    @classmethod
+    def from_results(
+        cls,
+        results: PipelineResult,
+    ) -> "ColumnarPipelineResult":
+        """Columnar result from a :class:`PipelineResult`.
+
+        Parameters
+        ----------
+        results : :class:`PipelineResult`
+
+        Returns
+        -------
+        :class:`ColumnarPipelineResult`
+
+        """
+        new = cls(results._parent, len(results))
+        for i, result in enumerate(results):
+            new[i] = result
+
+        return new
+
+    # /def
+
+    # -----------------
+    # Properties
+
+    @property
+    def _parent(self):
+        return self._parent_ref()
+
+    # /def
+
+    @property
+    def iterations(self) -> int:
+        """The number of iterations."""
+        return self._iterations
+
+    # /def
+
+    @property
+    def units(self) -> T.Dict[str, T.Tuple[u.UnitBase, ...]]:
+        """Units of the sample (position, velocity) & residual arrays."""
+        return {k: v["units"] for k, v in self._meta.items() if "units" in v}
+
+    # /def
+
+    @property
+    def sample_array(self) -> T.Optional[np.ndarray]:
+        """(iterations, N, 6 or 3) Cartesian sample positions & velocities."""
+        return self._columns.get("sample")
+
+    # /def
+
+    @property
+    def sample_mass(self) -> T.Optional[TH.QuantityType]:
+        """(iterations, N) sample masses."""
+        return self._columns.get("sample_mass")
+
+    # /def
+
+    @property
+    def measured_array(self) -> T.Optional[np.ndarray]:
+        """(iterations, N, 6 or 3) Cartesian measured positions & velocities."""
+        return self._columns.get("measured")
+
+    # /def
+
+    @property
+    def measured_mass(self) -> T.Optional[TH.QuantityType]:
+        """(iterations, N) measured sample masses."""
+        return self._columns.get("measured_mass")
+
+    # /def
+
+    @property
+    def fit(self) -> np.ndarray:
+        """(iterations,) object array of the fit potentials, built on access."""
+        fits = np.full(self._iterations, None, dtype=object)
+        for i in range(self._iterations):
+            fits[i] = self.get("fit", i)
+
+        return fits
+
+    # /def
+
+    @property
+    def coefficients(self) -> T.Dict[str, T.Any]:
+        """Fit coefficients, array-valued ones stacked by iteration."""
+        return {
+            **self._meta.get("coefficients", {}),
+            **self._columns.get("coefficients", {}),
+        }
+
+    # /def
+
+    @property
+    def residual_array(self) -> T.Optional[T.Union[TH.QuantityType, T.Any]]:
+        r"""(iterations, 3, \*grid shape) Cartesian residuals."""
+        return self._columns.get("residual")
+
+    # /def
+
+    @property
+    def statistic(self) -> T.Optional[T.Union[TH.QuantityType, T.Any]]:
+        r"""(iterations, \*shape) statistics."""
+        return self._columns.get("statistic")
+
+    # /def
+
+    #################################################################
+    # Set
+
+    def __setitem__(self, index: int, result: T.Sequence) -> None:
+        """Store an iteration's result, e.g. a :class:`PipelineResult` record.
+
+        Parameters
+        ----------
+        index : int
+            The iteration.
+        result : Sequence
+            The fields, in order: sample, measured, fit, residual, statistic.
+
+        """
+        sample, measured, fit, residual, statistic = result
+
+        self._set_coordinates("sample", index, sample)
+        self._set_coordinates("measured", index, measured)
+        self._set_fit(index, fit)
+        self._set_residual(index, residual)
+        self._set_object("statistic", index, statistic)
+
+    # /def
+
+    def _set_coordinates(
+        self,
+        name: str,
+        index: int,
+        sample: T.Optional[TH.SkyCoordType],
+    ) -> None:
+        if sample is None:
+            return
+
+        data = sample.data
+        if "s" in data.differentials:
+            rep = data.represent_as(
+                coord.CartesianRepresentation,
+                coord.CartesianDifferential,
+            )
+            dif = rep.differentials["s"]
+        else:
+            rep, dif = data.represent_as(coord.CartesianRepresentation), None
+
+        mass = getattr(sample, "mass", None)
+
+        if name not in self._columns:
+            units = (
+                (rep.x.unit,) if dif is None else (rep.x.unit, dif.d_x.unit)
+            )
+            self._meta[name] = dict(
+                frame=sample.frame.replicate_without_data(),
+                representation_type=sample.representation_type,
+                units=units,
+                potential=getattr(sample, "potential", None),
+            )
+
+            shape = (self._iterations, len(sample), 3 * len(units))
+            self._columns[name] = np.full(shape, np.nan)
+            self._columns[name + "_mass"] = u.Quantity(
+                np.full(shape[:2], np.nan),
+                getattr(mass, "unit", u.one),
+            )
+        elif len(sample) != self._columns[name].shape[1]:
+            raise ValueError(
+                f"the {name} of iteration {index} has {len(sample)} points, "
+                f"but the columns have {self._columns[name].shape[1]}.",
+            )
+
+        units = self._meta[name]["units"]
+        column = self._columns[name][index]
+        column[:, :3] = rep.get_xyz(xyz_axis=1).to_value(units[0])
+        if dif is not None:
+            column[:, 3:] = dif.get_d_xyz(xyz_axis=1).to_value(units[1])
+
+        if mass is not None:  # otherwise left as NaN
+            self._columns[name + "_mass"][index] = mass
+
+    # /def
+
+    def _set_fit(self, index: int, fit: T.Optional[PotentialWrapper]) -> None:
+        if fit is None:
+            return
+        elif "coefficients" not in self._columns and not self._set_template(
+            fit,
+        ):
+            self._set_object("fit", index, fit)  # can't be rebuilt
+            return
+
+        coeffs = fit.coefficients()
+        for k, column in self._columns["coefficients"].items():
+            column[index] = coeffs[k]
+
+    # /def
+
+    def _set_template(self, fit: PotentialWrapper) -> bool:
+        """Allocate the coefficient columns, if fits can be rebuilt from them.
+
+        Returns
+        -------
+        bool
+            Whether the fits can be rebuilt from `fit` and their
+            coefficients. False, e.g., if they don't have coefficients.
+
+        """
+        if "fit" in self._columns:  # an earlier fit couldn't be
+            return False
+
+        try:
+            coeffs = fit.coefficients()
+            if coeffs is None:
+                return False
+            fit.with_coefficients(coeffs)
+        except (AttributeError, NotImplementedError):
+            return False
+
+        # split into numeric columns and metadata
+        columns = {
+            k: np.full(
+                (self._iterations,) + np.shape(v),
+                np.nan,
+                dtype=np.result_type(v, float),
+            )
+            for k, v in coeffs.items()
+            if np.asarray(v).dtype.kind in "biufc"  # numeric
+        }
+        if not columns:
+            return False
+
+        self._columns["coefficients"] = columns
+        self._meta["coefficients"] = {
+            k: v for k, v in coeffs.items() if k not in columns
+        }
+        self._meta["fit"] = dict(template=fit)
+
+        return True
+
+    # /def
+
+    def _set_residual(self, index: int, residual: T.Any) -> None:
+        if not isinstance(residual, BaseVectorField):
+            self._set_object("residual", index, residual)
+            return
+
+        cartesian = residual.to_cartesian()
+        values = cartesian.get_vf_xyz(vf_xyz_axis=0)
+
+        if "residual" not in self._columns:
+            self._meta["residual"] = dict(
+                points=cartesian.points,
+                frame=residual.frame,
+                vectorfield_type=residual.__class__,
+                units=(values.unit,),
+            )
+            self._columns["residual"] = u.Quantity(
+                np.full((self._iterations,) + values.shape, np.nan),
+                values.unit,
+            )
+
+        self._columns["residual"][index] = values
+
+    # /def
+
+    def _set_object(self, name: str, index: int, value: T.Any) -> None:
+        """Store as a Quantity, array, or object column, by the first value."""
+        if value is None and name not in self._columns:
+            return
+
+        if name not in self._columns:
+            if isinstance(value, u.Quantity):
+                column = u.Quantity(
+                    np.full((self._iterations,) + value.shape, np.nan),
+                    value.unit,
+                )
+            elif np.asarray(value).dtype.kind in "biufc":  # numeric
+                column = np.full(
+                    (self._iterations,) + np.shape(value),
+                    np.nan,
+                    dtype=np.result_type(value, float),
+                )
+            else:
+                column = np.full(self._iterations, None, dtype=object)
+            self._columns[name] = column
+
+        self._columns[name][index] = value
+
+    # /def
+
+    def _get_row(self, index: int) -> T.Dict[str, T.Any]:
+        """The columns of an iteration, as length-1 slices.
+
+        The slices keep the dtype and unit, e.g. for :meth:`_set_row`.
+
+        """
+        window = slice(index, index + 1)
+        return {
+            k: (
+                {kk: vv[window] for kk, vv in v.items()}
+                if isinstance(v, dict)  # coefficients
+                else v[window]
+            )
+            for k, v in self._columns.items()
+        }
+
+    # /def
+
+    def _set_row(self, index: int, row: T.Mapping[str, T.Any]) -> None:
+        """Set the columns of an iteration from :meth:`_get_row`."""
+        for k, v in row.items():
+            if isinstance(v, dict):  # coefficients
+                columns = self._columns.setdefault(k, {})
+                for kk, vv in v.items():
+                    if kk not in columns:
+                        columns[kk] = self._empty_like(vv)
+                    columns[kk][index] = vv[0]
+                continue
+
+            if k not in self._columns:
+                self._columns[k] = self._empty_like(v)
+            self._columns[k][index] = v[0]
+
+    # /def
+
+    def _empty_like(self, row: np.ndarray) -> np.ndarray:
+        """An unset column, like a length-1 slice of one."""
+        fill = None if row.dtype.kind == "O" else np.nan
+        column = np.full(
+            (self._iterations,) + row.shape[1:],
+            fill,
+            dtype=row.dtype,
+        )
+        if isinstance(row, u.Quantity):
+            column = u.Quantity(column, row.unit, copy=False)
+
+        return column
+
+    # /def
+
+    #################################################################
+    # Views
+
+    def get(self, field: str, index: int) -> T.Any:
+        """The value of a field in an iteration, built from the columns.
+
+        Parameters
+        ----------
+        field : str
+            One of "sample", "measured", "fit", "residual", "statistic".
+        index : int
+            The iteration.
+
+        Returns
+        -------
+        object
+            E.g. a |SkyCoord| for "sample". None if the field wasn't set.
+
+        """
+        if field not in self._fields:
+            raise ValueError(f"field must be one of {self._fields}")
+        elif field == "fit" and "fit" in self._meta:
+            return self._get_fit(index)
+        elif field not in self._columns:
+            return None
+        elif field in ("sample", "measured"):
+            return self._get_coordinates(field, index)
+        elif field == "residual" and "vectorfield_type" in self._meta.get(
+            "residual",
+            {},
+        ):
+            return self._get_residual(index)
+
+        return self._columns[field][index]
+
+    # /def
+
+    def _get_coordinates(self, name: str, index: int) -> TH.SkyCoordType:
+        meta = self._meta[name]
+        column = self._columns[name][index]
+
+        units = meta["units"]
+        dif = None
+        if len(units) == 2:
+            dif = coord.CartesianDifferential(column[:, 3:].T * units[1])
+        rep = coord.CartesianRepresentation(
+            column[:, :3].T * units[0],
+            differentials=dif,
+        )
+
+        sample = coord.SkyCoord(
+            meta["frame"].realize_frame(
+                rep,
+                representation_type=meta["representation_type"],
+            ),
+            copy=False,
+        )
+        sample.mass = self._columns[name + "_mass"][index]
+        sample.potential = meta["potential"]
+
+        return sample
+
+    # /def
+
+    def _get_fit(self, index: int) -> T.Optional[PotentialWrapper]:
+        coeffs = {
+            k: v[index] for k, v in self._columns["coefficients"].items()
+        }
+        if np.isnan(next(iter(coeffs.values()))).all():  # not set
+            return None
+
+        template = self._meta["fit"]["template"]
+        return template.with_coefficients(
+            {**self._meta["coefficients"], **coeffs},
+        )
+
+    # /def
+
+    def _get_residual(self, index: int) -> BaseVectorField:
+        meta = self._meta["residual"]
+        vf_x, vf_y, vf_z = self._columns["residual"][index]
+
+        residual = CartesianVectorField(
+            meta["points"],
+            vf_x=vf_x,
+            vf_y=vf_y,
+            vf_z=vf_z,
+            frame=meta["frame"],
+        )
+        if meta["vectorfield_type"] is not CartesianVectorField:
+            residual = meta["vectorfield_type"].from_cartesian(residual)
+
+        return residual
+
+    # /def
+
+    def __getitem__(self, index: int) -> np.record:
+        """A :class:`PipelineResult` record of an iteration."""
+        index = range(self._iterations)[index]  # also checks bounds
+        fields = [self.get(field, index) for field in self._fields]
+
+        return PipelineResult(self._parent, *fields)[0]
+
+    # /def
+
+    def __len__(self) -> int:
+        return self._iterations
+
+    # /def
+
+    def to_recarray(self) -> PipelineResult:
+        """All iterations as a :class:`PipelineResult`."""
+        results = np.recarray(
+            (self._iterations,),
+            dtype=PipelineResult(self._parent).dtype,
+        ).view(PipelineResult)
+        results._parent_ref = self._parent_ref
+
+        for i in range(self._iterations):
+            results[i] = tuple(self.get(field, i) for field in self._fields)
+
+        return results
+
+    # /def
+
+    def __repr__(self) -> str:
+        columns = ", ".join(
+            f"{k}{getattr(v, 'shape', '')}"
+            for k, v in self._columns.items()
+            if k != "coefficients"
+        )
+        return (
+            f"{self.__class__.__name__}(iterations={self._iterations}, "
+            f"columns=[{columns}])"
+        )
+
+    # /def
+
+
+# /class
+
+
 ##############################################################################
 # END
@@ -32,7 +32,7 @@ import numpy as np
 # PROJECT-SPECIFIC
 import discO.type_hints as TH
 from .common import CommonBase
-from .wrapper import PotentialWrapper
+from .wrapper import PotentialWrapper, PotentialWrapperMeta
 from discO.utils.coordinates import (
     resolve_framelike,
     resolve_representationlike,
@@ -285,6 +285,46 @@ class ResidualMethod(CommonBase):
 
     # /def
 
+    def evaluate_potentials(
+        self,
+        potentials: T.Sequence[T.Union[PotentialWrapper, T.Any]],
+        observable: T.Optional[str] = None,
+        *,
+        representation_type: TH.OptRepresentationLikeType = None,
+        **kwargs,
+    ) -> T.List[object]:
+        """Evaluate method on many potentials.
+
+        Parameters
+        ----------
+        potentials : sequence of object or :class:`~PotentialWrapper`
+            The potentials. See ``evaluate_potential``.
+        observable : str or None (optional)
+            name of method in :class:`~PotentialWrapper`.
+            If None (default), uses default value -- ``.observable``.
+        representation_type: representation-resolvable (optional, keyword-only)
+            The output representation type. If None (default), uses default
+            representation point.
+        **kwargs
+            Passed to ``evaluate_potential``.
+
+        Returns
+        -------
+        list
+
+        """
+        return [
+            self.evaluate_potential(
+                potential,
+                observable=observable,
+                representation_type=representation_type,
+                **kwargs,
+            )
+            for potential in potentials
+        ]
+
+    # /def
+
     # -----------------------------------------------------
 
     def __call__(
@@ -335,6 +375,37 @@ class ResidualMethod(CommonBase):
             If not specified, and it shouldn't be, uses points determined
             by the class at initialization.
 
+        """
+        return self._evaluate_residuals(
+            [fit_potential],
+            original_potential=original_potential,
+            observable=observable,
+            representation_type=representation_type,
+            **kwargs,
+        )[0]
+
+    # /def
+
+    def _evaluate_residuals(
+        self,
+        fit_potentials: T.Sequence[T.Any],
+        original_potential: T.Optional[T.Any] = None,
+        observable: T.Optional[str] = None,
+        *,
+        representation_type: TH.OptRepresentationLikeType = None,
+        **kwargs,
+    ) -> T.List[object]:
+        """Calculate the residual of each of many fit potentials.
+
+        The original potential is evaluated once and the fit potentials are
+        evaluated together with ``evaluate_potentials``.
+        Arguments are as for ``__call__``.
+
+        Returns
+        -------
+        list
+            The residuals, in `representation_type`.
+
         """
         # -----------------------
         # Setup
@@ -375,23 +446,28 @@ class ResidualMethod(CommonBase):
         if original_potential.frame is Ellipsis:
             original_potential._frame = resolve_framelike(Ellipsis)
 
-        fit_potential = PotentialWrapper(
-            fit_potential,
-            # frame=frame,  # NOT SET ON PURPOSE
-            representation_type=representation_type,
-        )
+        fit_potentials = [
+            PotentialWrapper(
+                fit_potential,
+                # frame=frame,  # NOT SET ON PURPOSE
+                representation_type=representation_type,
+            )
+            for fit_potential in fit_potentials
+        ]
 
         # -----------------------
         # Validate
 
         # now we confirm that the frames are the same.
         # we can do this since everything is in a PotentialWrapper
-        if fit_potential.frame != original_potential.frame:
-            raise ValueError(
-                "original and fit potentials must have the same frames.\n"
-                f"The original potential has:\n\t{original_potential.frame}\n"
-                f"The fit potential has:\n\t{fit_potential.frame}\n",
-            )
+        for fit_potential in fit_potentials:
+            if fit_potential.frame != original_potential.frame:
+                raise ValueError(
+                    "original and fit potentials must have the same frames.\n"
+                    "The original potential has:\n\t"
+                    f"{original_potential.frame}\n"
+                    f"The fit potential has:\n\t{fit_potential.frame}\n",
+                )
 
         # -----------------------
         # Evaluate
@@ -403,27 +479,32 @@ class ResidualMethod(CommonBase):
             representation_type=coord.CartesianRepresentation,
             **kw,
         )
-        # get value on fit potential
-        fitval = self.evaluate_potential(
-            fit_potential,
+        # get values on fit potentials
+        fitvals = self.evaluate_potentials(
+            fit_potentials,
             observable=observable,
             representation_type=coord.CartesianRepresentation,
             **kw,
         )
 
-        # get difference
-        residual = fitval - origval  # TODO! weighting by errors
+        residuals = []
+        for fitval in fitvals:
+            # get difference
+            residual = fitval - origval  # TODO! weighting by errors
+
+            # output representation type
+            # still None -> base_representation
+            rep_type = representation_type
+            if rep_type is None:
+                rep_type = residual.base_representation
+            rep_type = resolve_representationlike(rep_type)
+
+            residuals.append(residual.represent_as(rep_type))
 
         # -----------------------
         # Return
 
-        # output representation type
-        # still None -> base_representation
-        if representation_type is None:
-            representation_type = residual.base_representation
-        representation_type = resolve_representationlike(representation_type)
-
-        return residual.represent_as(representation_type)
+        return residuals
 
     # /def
 
@@ -562,10 +643,15 @@ class ResidualMethod(CommonBase):
             ),
         )
 
-        if not isinstance(fit_potential, Sequence):
+        if not isinstance(fit_potential, (Sequence, np.ndarray)):
             return resids[0]
-        else:
-            return np.array(resids, dtype=object)
+
+        # fill, so numpy doesn't try to iterate the residuals
+        out = np.empty(len(resids), dtype=object)
+        for i, resid in enumerate(resids):
+            out[i] = resid
+
+        return out
 
     # /def
 
@@ -693,6 +779,20 @@ class GridResidual(ResidualMethod, key="grid"):
 
     # /def
 
+    @property
+    def points(self) -> TH.CoordinateType:
+        """The grid."""
+        return self._points
+
+    @points.setter
+    def points(self, value: TH.CoordinateType) -> None:
+        self._points = value
+        # anything evaluated on the grid, eg. basis functions,
+        # by the repr of the frame.
+        self._grid_cache: T.Dict[str, T.Dict[T.Any, T.Any]] = dict()
+
+    # /def
+
     #################################################################
     # evaluate
 
@@ -744,6 +844,172 @@ class GridResidual(ResidualMethod, key="grid"):
 
     # /def
 
+    def evaluate_potentials(
+        self,
+        potentials: T.Sequence[T.Union[PotentialWrapper, T.Any]],
+        observable: T.Optional[str] = None,
+        *,
+        representation_type: TH.OptRepresentationLikeType = None,
+        **kwargs,
+    ) -> T.List[object]:
+        """Evaluate method on many potentials.
+
+        Potentials with the same wrapper and frame are evaluated together
+        with ``batch_evaluate`` of their wrapper, which can reuse work on the
+        grid between potentials and between calls, eg. the basis functions
+        of an expansion.
+
+        Parameters
+        ----------
+        potentials : sequence of object or :class:`~PotentialWrapper`
+            The potentials. See ``evaluate_potential``.
+        observable : str or None (optional)
+            name of method in :class:`~PotentialWrapper`.
+            If None (default), uses default value -- ``.observable``.
+        representation_type: representation-resolvable (optional, keyword-only)
+            The output representation type. If None (default), uses default
+            representation point.
+        **kwargs
+            Passed to method in :class:`~PotentialWrapper`.
+
+        Returns
+        -------
+        list
+
+        """
+        observable = observable or self.observable  # None -> stored
+        if observable is None:  # still None
+            raise ValueError("Need to pass observable.")
+
+        points = kwargs.pop("points", self.points)
+
+        representation_type = (
+            resolve_representationlike(representation_type)
+            if representation_type is not None
+            else self.representation_type
+        )
+
+        wrappers = [
+            PotentialWrapper(p, representation_type=representation_type)
+            for p in potentials
+        ]
+        if not wrappers:
+            return []
+
+        # need the same wrapper and frame to evaluate as a batch, and for
+        # batching to do something different than ``evaluate_potential``.
+        kls, frame = wrappers[0].__class__, wrappers[0].frame
+        if (
+            self.__class__.evaluate_potential
+            is not GridResidual.evaluate_potential
+            or type(kls).batch_evaluate is PotentialWrapperMeta.batch_evaluate
+            or any(
+                (w.__class__ is not kls) or (w.frame != frame)
+                for w in wrappers
+            )
+        ):
+            return super().evaluate_potentials(
+                potentials,
+                observable=observable,
+                representation_type=representation_type,
+                points=points,
+                **kwargs,
+            )
+
+        # only cache for the grid
+        cache = None
+        if points is self.points:
+            cache = self._grid_cache.setdefault(repr(frame), dict())
+
+        rep_type = (
+            wrappers[0].representation_type
+            if representation_type is None
+            else representation_type
+        )
+        values = kls.batch_evaluate(
+            [w.__wrapped__ for w in wrappers],
+            observable,
+            points,
+            frame=frame,
+            representation_type=rep_type,
+            cache=cache,
+            **kwargs,
+        )
+
+        if representation_type is None:
+            rep_type = values[0].base_representation
+        rep_type = resolve_representationlike(rep_type)
+
+        return [value.represent_as(rep_type) for value in values]
+
+    # /def
+
+    # -----------------------------------------------------
+
+    def _run_iter(
+        self,
+        fit_potential: T.Union[PotentialWrapper, T.Sequence[PotentialWrapper]],
+        original_potential: T.Optional[T.Any] = None,
+        observable: T.Optional[str] = None,
+        *,
+        representation_type: TH.OptRepresentationLikeType = None,
+        # extra
+        progress: bool = True,
+        **kwargs,
+    ) -> object:
+        """Calculate Residual.
+
+        The fit potentials are evaluated together, see
+        ``evaluate_potentials``, then the residuals are yielded.
+
+        Parameters
+        ----------
+        fit_potential : :class:`~PotentialWrapper` or sequence thereof
+            The fitted potential. If not already a PotentialWrapper, it is
+            wrapped: this means that the frame is :class:`~discO.UnFrame`.
+        original_potential : object or :class:`~PotentialWrapper` (optional)
+            The original potential. If not already a PotentialWrapper, it is
+            wrapped: this means that the frame is :class:`~discO.UnFrame`.
+
+        observable : str or None (optional)
+            The quantity on which to calculate the residual.
+            Must be method of :class:`~discO.core.wrapper.PotentialWrapper`.
+            None (default) becomes the default value at initialization.
+
+        representation_type: representation-resolvable (optional, keyword-only)
+            The output representation type. If None (default), uses default
+            representation point.
+
+        **kwargs
+            Passed to method in :class:`~PotentialWrapper`.
+            First mixed in with ``default_params`` (preferring ``kwargs``).
+
+        Returns
+        -------
+        residual : object
+            In `representation_type`.
+
+        """
+        if not isinstance(fit_potential, (Sequence, np.ndarray)):
+            fit_potential = [fit_potential]
+
+        residuals = self._evaluate_residuals(
+            fit_potential,
+            original_potential=original_potential,
+            observable=observable,
+            representation_type=representation_type,
+            **kwargs,
+        )
+
+        with get_progress_bar(progress, len(residuals)) as pbar:
+
+            for residual in residuals:
+                pbar.update(1)
+
+                yield residual
+
+    # /def
+
 
 # /class
 
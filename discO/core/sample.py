@@ -30,6 +30,10 @@ Let's do this for galpy
 
 __all__ = [
     "PotentialSampler",
+    "SphericalPotentialSampler",
+    "RejectionPotentialSampler",
+    "SnapshotSampler",
+    "SampleArrays",
 ]
 
 
@@ -39,31 +43,335 @@ __all__ = [
 # BUILT-IN
 import abc
 import contextlib
+import time
 import typing as T
-from types import ModuleType
+import warnings
+from types import MappingProxyType, ModuleType
 
 # THIRD PARTY
 import astropy.coordinates as coord
+import astropy.units as u
 import numpy as np
+from scipy.stats import qmc as _qmc
 
 # PROJECT-SPECIFIC
 import discO.type_hints as TH
 from .common import CommonBase
 from .wrapper import PotentialWrapper
+from discO.config import conf
 from discO.utils import resolve_representationlike
+from discO.utils.cache import LRUCache, hash_key
+from discO.utils.coordinates import static_transform
 from discO.utils.pbar import get_progress_bar
-from discO.utils.random import NumpyRNGContext, RandomLike
+from discO.utils.random import (
+    NumpyRNGContext,
+    RandomLike,
+    resolve_random,
+    spawn_generators,
+    spawn_random_states,
+)
 
 ##############################################################################
 # PARAMETERS
 
 SAMPLER_REGISTRY = dict()  # key : sampler
 
+# (potential, name, parameters) : DF or sampling table. Process-wide.
+# The size follows ``conf.sampler_cache_size`` on each access.
+SAMPLER_CACHE = LRUCache(maxsize=conf.sampler_cache_size)
+
 ##############################################################################
 # CODE
 ##############################################################################
 
 
+class SampleArrays(T.NamedTuple):
+    """A sample as plain float arrays, in fixed units.
+
+    This is the low-level output of ``PotentialSampler.sample_arrays``,
+    without the overhead of building a |SkyCoord|. The units are given by
+    ``SampleArrays.units``.
+
+    Parameters
+    ----------
+    positions : (..., 3) ndarray
+        Cartesian positions in kpc.
+    velocities : (..., 3) ndarray or None
+        Cartesian velocities in km / s.
+    masses : (...) ndarray or None
+        Masses in solar masses.
+    frame : |CoordinateFrame| or None
+        The frame of the positions and velocities.
+
+    """
+
+    positions: np.ndarray
+    velocities: T.Optional[np.ndarray]
+    masses: T.Optional[np.ndarray]
+    frame: TH.OptFrameType = None
+
+    units = MappingProxyType(
+        dict(positions=u.kpc, velocities=u.km / u.s, masses=u.solMass),
+    )
+
+    @property
+    def shape(self) -> T.Tuple[int, ...]:
+        """Shape of the sample, eg. (N, ) or (N, iterations)."""
+        return self.positions.shape[:-1]
+
+    # /def
+
+    @classmethod
+    def from_coord(
+        cls,
+        c: TH.CoordinateType,
+        mass: T.Optional[TH.QuantityType] = None,
+    ) -> "SampleArrays":
+        """Sample arrays from coordinates.
+
+        Parameters
+        ----------
+        c : |CoordinateFrame| or |SkyCoord|
+        mass : |Quantity| or None (optional)
+            If None (default), the ``mass`` attribute of `c`, if any.
+
+        Returns
+        -------
+        `SampleArrays`
+
+        """
+        mass = getattr(c, "mass", None) if mass is None else mass
+        frame = c.replicate_without_data()
+        frame = getattr(frame, "frame", frame)  # SkyCoord -> frame
+
+        if "s" in c.data.differentials:
+            rep = c.data.represent_as(
+                coord.CartesianRepresentation,
+                coord.CartesianDifferential,
+            )
+            velocities = rep.differentials["s"].d_xyz
+            velocities = velocities.to_value(cls.units["velocities"])
+            velocities = np.moveaxis(velocities, 0, -1)
+        else:
+            rep = c.data.represent_as(coord.CartesianRepresentation)
+            velocities = None
+
+        positions = rep.xyz.to_value(cls.units["positions"])
+        positions = np.moveaxis(positions, 0, -1)
+
+        if mass is not None:
+            mass = np.broadcast_to(
+                u.Quantity(mass).to_value(cls.units["masses"]),
+                positions.shape[:-1],
+            )
+
+        return cls(positions, velocities, mass, frame)
+
+    # /def
+
+    def to_coord(
+        self,
+        representation_type: TH.OptRepresentationLikeType = None,
+    ) -> TH.SkyCoordType:
+        """Wrap the arrays in a |SkyCoord|, with a ``mass`` attribute.
+
+        Parameters
+        ----------
+        representation_type : representation-like or None (optional)
+            If None (default), Cartesian.
+
+        Returns
+        -------
+        |SkyCoord|
+
+        Raises
+        ------
+        ValueError
+            If the arrays have no frame.
+
+        """
+        if self.frame is None:
+            raise ValueError("the sample arrays have no frame.")
+
+        if self.velocities is None:
+            differentials = None
+        else:
+            differentials = dict(
+                s=coord.CartesianDifferential(
+                    np.moveaxis(self.velocities, -1, 0),
+                    unit=self.units["velocities"],
+                    copy=False,
+                ),
+            )
+        rep = coord.CartesianRepresentation(
+            np.moveaxis(self.positions, -1, 0),
+            unit=self.units["positions"],
+            differentials=differentials,
+            copy=False,
+        )
+
+        if representation_type is None:
+            representation_type = rep.__class__
+        else:
+            representation_type = resolve_representationlike(
+                representation_type,
+            )
+        c = coord.SkyCoord(
+            self.frame.realize_frame(
+                rep,
+                representation_type=representation_type,
+            ),
+            copy=False,
+        )
+        if self.masses is not None:
+            c.mass = self.masses * self.units["masses"]
+
+        return c
+
+    # /def
+
+    def transform_to(self, frame: TH.FrameType) -> "SampleArrays":
+        """Transform the sample to another frame.
+
+        Static transformations, eg. ICRS to Galactocentric, are applied
+        directly to the arrays (see
+        :func:`~discO.utils.coordinates.static_transform`). Others go
+        through coordinates.
+
+        Parameters
+        ----------
+        frame : |CoordinateFrame|
+
+        Returns
+        -------
+        `SampleArrays`
+
+        Raises
+        ------
+        ValueError
+            If the arrays have no frame.
+
+        """
+        if self.frame is None:
+            raise ValueError("the sample arrays have no frame.")
+        elif self.frame.is_equivalent_frame(frame):
+            return self
+
+        transform = static_transform(self.frame, frame)
+        if transform is None:
+            c = self.to_coord().transform_to(frame)
+            return self.from_coord(c)._replace(masses=self.masses)
+
+        return self._replace(
+            positions=transform.positions(self.positions),
+            velocities=(
+                None
+                if self.velocities is None
+                else transform.velocities(self.velocities)
+            ),
+            frame=frame.replicate_without_data(),
+        )
+
+    # /def
+
+    def split(self) -> T.List["SampleArrays"]:
+        """Split a (N, iterations) sample into a list of (N, ) samples.
+
+        Returns
+        -------
+        list of `SampleArrays`
+            Of length 1 if the sample has shape (N, ).
+
+        """
+        if len(self.shape) == 1:
+            return [self]
+
+        return [
+            self._replace(
+                positions=self.positions[:, i],
+                velocities=(
+                    None if self.velocities is None else self.velocities[:, i]
+                ),
+                masses=None if self.masses is None else self.masses[:, i],
+            )
+            for i in range(self.shape[1])
+        ]
+
+    # /def
+
+    @classmethod
+    def stack(cls, samples: T.Sequence["SampleArrays"]) -> "SampleArrays":
+        """Stack (N, ) samples into a (N, iterations) sample.
+
+        The inverse of ``split``. The frame is taken from the first sample.
+
+        Parameters
+        ----------
+        samples : sequence of `SampleArrays`
+
+        Returns
+        -------
+        `SampleArrays`
+
+        """
+        first = samples[0]
+
+        def _stack(name: str) -> T.Optional[np.ndarray]:
+            if getattr(first, name) is None:
+                return None
+            return np.stack([getattr(s, name) for s in samples], axis=1)
+
+        return cls(
+            _stack("positions"),
+            _stack("velocities"),
+            _stack("masses"),
+            first.frame,
+        )
+
+    # /def
+
+    @classmethod
+    def concatenate(
+        cls,
+        samples: T.Iterable["SampleArrays"],
+    ) -> "SampleArrays":
+        """Join (N_i, ) samples, e.g. chunks, into a (sum N_i, ) sample.
+
+        The frame is taken from the first sample.
+
+        Parameters
+        ----------
+        samples : iterable of `SampleArrays`
+
+        Returns
+        -------
+        `SampleArrays`
+
+        """
+        samples = list(samples)
+        first = samples[0]
+
+        def _concat(name: str) -> T.Optional[np.ndarray]:
+            if getattr(first, name) is None:
+                return None
+            return np.concatenate([getattr(s, name) for s in samples])
+
+        return cls(
+            _concat("positions"),
+            _concat("velocities"),
+            _concat("masses"),
+            first.frame,
+        )
+
+    # /def
+
+
+# /class
+
+
+# -------------------------------------------------------------------
+
+
 class PotentialSampler(CommonBase):
     """Sample a Potential.
 
@@ -208,7 +516,11 @@ class PotentialSampler(CommonBase):
             representation_type=representation_type,
         )
 
-        self._total_mass: T.Optional[TH.QuantityType] = mtot
+        # eg. galpy without physical outputs gives a float
+        self._total_mass: TH.QuantityType = u.Quantity(
+            mtot,
+            SampleArrays.units["masses"],
+        )
 
         # keep the kwargs
         self._defaults: dict = defaults
@@ -280,6 +592,108 @@ class PotentialSampler(CommonBase):
 
     # /def
 
+    def sample_arrays(
+        self,
+        n: int = 1,
+        *,
+        random: RandomLike = None,
+        **kwargs,
+    ) -> SampleArrays:
+        """Sample, returning plain arrays in fixed units.
+
+        This skips building a |SkyCoord|, which can be done afterwards with
+        ``SampleArrays.to_coord``. Subclasses should override this method
+        with a direct implementation. By default the sample is drawn with
+        ``__call__`` and converted.
+
+        Parameters
+        ----------
+        n : int (optional)
+            number of samples
+        random : int or |RandomState| or None (optional, keyword-only)
+            Random state.
+        **kwargs
+            passed to underlying instance
+
+        Returns
+        -------
+        `SampleArrays`
+            Positions and velocities are Cartesian, in ``self.frame``.
+
+        """
+        sample = self(
+            n=n,
+            representation_type=coord.CartesianRepresentation,
+            random=random,
+            **kwargs,
+        )
+        return SampleArrays.from_coord(sample)
+
+    # /def
+
+    def sample_chunks(
+        self,
+        n: int,
+        chunksize: int,
+        *,
+        random: RandomLike = None,
+        **kwargs,
+    ) -> T.Iterator[SampleArrays]:
+        """Sample in chunks, e.g. for samples larger than memory.
+
+        The chunks are drawn lazily, as they are iterated over, with
+        ``sample_arrays``. Each chunk has its own random stream, spawned
+        now from `random`, so the chunks do not depend on when they are
+        drawn.
+
+        Parameters
+        ----------
+        n : int
+            The total number of samples.
+        chunksize : int
+            The number of samples in each chunk. The last chunk has the
+            remainder.
+        random : int or |RandomState| or Generator or None (optional, keyword-only)
+            Random state, from which the chunks' streams are spawned.
+        **kwargs
+            passed to ``sample_arrays``.
+
+        Returns
+        -------
+        iterator of `SampleArrays`
+            The masses are scaled so the chunks together have the total
+            mass.
+
+        Raises
+        ------
+        ValueError
+            If `chunksize` is not > 0.
+
+        """
+        if not chunksize > 0:
+            raise ValueError("chunksize must be > 0.")
+
+        sizes = [min(chunksize, n - i) for i in range(0, n, chunksize)]
+
+        random = resolve_random(random)
+        spawn = (
+            spawn_generators
+            if isinstance(random, np.random.Generator)
+            else spawn_random_states
+        )
+        randoms = spawn(random, len(sizes))
+
+        def chunks() -> T.Iterator[SampleArrays]:
+            for size, rand in zip(sizes, randoms):
+                chunk = self.sample_arrays(n=size, random=rand, **kwargs)
+                if chunk.masses is not None:  # each chunk is a fraction
+                    chunk = chunk._replace(masses=chunk.masses * (size / n))
+                yield chunk
+
+        return chunks()
+
+    # /def
+
     # ---------------------------------------------------------------
 
     def _run_iter(
@@ -361,6 +775,9 @@ class PotentialSampler(CommonBase):
     ) -> TH.SkyCoordType:
         """Sample the potential.
 
+        All iterations are drawn in one call to the sampler, for
+        ``n * iterations`` points, which are then reshaped.
+
         Parameters
         ----------
         n : int (optional)
@@ -371,16 +788,15 @@ class PotentialSampler(CommonBase):
             The coordinate representation.
         random : int or |RandomState| or None (optional, keyword-only)
             Random state or seed.
-        sequential : bool (optional, keyword-only)
-            Whether to batch sample or yield sequentially.
         **kwargs
             Passed to underlying instance
 
         Return
         ------
         |SkyCoord|
-            If `sequential` is True.
-            The shape of the SkyCoord is ``(n,)``
+            The shape of the SkyCoord is ``(n, iterations)``, or ``(n,)`` if
+            `iterations` is 1. Column ``j`` is iteration ``j``, with the
+            mass of each point scaled so each iteration has the total mass.
 
         Raises
         ------
@@ -388,35 +804,79 @@ class PotentialSampler(CommonBase):
             If number if iterations not greater than 0.
 
         """
-        samps = [None] * iterations  # premake array
-        mass = [None] * iterations  # premake array
-
-        run_gen = self._run_iter(
-            n=n,
-            iterations=iterations,
-            representation_type=representation_type,
-            random=random,
-            progress=progress,
-            **kwargs,
-        )
+        # draw all the iterations at once
+        with get_progress_bar(progress, iterations) as pbar:
+            sample = self(
+                n=n * iterations,
+                representation_type=representation_type,
+                random=random,
+                **kwargs,
+            )
+            pbar.update(iterations)
 
-        for j, samp in enumerate(run_gen):  # thru iterations
-            # store samples & mass
-            samps[j] = samp
-            mass[j] = samp.mass
+        if iterations == 1:  # 0-dimensional doesn't need reshaping
+            return sample
 
-        # Now need to concatenate iterations
-        if j == 0:  # 0-dimensional doesn't need concat
-            sample = samps[0]
-        else:
-            sample = coord.concatenate(samps).reshape((n, iterations))
-            sample.mass = np.vstack(mass).T
-            sample.potential = samp.potential  # all the same
+        # reshape to (n, iterations), which doesn't copy.
+        # Each iteration is a sample of the whole potential, so the mass of
+        # each point is `iterations` times that of the combined draw.
+        mass, potential = sample.mass, sample.potential
+        sample = sample.reshape((iterations, n)).T
+        sample.mass = np.reshape(mass, (iterations, n)).T * iterations
+        sample.potential = potential  # all the same
 
         return sample
 
     # /def
 
+    def _run_chunks(
+        self,
+        n: int = 1,
+        iterations: int = 1,
+        *,
+        chunksize: int,
+        representation_type: TH.OptRepresentationLikeType = None,
+        random: RandomLike = None,
+        # extra
+        progress: bool = True,
+        **kwargs,
+    ) -> T.Iterator[T.Iterator[SampleArrays]]:
+        """Iteratively sample the potential, in chunks.
+
+        Parameters
+        ----------
+        n : int (optional)
+            Number of sample points.
+        iterations : int (optional)
+            Number of iterations. Must be > 0.
+        chunksize : int (keyword-only)
+            The number of sample points in each chunk.
+        representation_type: |Representation| or None (optional, keyword-only)
+            Ignored. Chunks are Cartesian `SampleArrays`.
+        random : int or |RandomState| or None (optional, keyword-only)
+            Random state or seed.
+        **kwargs
+            Passed to ``sample_chunks``.
+
+        Yields
+        ------
+        iterator of `SampleArrays`
+            For each iteration, the chunks of its sample. See
+            ``sample_chunks``.
+
+        """
+        with get_progress_bar(progress, iterations) as pbar:
+            for i in range(0, iterations):  # thru iterations
+                pbar.update(1)
+                yield self.sample_chunks(
+                    n,
+                    chunksize,
+                    random=random,
+                    **kwargs,
+                )
+
+    # /def
+
     def run(
         self,
         n: int = 1,
@@ -426,6 +886,7 @@ class PotentialSampler(CommonBase):
         random: RandomLike = None,
         # extra
         batch: bool = False,
+        chunksize: T.Optional[int] = None,
         progress: bool = True,
         **kwargs,
     ) -> TH.SkyCoordType:
@@ -447,8 +908,14 @@ class PotentialSampler(CommonBase):
 
         representation_type: |Representation| or None (optional, keyword-only)
             The coordinate representation.
-        random : int or |RandomState| or None (optional, keyword-only)
+        random : int or |RandomState| or Generator or None (optional, keyword-only)
             Random state or seed.
+        chunksize : int or None (optional, keyword-only)
+            If not None, each iteration's sample is an iterator of chunks
+            of this many points, drawn lazily, so the sample need never be
+            whole in memory. See ``sample_chunks``. Chunked samples can be
+            fit with ``PotentialFitter.fit_chunks``.
+            Can't be combined with `batch`.
         progress : bool (optional, keyword-only)
             If True, a progress bar will be shown as the sampler progresses.
             If a string, will select a specific tqdm progress bar - most
@@ -463,18 +930,24 @@ class PotentialSampler(CommonBase):
             If `sequential` is False.
             The shape of the SkyCoord is ``(n, niter)``
             where a scalar `n` has length 1.
+            If `chunksize` is not None, an iterator of `SampleArrays`.
 
         Raises
         ------
         ValueError
             If number if iterations not greater than 0.
+            If both `batch` and `chunksize`.
 
         """
         run_func = self._run_batch if batch else self._run_iter
+        if chunksize is not None:
+            if batch:
+                raise ValueError("can't both batch and chunk the samples.")
+            run_func = self._run_chunks
+            kwargs["chunksize"] = chunksize
 
         # need to resolve RandomState
-        if not isinstance(random, np.random.RandomState):
-            random = np.random.RandomState(random)
+        random = resolve_random(random)
 
         if not iterations >= 1:
             raise ValueError("# of iterations not > 0.")
@@ -493,6 +966,50 @@ class PotentialSampler(CommonBase):
     #################################################################
     # utils
 
+    def _cached(
+        self,
+        name: str,
+        params: T.Any,
+        make: T.Callable[[], T.Any],
+    ) -> T.Any:
+        """Get from, or make and add to, the ``SAMPLER_CACHE``.
+
+        Items are keyed by the contents of the potential, so samplers of
+        different but equal potentials share them. Nothing is cached if
+        ``conf.sampler_cache`` is False or the potential can't be pickled.
+        The cache is resized to ``conf.sampler_cache_size`` on each call.
+
+        Parameters
+        ----------
+        name : str
+            The name of the item, eg. "df".
+        params : Any
+            Picklable parameters of the item.
+        make : callable
+            Makes the item. Takes no arguments.
+
+        Returns
+        -------
+        object
+
+        """
+        key = (
+            hash_key(self._potential, name, params)
+            if conf.sampler_cache
+            else None
+        )
+        if key is None:
+            return make()
+
+        SAMPLER_CACHE.maxsize = conf.sampler_cache_size  # evicts if smaller
+        value = SAMPLER_CACHE.get(key)
+        if value is None:
+            value = SAMPLER_CACHE[key] = make()
+
+        return value
+
+    # /def
+
     def _infer_representation(
         self,
         representation_type: TH.OptRepresentationLikeType,
@@ -525,13 +1042,20 @@ class PotentialSampler(CommonBase):
     ) -> T.Union[NumpyRNGContext, contextlib.suppress]:
         """Get a random-state context manager.
 
-        This is used to supplement samplers that do not have a random seed.
+        This is used to supplement samplers that do not have a random seed,
+        and so use NumPy's global random state. The context sets the global
+        state from `random`, and holds a lock so that samplers in other
+        threads can't interleave. Use a process per worker to run such
+        samplers in parallel.
 
         """
-        if isinstance(random, (int, np.random.RandomState)):
-            context = NumpyRNGContext(random)
-        else:  # None or Generator
+        if isinstance(random, np.random.SeedSequence):
+            random = resolve_random(random)
+
+        if random is None:  # use the global state as is
             context = contextlib.suppress()
+        else:  # int, RandomState or Generator
+            context = NumpyRNGContext(random)
 
         return context
 
@@ -544,5 +1068,968 @@ class PotentialSampler(CommonBase):
 # -------------------------------------------------------------------
 
 
+class SphericalPotentialSampler(PotentialSampler):
+    """Sample positions in a spherical potential by inverse-CDF.
+
+    The enclosed-mass profile is tabulated once from the potential's density,
+    on a logarithmic grid of radii, and inverted onto a uniform grid in the
+    cumulative mass fraction. Radii are drawn by interpolating this table
+    and the angles are isotropic. Only positions are sampled.
+
+    The table is cached in ``SAMPLER_CACHE``, so samplers of equal
+    potentials share it.
+
+    The uniform deviates can instead be quasi-random: a scrambled Sobol or
+    Halton sequence, which covers the unit cube more evenly than
+    pseudo-random numbers, reducing the variance of quantities estimated
+    from the sample, e.g. expansion coefficients. Each call draws a new
+    scrambling from `random`, so the samples are still unbiased.
+
+    Parameters
+    ----------
+    potential : :class:`~discO.PotentialWrapper`
+        The potential object. Must be spherical.
+    rmin, rmax : |Quantity| (optional, keyword-only)
+        The radial range of the table. Mass outside `rmax` is not sampled,
+        and the particle masses are the total mass divided evenly.
+    num : int (optional, keyword-only)
+        The number of radii at which to evaluate the density.
+    qmc : {None, "sobol", "halton"} (optional, keyword-only)
+        The default quasi-random sequence, or None (default) for
+        pseudo-random sampling. Sobol sequences are best balanced when the
+        number of samples is a power of 2.
+
+    total_mass : |Quantity| or None (optional, keyword-only)
+        The total mass of the potential.
+        Necessary if the mass is divergent, must be None otherwise.
+    representation_type: |Representation| or None (optional, keyword-only)
+        The coordinate representation in which to return samples.
+        If None (default) uses representation type from `potential`.
+
+    **defaults
+        default arguments for sampling parameters.
+
+    """
+
+    # resolution of the inverse-CDF table, in the mass fraction.
+    _ncdf: int = 2 ** 16
+
+    # quasi-random sequences, by name
+    _qmc_engines: T.Mapping[str, type] = MappingProxyType(
+        dict(sobol=_qmc.Sobol, halton=_qmc.Halton),
+    )
+
+    def __init__(
+        self,
+        potential: PotentialWrapper,
+        *,
+        rmin: TH.QuantityType = 1e-3 * u.kpc,
+        rmax: TH.QuantityType = 1e4 * u.kpc,
+        num: int = 2048,
+        qmc: T.Optional[str] = None,
+        total_mass: T.Optional[TH.QuantityType] = None,
+        representation_type: TH.OptRepresentationLikeType = None,
+        **defaults,
+    ) -> None:
+        super().__init__(
+            potential,
+            total_mass=total_mass,
+            representation_type=representation_type,
+            **defaults,
+        )
+
+        if not 0 < rmin < rmax:
+            raise ValueError("must have 0 < rmin < rmax.")
+
+        self._table_params = (
+            rmin.to_value(SampleArrays.units["positions"]),
+            rmax.to_value(SampleArrays.units["positions"]),
+            int(num),
+        )
+        self._table: T.Optional[np.ndarray] = None
+
+        self._check_qmc(qmc)
+        self._qmc: T.Optional[str] = qmc
+
+    # /def
+
+    def _check_qmc(self, qmc: T.Optional[str]) -> None:
+        """Check `qmc` names a quasi-random sequence, or is None.
+
+        Raises
+        ------
+        ValueError
+            If `qmc` is not None or a key of ``_qmc_engines``.
+
+        """
+        if qmc is not None and qmc not in self._qmc_engines:
+            raise ValueError(
+                f"qmc must be None or one of {tuple(self._qmc_engines)}.",
+            )
+
+    # /def
+
+    @property
+    def table(self) -> np.ndarray:
+        """Radii (kpc) at uniformly-spaced enclosed-mass fractions.
+
+        Computed on first access and cached in ``SAMPLER_CACHE``.
+
+        """
+        if self._table is None:
+            self._table = self._cached(
+                "inverse enclosed mass",
+                (*self._table_params, self._ncdf),
+                lambda: self._make_table(*self._table_params),
+            )
+
+        return self._table
+
+    # /def
+
+    def _make_table(self, rmin: float, rmax: float, num: int) -> np.ndarray:
+        """Tabulate the inverse enclosed-mass profile.
+
+        Parameters
+        ----------
+        rmin, rmax : float
+            In kpc.
+        num : int
+
+        Returns
+        -------
+        (``_ncdf`` + 1, ) ndarray
+            Radii, in kpc.
+
+        """
+        r = np.geomspace(rmin, rmax, num)
+        points = coord.CartesianRepresentation(
+            r,
+            np.zeros(num),
+            np.zeros(num),
+            unit=SampleArrays.units["positions"],
+        )
+        _, density = self.potential.density(points)
+        density = getattr(density, "value", density)  # normalized away
+
+        # dM / dlnr = 4 pi r^3 rho. The innermost mass has constant density.
+        dmdlnr = r ** 3 * density
+        mass = np.empty(num + 1)
+        mass[:2] = 0, dmdlnr[0] / 3
+        mass[2:] = np.diff(np.log(r)) * (dmdlnr[1:] + dmdlnr[:-1]) / 2
+        cdf = np.cumsum(mass)
+        cdf /= cdf[-1]
+
+        fractions = np.linspace(0, 1, self._ncdf + 1)
+        return np.interp(fractions, cdf, np.r_[0, r])
+
+    # /def
+
+    #################################################################
+    # Sampling
+
+    def __call__(
+        self,
+        n: int = 1,
+        *,
+        representation_type: TH.OptRepresentationLikeType = None,
+        random: RandomLike = None,
+        qmc: T.Optional[str] = None,
+        **kwargs,
+    ) -> TH.SkyCoordType:
+        """Sample.
+
+        Parameters
+        ----------
+        n : int (optional)
+            number of samples
+        representation_type: |Representation| or None (optional, keyword-only)
+            The coordinate representation.
+        random : int or |RandomState| or `~numpy.random.Generator` or None
+            Random state.
+        qmc : {None, "sobol", "halton"} (optional, keyword-only)
+            The quasi-random sequence. If None (default), from
+            initialization.
+        **kwargs
+            ignored
+
+        Returns
+        -------
+        :class:`~astropy.coordinates.SkyCoord`
+
+        """
+        representation_type = self._infer_representation(representation_type)
+
+        samples = self.sample_arrays(
+            n=n,
+            random=random,
+            qmc=qmc,
+            **kwargs,
+        ).to_coord(representation_type=representation_type)
+        samples.potential = self.potential
+
+        return samples
+
+    # /def
+
+    def sample_arrays(
+        self,
+        n: int = 1,
+        *,
+        random: RandomLike = None,
+        qmc: T.Optional[str] = None,
+        **kwargs,
+    ) -> SampleArrays:
+        """Sample, returning plain arrays in fixed units.
+
+        Parameters
+        ----------
+        n : int (optional)
+            number of samples
+        random : int or |RandomState| or `~numpy.random.Generator` or None
+            Random state. With `qmc`, the random scrambling.
+        qmc : {None, "sobol", "halton"} (optional, keyword-only)
+            The quasi-random sequence. If None (default), from
+            initialization.
+        **kwargs
+            ignored
+
+        Returns
+        -------
+        `SampleArrays`
+            Without velocities.
+
+        Raises
+        ------
+        ValueError
+            If `qmc` is not a known sequence.
+
+        """
+        qmc = self._qmc if qmc is None else qmc
+        self._check_qmc(qmc)
+        random = resolve_random(random)
+        table = self.table
+
+        # mass fraction, cos(theta), and phi / 2 pi, all uniform in [0, 1)
+        if qmc is not None:
+            engine = self._qmc_engines[qmc](d=3, scramble=True, seed=random)
+            with warnings.catch_warnings():  # Sobol: n not a power of 2
+                warnings.simplefilter("ignore", UserWarning)
+                frac, cost, phi = np.ascontiguousarray(engine.random(n).T)
+        elif isinstance(random, np.random.Generator):
+            frac, cost, phi = random.random((3, n))
+        else:
+            frac, cost, phi = random.random_sample((3, n))
+
+        # radius, by linear interpolation in the (uniform) table
+        frac *= len(table) - 1
+        i = frac.astype(np.intp)
+        frac -= i
+        r = table[i]
+        r += frac * (table[i + 1] - r)
+
+        # isotropic angles
+        positions = np.empty((3, n))
+        cost *= 2
+        cost -= 1
+        np.multiply(r, cost, out=positions[2])
+        np.multiply(cost, cost, out=cost)
+        np.subtract(1, cost, out=cost)
+        np.sqrt(cost, out=cost)
+        cost *= r  # r sin(theta)
+        phi *= 2 * np.pi
+        np.multiply(np.cos(phi), cost, out=positions[0])
+        np.multiply(np.sin(phi), cost, out=positions[1])
+
+        # from init if divergent mass, preloaded total_mass() otherwise.
+        mass = self._total_mass.to_value(SampleArrays.units["masses"]) / n
+
+        return SampleArrays(
+            positions.T,
+            None,
+            np.full(n, mass),
+            self.frame,
+        )
+
+    # /def
+
+
+# /class
+
+
+# -------------------------------------------------------------------
+
+
+class RejectionPotentialSampler(PotentialSampler):
+    """Sample positions from any potential's density, by rejection.
+
+    Positions are proposed from an envelope of the density and accepted
+    with probability density / envelope, so any potential whose wrapper
+    evaluates a density can be sampled. The envelope is piecewise-constant
+    on cells of logarithmically-spaced shells and of bands in the polar
+    angle, at the largest density on the cells' corners over a set of
+    azimuths, times `safety`. Inside the innermost radius it is a
+    :math:`r^{-2}` cusp, which bounds any shallower cusp. The envelope is
+    built once and cached in ``SAMPLER_CACHE``, so samplers of equal
+    potentials share it.
+
+    Proposals are made, and their densities evaluated, in vectorized
+    blocks. If a proposal's density exceeds the envelope, its cell's bound
+    is raised, on this sampler's copy of the envelope, and the sample is
+    redrawn from the start, so all points are from the same envelope. The
+    acceptance rate and throughput are recorded in ``stats``. Only positions
+    are sampled.
+
+    Parameters
+    ----------
+    potential : :class:`~discO.PotentialWrapper`
+        The potential object. Its density should decrease away from the
+        origin and from the midplane, at least between the envelope's
+        radii.
+    rmin, rmax : |Quantity| (optional, keyword-only)
+        The radial range of the envelope. Mass outside `rmax` is not
+        sampled, and the particle masses are the total mass divided evenly.
+    num : int (optional, keyword-only)
+        The number of radii of the envelope.
+    nbands : int (optional, keyword-only)
+        The number of bands, uniform in the cosine of the polar angle, of
+        the envelope. 1 makes a purely radial envelope, which suffices for
+        spherical potentials. Flattened potentials need more.
+    safety : float (optional, keyword-only)
+        The factor by which the envelope exceeds the probed density. Must
+        be >= 1.
+    blocksize : int (optional, keyword-only)
+        The maximum number of proposals per block.
+
+    total_mass : |Quantity| or None (optional, keyword-only)
+        The total mass of the potential.
+        Necessary if the mass is divergent, must be None otherwise.
+    representation_type: |Representation| or None (optional, keyword-only)
+        The coordinate representation in which to return samples.
+        If None (default) uses representation type from `potential`.
+
+    **defaults
+        default arguments for sampling parameters.
+
+    """
+
+    # number of probe azimuths, including the x and y axes.
+    _nphi: int = 16
+
+    def __init__(
+        self,
+        potential: PotentialWrapper,
+        *,
+        rmin: TH.QuantityType = 1e-3 * u.kpc,
+        rmax: TH.QuantityType = 1e4 * u.kpc,
+        num: int = 256,
+        nbands: int = 16,
+        safety: float = 1.5,
+        blocksize: int = 2 ** 18,
+        total_mass: T.Optional[TH.QuantityType] = None,
+        representation_type: TH.OptRepresentationLikeType = None,
+        **defaults,
+    ) -> None:
+        super().__init__(
+            potential,
+            total_mass=total_mass,
+            representation_type=representation_type,
+            **defaults,
+        )
+
+        if not 0 < rmin < rmax:
+            raise ValueError("must have 0 < rmin < rmax.")
+        elif not nbands > 0:
+            raise ValueError("nbands must be > 0.")
+        elif not safety >= 1:
+            raise ValueError("safety must be >= 1.")
+        elif not blocksize > 0:
+            raise ValueError("blocksize must be > 0.")
+
+        self._envelope_params = (
+            rmin.to_value(SampleArrays.units["positions"]),
+            rmax.to_value(SampleArrays.units["positions"]),
+            int(num),
+            int(nbands),
+            float(safety),
+        )
+        self._envelope: T.Optional[T.Tuple[np.ndarray, ...]] = None
+        self._blocksize: int = int(blocksize)
+
+        self._stats: T.Dict[str, float] = dict(
+            proposed=0,
+            accepted=0,
+            adapted=0,
+            seconds=0.0,
+        )
+
+    # /def
+
+    @property
+    def envelope(self) -> T.Tuple[np.ndarray, ...]:
+        """The shells' inner and outer radii (kpc), and density bounds.
+
+        The bounds are by shell and band. The first shell is the cusp
+        inside ``rmin``, where the bounds are the density at ``rmin``.
+        Computed on first access and cached in ``SAMPLER_CACHE``.
+
+        """
+        if self._envelope is None:
+            self._envelope = self._cached(
+                "rejection envelope",
+                (*self._envelope_params, self._nphi),
+                lambda: self._make_envelope(*self._envelope_params),
+            )
+
+        return self._envelope
+
+    # /def
+
+    @property
+    def stats(self) -> T.Dict[str, float]:
+        """Sampling statistics, accumulated over all calls.
+
+        The numbers of proposed and accepted points, of times the envelope
+        was raised ("adapted"), the time spent sampling ("seconds"), the
+        "acceptance" rate and the "throughput" in accepted points per
+        second.
+
+        """
+        stats = dict(self._stats)
+        stats["acceptance"] = stats["accepted"] / max(stats["proposed"], 1)
+        stats["throughput"] = stats["accepted"] / (stats["seconds"] or np.inf)
+        return stats
+
+    # /def
+
+    def _make_envelope(
+        self,
+        rmin: float,
+        rmax: float,
+        num: int,
+        nbands: int,
+        safety: float,
+    ) -> T.Tuple[np.ndarray, ...]:
+        """Build the envelope of the density.
+
+        Parameters
+        ----------
+        rmin, rmax : float
+            In kpc.
+        num, nbands : int
+        safety : float
+
+        Returns
+        -------
+        inner, outer : (`num`, ) ndarray
+            The inner and outer radii (kpc) of the shells.
+        bound : (`num`, `nbands`) ndarray
+            The bounds on the density in each cell.
+
+        """
+        r = np.geomspace(rmin, rmax, num)
+        cost = np.linspace(-1, 1, nbands + 1)
+        phi = np.linspace(0, 2 * np.pi, self._nphi, endpoint=False)
+
+        sint = np.sqrt(1 - cost ** 2)
+        xyz = np.stack(
+            np.broadcast_arrays(
+                r[:, None, None] * sint[:, None] * np.cos(phi),
+                r[:, None, None] * sint[:, None] * np.sin(phi),
+                r[:, None, None] * cost[:, None],
+            ),
+        )  # (3, num, nbands + 1, nphi)
+        points = coord.CartesianRepresentation(
+            xyz.reshape(3, -1),
+            unit=SampleArrays.units["positions"],
+        )
+        _, density = self.potential.density(points)
+        density = getattr(density, "value", density)  # normalized away
+        density = np.max(np.reshape(density, xyz.shape[1:]), axis=-1)
+
+        # the largest on the corners: the bands' edges, and shells' radii
+        density = np.maximum(density[:, 1:], density[:, :-1])
+        bound = density.copy()
+        np.maximum(bound[1:], density[:-1], out=bound[1:])
+        bound *= safety
+
+        return np.r_[0, r[:-1]], r, bound
+
+    # /def
+
+    #################################################################
+    # Sampling
+
+    def __call__(
+        self,
+        n: int = 1,
+        *,
+        representation_type: TH.OptRepresentationLikeType = None,
+        random: RandomLike = None,
+        **kwargs,
+    ) -> TH.SkyCoordType:
+        """Sample.
+
+        Parameters
+        ----------
+        n : int (optional)
+            number of samples
+        representation_type: |Representation| or None (optional, keyword-only)
+            The coordinate representation.
+        random : int or |RandomState| or `~numpy.random.Generator` or None
+            Random state.
+        **kwargs
+            ignored
+
+        Returns
+        -------
+        :class:`~astropy.coordinates.SkyCoord`
+
+        """
+        representation_type = self._infer_representation(representation_type)
+
+        samples = self.sample_arrays(
+            n=n,
+            random=random,
+            **kwargs,
+        ).to_coord(representation_type=representation_type)
+        samples.potential = self.potential
+
+        return samples
+
+    # /def
+
+    def sample_arrays(
+        self,
+        n: int = 1,
+        *,
+        random: RandomLike = None,
+        **kwargs,
+    ) -> SampleArrays:
+        """Sample, returning plain arrays in fixed units.
+
+        Parameters
+        ----------
+        n : int (optional)
+            number of samples
+        random : int or |RandomState| or `~numpy.random.Generator` or None
+            Random state.
+        **kwargs
+            ignored
+
+        Returns
+        -------
+        `SampleArrays`
+            Without velocities.
+
+        """
+        start = time.perf_counter()
+        random = resolve_random(random)
+        inner, outer, bound = self.envelope
+        rmin, nbands = outer[0], bound.shape[1]
+        volume = outer ** 3 - inner ** 3  # / (4 pi / 3)
+
+        positions = np.empty((n, 3))
+        filled, proposed = 0, 0
+        acceptance = self.stats["acceptance"] or 0.5  # a first guess
+        while filled < n:
+            size = int((n - filled) / acceptance * 1.1) + 64
+            size = min(size, self._blocksize)
+            if isinstance(random, np.random.Generator):
+                uniform = random.random((5, size))
+            else:
+                uniform = random.random_sample((5, size))
+
+            # the cell, with probability in proportion to its mass. The
+            # cusp's mass is 3 times that of a uniform sphere.
+            weights = bound * volume[:, None]
+            weights[0] *= 3
+            weights = np.cumsum(weights)
+            cell = np.searchsorted(
+                weights, uniform[0] * weights[-1], side="right"
+            )
+            np.minimum(cell, bound.size - 1, out=cell)
+            shell, band = np.divmod(cell, nbands)
+
+            # radius: uniform in the cusp, uniform in volume in the shells
+            incusp = shell == 0
+            r = np.cbrt(inner[shell] ** 3 + uniform[1] * volume[shell])
+            r[incusp] = rmin * (1 - uniform[1][incusp])  # in (0, rmin]
+            envelope = bound.ravel()[cell]
+            envelope[incusp] *= (rmin / r[incusp]) ** 2
+
+            # angles, uniform in the band
+            cost = (band + uniform[2]) * (2 / nbands) - 1
+            sint = np.sqrt(1 - cost ** 2)
+            phi = 2 * np.pi * uniform[3]
+            xyz = np.stack(
+                (r * sint * np.cos(phi), r * sint * np.sin(phi), r * cost),
+            )
+
+            _, density = self.potential.density(
+                coord.CartesianRepresentation(
+                    xyz,
+                    unit=SampleArrays.units["positions"],
+                    copy=False,
+                ),
+            )
+            density = np.asarray(getattr(density, "value", density))
+            proposed += size
+
+            # raise the envelope where it is too low, on a copy, not the
+            # cached one, and redraw the sample, so all points are from the
+            # same envelope.
+            ratio = density / envelope
+            if np.any(ratio > 1):
+                high = np.ones(bound.size)
+                np.maximum.at(high, cell, ratio * self._envelope_params[-1])
+                bound = bound * high.reshape(bound.shape)
+                self._envelope = (inner, outer, bound)
+                self._stats["adapted"] += 1
+                filled = 0
+                continue
+
+            accepted = np.flatnonzero(uniform[4] < ratio)[: n - filled]
+            end = filled + len(accepted)
+            positions[filled:end] = xyz[:, accepted].T
+            filled = end
+            acceptance = max(len(accepted) / size, 1e-3)
+
+        self._stats["proposed"] += proposed
+        self._stats["accepted"] += n
+        self._stats["seconds"] += time.perf_counter() - start
+
+        # from init if divergent mass, preloaded total_mass() otherwise.
+        mass = self._total_mass.to_value(SampleArrays.units["masses"]) / n
+
+        return SampleArrays(positions, None, np.full(n, mass), self.frame)
+
+    # /def
+
+
+# /class
+
+
+# -------------------------------------------------------------------
+
+
+class SnapshotSampler(PotentialSampler, key="astropy"):
+    """Sample the particles of an N-body snapshot.
+
+    Samples are subsamples, or bootstrap resamples, of the particles, drawn
+    as integer indices into contiguous arrays of the particle data. The
+    masses of the drawn particles are rescaled so each sample has the total
+    mass.
+
+    Parameters
+    ----------
+    potential : :class:`~discO.PotentialWrapper`
+        Wrapping a table of the particles, e.g. from
+        :func:`~discO.data.load_Milky_Way_Sim_100`, with columns "x", "y",
+        "z", "mass", and optionally "vx", "vy", "vz". Must have a frame.
+    replace : bool (optional, keyword-only)
+        Whether to draw with replacement (bootstrap, default) or without
+        (subsample) by default.
+
+    total_mass : |Quantity| or None (optional, keyword-only)
+        The total mass of each sample.
+        If None (default), the total mass of the particles.
+    representation_type: |Representation| or None (optional, keyword-only)
+        The coordinate representation in which to return samples.
+        If None (default) uses representation type from `potential`.
+
+    **defaults
+        default arguments for sampling parameters.
+
+    """
+
+    def __init__(
+        self,
+        potential: PotentialWrapper,
+        *,
+        replace: bool = True,
+        total_mass: T.Optional[TH.QuantityType] = None,
+        representation_type: TH.OptRepresentationLikeType = None,
+        **defaults,
+    ) -> None:
+        table = potential.wrapped
+        units = SampleArrays.units
+
+        # contiguous (N, 3) arrays, so draws are fast row gathers.
+        self._positions = np.ascontiguousarray(
+            u.Quantity([table[c] for c in "xyz"])
+            .to_value(units["positions"])
+            .T,
+        )
+        if {"vx", "vy", "vz"}.issubset(table.colnames):
+            self._velocities = np.ascontiguousarray(
+                u.Quantity([table["v" + c] for c in "xyz"])
+                .to_value(units["velocities"])
+                .T,
+            )
+        else:
+            self._velocities = None
+        self._masses = u.Quantity(table["mass"]).to_value(units["masses"])
+
+        super().__init__(
+            potential,
+            total_mass=(
+                self._masses.sum() * units["masses"]
+                if total_mass is None
+                else total_mass
+            ),
+            representation_type=representation_type,
+            **defaults,
+        )
+
+        self._replace: bool = replace
+
+    # /def
+
+    @property
+    def particles(self) -> SampleArrays:
+        """All the particles, with their original masses."""
+        return SampleArrays(
+            self._positions,
+            self._velocities,
+            self._masses,
+            self.frame,
+        )
+
+    # /def
+
+    #################################################################
+    # Sampling
+
+    def indices(
+        self,
+        n: int = 1,
+        iterations: T.Optional[int] = None,
+        *,
+        replace: T.Optional[bool] = None,
+        random: RandomLike = None,
+    ) -> np.ndarray:
+        """Draw the indices of the particles, without copying their data.
+
+        Parameters
+        ----------
+        n : int (optional)
+            number of samples
+        iterations : int or None (optional)
+            If not None, the number of independent samples.
+        replace : bool or None (optional, keyword-only)
+            Whether to draw with replacement. If None (default), from
+            initialization.
+        random : int or |RandomState| or `~numpy.random.Generator` or None
+            Random state.
+
+        Returns
+        -------
+        (n, ) or (n, iterations) ndarray
+            Integer indices, for ``take``.
+
+        Raises
+        ------
+        ValueError
+            If drawing without replacement more particles than there are.
+
+        """
+        replace = self._replace if replace is None else replace
+        random = resolve_random(random)
+        shape = (n,) if iterations is None else (n, iterations)
+        num = len(self._masses)
+
+        if replace:
+            if isinstance(random, np.random.Generator):
+                return random.integers(num, size=shape)
+            return random.randint(num, size=shape)
+
+        elif n > num:
+            raise ValueError(
+                f"can't draw {n} of {num} particles without replacement.",
+            )
+
+        draws = [
+            random.choice(num, size=n, replace=False)
+            for _ in range(1 if iterations is None else iterations)
+        ]
+        return draws[0] if iterations is None else np.stack(draws, axis=1)
+
+    # /def
+
+    def take(self, indices: np.ndarray) -> SampleArrays:
+        """Gather the particles at `indices`.
+
+        Parameters
+        ----------
+        indices : (n, ) or (n, iterations) ndarray
+            From ``indices``.
+
+        Returns
+        -------
+        `SampleArrays`
+            Of shape ``indices.shape``. The masses of each sample, along
+            the first axis, are rescaled to the total mass.
+
+        """
+        masses = self._masses[indices]
+        masses *= self._total_mass.to_value(
+            SampleArrays.units["masses"]
+        ) / masses.sum(axis=0)
+
+        return SampleArrays(
+            np.take(self._positions, indices, axis=0),
+            (
+                None
+                if self._velocities is None
+                else np.take(self._velocities, indices, axis=0)
+            ),
+            masses,
+            self.frame,
+        )
+
+    # /def
+
+    def __call__(
+        self,
+        n: int = 1,
+        *,
+        representation_type: TH.OptRepresentationLikeType = None,
+        random: RandomLike = None,
+        replace: T.Optional[bool] = None,
+        **kwargs,
+    ) -> TH.SkyCoordType:
+        """Sample.
+
+        Parameters
+        ----------
+        n : int (optional)
+            number of samples
+        representation_type: |Representation| or None (optional, keyword-only)
+            The coordinate representation.
+        random : int or |RandomState| or `~numpy.random.Generator` or None
+            Random state.
+        replace : bool or None (optional, keyword-only)
+            Whether to draw with replacement. If None (default), from
+            initialization.
+        **kwargs
+            ignored
+
+        Returns
+        -------
+        :class:`~astropy.coordinates.SkyCoord`
+
+        """
+        representation_type = self._infer_representation(representation_type)
+
+        samples = self.sample_arrays(
+            n=n,
+            random=random,
+            replace=replace,
+        ).to_coord(representation_type=representation_type)
+        samples.potential = self.potential
+
+        return samples
+
+    # /def
+
+    def sample_arrays(
+        self,
+        n: int = 1,
+        *,
+        random: RandomLike = None,
+        replace: T.Optional[bool] = None,
+        **kwargs,
+    ) -> SampleArrays:
+        """Sample, returning plain arrays in fixed units.
+
+        Parameters
+        ----------
+        n : int (optional)
+            number of samples
+        random : int or |RandomState| or `~numpy.random.Generator` or None
+            Random state.
+        replace : bool or None (optional, keyword-only)
+            Whether to draw with replacement. If None (default), from
+            initialization.
+        **kwargs
+            ignored
+
+        Returns
+        -------
+        `SampleArrays`
+
+        """
+        return self.take(self.indices(n, replace=replace, random=random))
+
+    # /def
+
+    def _run_batch(
+        self,
+        n: int = 1,
+        iterations: int = 1,
+        *,
+        representation_type: TH.OptRepresentationLikeType = None,
+        random: RandomLike = None,
+        # extra
+        progress: bool = True,
+        replace: T.Optional[bool] = None,
+        **kwargs,
+    ) -> TH.SkyCoordType:
+        """Sample the snapshot.
+
+        All the iterations' indices are drawn at once, as an
+        (n, iterations) array, and the particles gathered in one step.
+
+        Parameters
+        ----------
+        n : int (optional)
+            Number of sample points.
+        iterations : int (optional)
+            Number of iterations. Must be > 0.
+        representation_type: |Representation| or None (optional, keyword-only)
+            The coordinate representation.
+        random : int or |RandomState| or None (optional, keyword-only)
+            Random state or seed.
+        replace : bool or None (optional, keyword-only)
+            Whether to draw with replacement. If None (default), from
+            initialization.
+        **kwargs
+            ignored
+
+        Return
+        ------
+        |SkyCoord|
+            The shape of the SkyCoord is ``(n, iterations)``, or ``(n,)`` if
+            `iterations` is 1. Each iteration has the total mass.
+
+        """
+        with get_progress_bar(progress, iterations) as pbar:
+            indices = self.indices(
+                n,
+                None if iterations == 1 else iterations,
+                replace=replace,
+                random=random,
+            )
+            pbar.update(iterations)
+
+        samples = self.take(indices).to_coord(
+            representation_type=self._infer_representation(
+                representation_type,
+            ),
+        )
+        samples.potential = self.potential
+
+        return samples
+
+    # /def
+
+
+# /class
+
+
+# -------------------------------------------------------------------
+
+
 ##############################################################################
 # END
@@ -147,6 +147,24 @@ class Test_CommonBase(ObjectTest, obj=common.CommonBase):
 
     # -------------------------------
 
+    def test___reduce__(self):
+        """Test method ``__reduce__``."""
+        inst = getattr(self, "inst", None)
+        if inst is None:  # nothing to pickle
+            return
+
+        func, args, state = inst.__reduce__()
+        assert state is inst.__dict__
+
+        got = func(*args)
+        got.__dict__.update(state)
+        assert got.__class__ is inst.__class__
+        assert got.__dict__ == inst.__dict__
+
+    # /def
+
+    # -------------------------------
+
     def test__infer_package(self):
         """Test method ``_infer_package``."""
         # when key is None
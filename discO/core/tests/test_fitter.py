@@ -396,6 +396,29 @@ class Test_PotentialFitter(CommonBase_Test, obj=fitter.PotentialFitter):
 
     # /def
 
+    @pytest.mark.parametrize("batch", [False, True])
+    def test_run_weights(self, batch):
+        """Test method ``run`` with bootstrap weights."""
+        rng = np.random.default_rng(0)
+        weights = rng.multinomial(len(crd), np.ones(len(crd)) / 10, size=3)
+        weights = weights.T
+
+        pots = self.inst.run(crd, weights=weights, batch=batch)
+        pots = np.array(tuple(pots))
+
+        assert len(pots) == 3
+        assert all([isinstance(p, PotentialWrapper) for p in pots])
+
+        # sample must be 1D
+        with pytest.raises(ValueError, match="shape"):
+            tuple(self.inst.run(multicrd, weights=weights))
+
+        # weights must match the sample
+        with pytest.raises(ValueError, match="shape"):
+            tuple(self.inst.run(crd, weights=weights[:-1]))
+
+    # /def
+
     # -------------------------------
 
     def test___repr__(self):
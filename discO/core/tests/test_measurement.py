@@ -6,6 +6,8 @@ __all__ = [
     "Test_MeasurementErrorSampler",
     "Test_RVS_ContinuousMeasurementErrorSampler",
     "Test_GaussianMeasurementError",
+    "Test_CovarianceMeasurementError",
+    "Test_ObservableMeasurementError",
 ]
 
 
@@ -27,6 +29,7 @@ from astropy.coordinates import concatenate
 
 # PROJECT-SPECIFIC
 from discO.core import measurement
+from discO.core.sample import SampleArrays
 from discO.core.tests.test_common import Test_CommonBase as CommonBase_Test
 from discO.utils.coordinates import UnFrame
 
@@ -876,6 +879,120 @@ class Test_RVS_ContinuousMeasurementErrorSampler(
 
     # /def
 
+    def test___call__arrays(self):
+        """Test method ``__call__`` on sample arrays."""
+        c = coord.SkyCoord(
+            coord.ICRS(ra=self.c.ra, dec=self.c.dec, distance=[1, 2] * u.kpc),
+        )
+        c.mass = np.ones(2) * u.solMass
+        arrs = SampleArrays.from_coord(c)
+
+        # --------------------------
+        # Cartesian in the same frame: resampled directly
+
+        inst = self.obj(
+            rvs=scipy.stats.norm,
+            frame=coord.ICRS(),
+            representation_type=coord.CartesianRepresentation,
+        )
+        res = inst(arrs, c_err=0.1, random=0)
+        expected = inst(c, c_err=0.1, random=0)
+
+        assert isinstance(res, SampleArrays)
+        assert res.frame is arrs.frame
+        assert res.velocities is None
+        assert np.array_equal(res.masses, arrs.masses)
+        assert np.allclose(
+            res.positions.T,
+            expected.cartesian.xyz.to_value(u.kpc),
+        )
+
+        # percent error
+        res = inst(arrs, c_err=10 * u.percent, random=0)
+        expected = inst(c, c_err=10 * u.percent, random=0)
+        assert np.allclose(
+            res.positions.T,
+            expected.cartesian.xyz.to_value(u.kpc),
+        )
+
+        # --------------------------
+        # otherwise, through coordinates, which are Cartesian in kpc.
+
+        res = self.inst(arrs, c_err=0.1, random=0)
+        expected = self.inst(arrs.to_coord(), c_err=0.1, random=0)
+
+        assert isinstance(res, SampleArrays)
+        assert np.allclose(
+            res.positions.T,
+            expected.cartesian.xyz.to_value(u.kpc),
+        )
+        assert np.array_equal(res.masses, arrs.masses)
+
+    # /def
+
+    def test__run_batch(self):
+        """Test method ``_run_batch`` matches drawing each column in turn."""
+        rng = np.random.default_rng(0)
+        c = coord.SkyCoord(
+            coord.ICRS(
+                ra=rng.uniform(0, 360, (5, 3)) * u.deg,
+                dec=rng.uniform(-80, 80, (5, 3)) * u.deg,
+                distance=rng.uniform(1, 10, (5, 3)) * u.kpc,
+            ),
+        )
+        c.mass = np.ones((5, 3)) * u.solMass
+        c.potential = object()
+        errs = coord.SkyCoord(
+            coord.ICRS(
+                ra=rng.uniform(0.1, 1, (5, 3)) * u.deg,
+                dec=rng.uniform(0.1, 1, (5, 3)) * u.deg,
+                distance=rng.uniform(0.1, 1, (5, 3)) * u.kpc,
+            ),
+        )
+
+        def err(c):
+            return np.abs(c.data._values.view(np.float64).reshape(-1, 3)) / 20
+
+        c_errs = (
+            0.1,
+            10 * u.percent,
+            err,
+            errs[:, 0],  # the same for each column
+            errs,  # for each column
+        )
+        for c_err in c_errs:
+            res = self.inst.run(c, c_err=c_err, random=0, batch=True)
+            expected = self.inst.run(c, c_err=c_err, random=0, batch=False)
+
+            assert res.shape == c.shape
+            assert res.mass is c.mass
+            assert res.potential is c.potential
+            for i, column in enumerate(expected):
+                assert np.allclose(
+                    res[:, i].cartesian.xyz,
+                    column.cartesian.xyz,
+                )
+
+        # --------------------------
+        # sample arrays
+
+        arrs = SampleArrays.from_coord(c)
+        inst = self.obj(
+            rvs=scipy.stats.norm,
+            frame=coord.ICRS(),
+            representation_type=coord.CartesianRepresentation,
+        )
+        for inst in (inst, self.inst):  # directly, & through coordinates
+            res = inst.run(arrs, c_err=0.1, random=0, batch=True)
+            expected = inst.run(arrs, c_err=0.1, random=0, batch=False)
+
+            assert isinstance(res, SampleArrays)
+            assert np.array_equal(res.masses, arrs.masses)
+            for i, column in enumerate(expected):
+                assert np.allclose(res.positions[:, i], column.positions)
+
+    # /def
+
     # --------------------------------------------------------------
 
     @abstractmethod
@@ -937,11 +1054,11 @@ class Test_RVS_ContinuousMeasurementErrorSampler(
         assert res.shape == c.shape
         assert np.allclose(
             res.ra.value,
-            np.array([[1.17640523, 1.44817864], [2.09500884, 2.0821197]]),
+            np.array([[1.17640523, 2.09500884], [1.44817864, 2.0821197]]),
         )
         assert np.allclose(
             res.dec.value,
-            np.array([[2.08003144, 2.5602674], [2.96972856, 3.04321307]]),
+            np.array([[2.08003144, 2.96972856], [2.5602674, 3.04321307]]),
         )
 
         # ---------------
@@ -965,11 +1082,11 @@ class Test_RVS_ContinuousMeasurementErrorSampler(
         assert res.shape == c.shape
         assert np.allclose(
             res.ra.value,
-            np.array([[1.17640523, 1.22408932], [2.19001768, 2.0821197]]),
+            np.array([[1.17640523, 2.19001768], [1.22408932, 2.0821197]]),
         )
         assert np.allclose(
             res.dec.value,
-            np.array([[2.08003144, 2.3735116], [2.95459284, 3.04321307]]),
+            np.array([[2.08003144, 2.95459284], [2.3735116, 3.04321307]]),
         )
 
         # ---------------
@@ -979,11 +1096,11 @@ class Test_RVS_ContinuousMeasurementErrorSampler(
         assert res.shape == c.shape
         assert np.allclose(
             res.ra.value,
-            np.array([[1.01764052, 1.02240893], [2.01900177, 2.00821197]]),
+            np.array([[1.01764052, 2.01900177], [1.02240893, 2.00821197]]),
         )
         assert np.allclose(
             res.dec.value,
-            np.array([[2.00800314, 2.03735116], [2.99545928, 3.00432131]]),
+            np.array([[2.00800314, 2.99545928], [2.03735116, 3.00432131]]),
         )
 
         # ---------------
@@ -1147,11 +1264,11 @@ class Test_GaussianMeasurementError(
         assert res.shape == c.shape
         assert np.allclose(
             res.ra.value,
-            np.array([[1.17640523, 1.44817864], [2.09500884, 2.0821197]]),
+            np.array([[1.17640523, 2.09500884], [1.44817864, 2.0821197]]),
         )
         assert np.allclose(
             res.dec.value,
-            np.array([[2.08003144, 2.5602674], [2.96972856, 3.04321307]]),
+            np.array([[2.08003144, 2.96972856], [2.5602674, 3.04321307]]),
         )
 
         # ---------------
@@ -1175,11 +1292,11 @@ class Test_GaussianMeasurementError(
         assert res.shape == c.shape
         assert np.allclose(
             res.ra.value,
-            np.array([[1.17640523, 1.22408932], [2.19001768, 2.0821197]]),
+            np.array([[1.17640523, 2.19001768], [1.22408932, 2.0821197]]),
         )
         assert np.allclose(
             res.dec.value,
-            np.array([[2.08003144, 2.3735116], [2.95459284, 3.04321307]]),
+            np.array([[2.08003144, 2.95459284], [2.3735116, 3.04321307]]),
         )
 
         # ---------------
@@ -1189,11 +1306,11 @@ class Test_GaussianMeasurementError(
         assert res.shape == c.shape
         assert np.allclose(
             res.ra.value,
-            np.array([[1.01764052, 1.02240893], [2.01900177, 2.00821197]]),
+            np.array([[1.01764052, 2.01900177], [1.02240893, 2.00821197]]),
         )
         assert np.allclose(
             res.dec.value,
-            np.array([[2.00800314, 2.03735116], [2.99545928, 3.00432131]]),
+            np.array([[2.00800314, 2.99545928], [2.03735116, 3.00432131]]),
         )
 
         # ---------------
@@ -1204,6 +1321,383 @@ class Test_GaussianMeasurementError(
 
     # /def
 
+    def test__draw(self):
+        """Test method ``_draw`` matches :func:`scipy.stats.norm.rvs`."""
+        loc = np.arange(12.0).reshape(4, 3)
+        scale = np.linspace(0.1, 1, 3)
+
+        for make in (np.random.RandomState, np.random.default_rng):
+            got = self.inst._draw(loc, scale, random=make(0))
+            expected = scipy.stats.norm.rvs(
+                loc=loc,
+                scale=scale,
+                size=loc.shape,
+                random_state=make(0),
+            )
+            assert got.shape == loc.shape
+            assert np.array_equal(got, expected)
+
+        with pytest.raises(ValueError, match="scale must be >= 0."):
+            self.inst._draw(loc, -scale, random=np.random.default_rng(0))
+
+    # /def
+
+
+# /class
+
+# -------------------------------------------------------------------
+
+
+class Test_CovarianceMeasurementError:
+    """Test :class:`~discO.core.measurement.CovarianceMeasurementError`."""
+
+    @classmethod
+    def setup_class(cls):
+        """Setup fixtures for testing."""
+        cls.obj = measurement.CovarianceMeasurementError
+
+        # correlated covariances, one per point
+        A = np.random.RandomState(0).normal(size=(3, 3, 3))
+        cls.cov = A @ np.swapaxes(A, 1, 2) / 10 + np.eye(3) / 100
+
+        cls.c = coord.SkyCoord(
+            coord.ICRS(
+                coord.CartesianRepresentation(
+                    np.arange(9.0).reshape(3, 3) * u.kpc,
+                ),
+            ),
+        )
+        cls.arrs = SampleArrays.from_coord(cls.c)
+
+        cls.inst = cls.obj(
+            c_err=cls.cov,
+            frame="icrs",
+            representation_type="cartesian",
+        )
+
+    # /def
+
+    def test___new__(self):
+        """Test method ``__new__`` is in the registry."""
+        msamp = measurement.MeasurementErrorSampler(
+            c_err=self.cov,
+            method="covariance",
+            representation_type="cartesian",
+        )
+        assert isinstance(msamp, self.obj)
+        assert isinstance(msamp, measurement.GaussianMeasurementError)
+
+    # /def
+
+    def test__draw(self):
+        """Test method ``_draw`` has the covariance."""
+        factors = np.linalg.cholesky(self.cov)
+        loc = np.zeros((20000, 3, 3))  # 20000 iterations of 3 points
+
+        got = self.inst._draw(loc, factors, random=np.random.default_rng(0))
+        assert got.shape == loc.shape
+        assert np.allclose(
+            np.einsum("ink,inl->nkl", got, got) / len(got),
+            self.cov,
+            atol=0.05,
+        )
+
+        # flat, with the same draws
+        got2 = self.inst._draw(
+            loc.reshape(-1, 3),
+            factors,
+            random=np.random.default_rng(0),
+        )
+        assert np.array_equal(got2, got.reshape(-1, 3))
+
+        # a shared covariance, with a RandomState
+        got = self.inst._draw(
+            loc.reshape(-1, 3),
+            factors[0],
+            random=np.random.RandomState(0),
+        )
+        assert np.allclose(got.T @ got / len(got), self.cov[0], atol=0.05)
+
+        with pytest.raises(TypeError, match="unexpected parameters"):
+            self.inst._draw(loc, factors, random=None, moments="m")
+
+    # /def
+
+    def test__cholesky(self):
+        """Test method ``_cholesky``."""
+        factors = self.inst._cholesky(self.cov, 3, 3)
+        assert np.allclose(factors @ np.swapaxes(factors, 1, 2), self.cov)
+
+        # cached
+        assert self.inst._cholesky(self.cov, 6, 3) is factors
+        assert self.inst._cholesky(self.cov.copy(), 3, 3) is not factors
+
+        with pytest.raises(ValueError, match="must have shape"):
+            self.inst._cholesky(self.cov, 4, 3)
+        with pytest.raises(ValueError, match="must have shape"):
+            self.inst._cholesky(self.cov[:, :2, :2], 3, 3)
+        with pytest.raises(ValueError, match="positive-definite"):
+            self.inst._cholesky(-self.cov, 3, 3)
+
+    # /def
+
+    def test__parse_c_err(self):
+        """Test method ``_parse_c_err``."""
+        factors = self.inst._parse_c_err(None, self.c)
+        assert np.allclose(factors @ np.swapaxes(factors, 1, 2), self.cov)
+
+        # callable
+        factors = self.inst._parse_c_err(lambda c: self.cov[0], self.c)
+        assert np.allclose(factors @ factors.T, self.cov[0])
+
+        with pytest.raises(TypeError, match="must be a covariance array"):
+            self.inst._parse_c_err(self.c, self.c)
+        with pytest.raises(TypeError, match="must be a covariance array"):
+            self.inst._parse_c_err(self.cov * u.kpc ** 2, self.c)
+
+    # /def
+
+    def test_run(self):
+        """Test method ``run``, batched and iterated."""
+        c = concatenate([self.c, self.c]).reshape(2, -1).T
+        arrs = SampleArrays.from_coord(c)
+
+        # coordinates
+        res = self.inst.run(c, random=0, batch=True)
+        res2 = list(self.inst.run(c, random=0, progress=False))
+        assert res.shape == c.shape
+        assert np.allclose(
+            res.cartesian.xyz,
+            concatenate(res2).reshape(2, -1).T.cartesian.xyz,
+        )
+
+        # arrays, the same draws
+        res3 = self.inst.run(arrs, random=0, batch=True)
+        assert res3.shape == c.shape
+        xyz = res.cartesian.xyz.to_value(u.kpc)
+        assert np.allclose(res3.positions, np.moveaxis(xyz, 0, -1))
+
+        # a callable is evaluated on each column
+        res4 = self.inst.run(
+            c,
+            c_err=lambda c: self.cov,
+            random=0,
+            batch=True,
+        )
+        assert np.allclose(res4.cartesian.xyz, res.cartesian.xyz)
+
+        # one column
+        res5 = self.inst(self.arrs, random=0)
+        assert res5.shape == self.arrs.shape
+        assert res5.velocities is None
+
+    # /def
+
+
+# /class
+
+# -------------------------------------------------------------------
+
+
+class Test_ObservableMeasurementError:
+    """Test :class:`~discO.core.measurement.ObservableMeasurementError`."""
+
+    @classmethod
+    def setup_class(cls):
+        """Setup fixtures for testing."""
+        cls.obj = measurement.ObservableMeasurementError
+
+        random = np.random.RandomState(0)
+        cls.c = coord.SkyCoord(
+            coord.Galactocentric(
+                coord.CartesianRepresentation(
+                    random.normal(size=(3, 4)) * u.kpc,
+                    differentials=coord.CartesianDifferential(
+                        random.normal(size=(3, 4)) * 100 * u.km / u.s,
+                    ),
+                ),
+            ),
+        )
+        cls.c.mass = np.ones(4) * u.Msun
+        cls.arrs = SampleArrays.from_coord(cls.c)
+
+        cls.c_err = dict(
+            parallax=10 * u.percent,
+            pm_ra_cosdec=0.1 * u.mas / u.yr,
+            radial_velocity=np.ones(4),  # km / s
+        )
+        cls.inst = cls.obj(c_err=cls.c_err)
+
+    # /def
+
+    def test___init__(self):
+        """Test method ``__init__``."""
+        msamp = measurement.MeasurementErrorSampler(
+            c_err=self.c_err,
+            method="observable",
+        )
+        assert isinstance(msamp, self.obj)
+        assert msamp.frame == coord.ICRS()
+        assert msamp.representation_type is coord.CartesianRepresentation
+
+        with pytest.raises(ValueError, match="need a `frame`"):
+            self.obj(c_err=self.c_err, frame=None)
+
+    # /def
+
+    def test__to_observables(self):
+        """Test method ``_to_observables`` matches Astropy."""
+        c = self.c.transform_to(coord.ICRS())
+        arrs = SampleArrays.from_coord(c)
+        obs = self.obj._to_observables(arrs.positions, arrs.velocities)
+
+        c.representation_type = coord.SphericalRepresentation
+        c.differential_type = coord.SphericalCosLatDifferential
+        assert np.allclose(np.cos(obs["ra"]), np.cos(c.ra))
+        assert np.allclose(np.sin(obs["ra"]), np.sin(c.ra))
+        assert np.allclose(obs["dec"], c.dec.to_value(u.rad))
+        assert np.allclose(1 / obs["parallax"], c.distance.to_value(u.kpc))
+        for name in ("pm_ra_cosdec", "pm_dec", "radial_velocity"):
+            unit = self.obj.units[name]
+            assert np.allclose(obs[name], getattr(c, name).to_value(unit))
+
+        # without velocities
+        obs = self.obj._to_observables(arrs.positions, None)
+        assert set(obs) == {"ra", "dec", "parallax"}
+
+    # /def
+
+    def test__from_observables(self):
+        """Test method ``_from_observables`` inverts ``_to_observables``."""
+        obs = self.obj._to_observables(
+            self.arrs.positions,
+            self.arrs.velocities,
+        )
+        positions, velocities = self.obj._from_observables(obs)
+        assert np.allclose(positions, self.arrs.positions)
+        assert np.allclose(velocities, self.arrs.velocities)
+
+        # without velocities
+        obs = self.obj._to_observables(self.arrs.positions, None)
+        positions, velocities = self.obj._from_observables(obs)
+        assert np.allclose(positions, self.arrs.positions)
+        assert velocities is None
+
+        # past the pole, and a negative parallax
+        obs = dict(ra=np.zeros(1), dec=np.array([np.pi]), parallax=-np.ones(1))
+        positions, velocities = self.obj._from_observables(obs)
+        assert np.allclose(positions, [[-1, 0, 0]])
+
+    # /def
+
+    def test__parse_c_err(self):
+        """Test method ``_parse_c_err``."""
+        obs = self.obj._to_observables(
+            self.arrs.positions,
+            self.arrs.velocities,
+        )
+        scales = self.inst._parse_c_err(
+            dict(self.c_err, ra=3.6e-3, dec=1 * u.mas),
+            obs,
+        )
+        assert list(scales) == [
+            "ra",
+            "dec",
+            "parallax",
+            "pm_ra_cosdec",
+            "radial_velocity",
+        ]
+        assert np.allclose(scales["ra"], np.deg2rad(3.6e-3))
+        assert np.allclose(scales["dec"], (1 * u.mas).to_value(u.rad))
+        assert np.allclose(scales["parallax"], obs["parallax"] / 10)
+        assert np.allclose(scales["pm_ra_cosdec"], 0.1)
+        assert np.array_equal(scales["radial_velocity"], np.ones(4))
+
+        # velocities are skipped without velocities
+        obs = self.obj._to_observables(self.arrs.positions, None)
+        assert list(self.inst._parse_c_err(self.c_err, obs)) == ["parallax"]
+
+        with pytest.raises(TypeError, match="must be a mapping"):
+            self.inst._parse_c_err(0.1, obs)
+        with pytest.raises(ValueError, match="are not in"):
+            self.inst._parse_c_err(dict(distance=0.1), obs)
+
+    # /def
+
+    def test___call__(self):
+        """Test method ``__call__``."""
+        res = self.inst(self.c, random=0)
+        assert isinstance(res, coord.SkyCoord)
+        assert res.shape == self.c.shape
+        assert res.frame.is_equivalent_frame(coord.ICRS())
+        assert np.array_equal(res.mass, self.c.mass)
+
+        # the same for arrays
+        arrs = self.inst(self.arrs, random=0)
+        assert isinstance(arrs, SampleArrays)
+        assert np.allclose(
+            arrs.positions,
+            np.moveaxis(res.cartesian.xyz.to_value(u.kpc), 0, -1),
+        )
+        assert np.allclose(
+            arrs.velocities,
+            np.moveaxis(res.velocity.d_xyz.to_value(u.km / u.s), 0, -1),
+        )
+
+        # only the observables with errors are perturbed
+        expected = self.c.transform_to(coord.ICRS())
+        for crd in (res, expected):
+            crd.representation_type = coord.SphericalRepresentation
+            crd.differential_type = coord.SphericalCosLatDifferential
+        assert not np.allclose(res.distance, expected.distance)
+        assert np.allclose(res.dec, expected.dec)
+        assert not np.allclose(res.radial_velocity, expected.radial_velocity)
+        assert np.allclose(res.pm_dec, expected.pm_dec)
+
+        # a callable
+        res2 = self.inst(self.c, c_err=lambda c: self.c_err, random=0)
+        assert np.allclose(res2.cartesian.xyz, res.cartesian.xyz)
+
+        with pytest.raises(ValueError, match="there are no errors."):
+            self.obj()(self.c)
+
+    # /def
+
+    def test_run(self):
+        """Test method ``run``, batched and iterated."""
+        c = concatenate([self.c, self.c]).reshape(2, -1).T
+        c.mass = np.ones(c.shape) * u.Msun
+        arrs = SampleArrays.from_coord(c)
+
+        for samp in (c, arrs):
+            res = self.inst.run(samp, random=0, batch=True)
+            res2 = list(self.inst.run(samp, random=0, progress=False))
+            assert res.shape == c.shape
+
+            if isinstance(samp, SampleArrays):
+                assert np.allclose(
+                    res.positions,
+                    np.stack([r.positions for r in res2], axis=1),
+                )
+                assert np.array_equal(res.masses, arrs.masses)
+            else:
+                assert np.allclose(
+                    res.cartesian.xyz,
+                    concatenate(res2).reshape(2, -1).T.cartesian.xyz,
+                )
+                assert np.array_equal(res.mass, c.mass)
+
+        # a callable is evaluated on each column
+        res3 = self.inst.run(
+            arrs,
+            c_err=lambda c: self.c_err,
+            random=0,
+            batch=True,
+        )
+        assert np.allclose(res3.positions, res.positions)
+
+    # /def
+
 
 # /class
 
@@ -5,12 +5,17 @@
 __all__ = [
     "Test_Pipeline",
     "Test_PipelineResult",
+    "Test_ColumnarPipelineResult",
 ]
 
 
 ##############################################################################
 # IMPORTS
 
+# BUILT-IN
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 # THIRD PARTY
 import astropy.coordinates as coord
 import astropy.units as u
@@ -23,6 +28,7 @@ from discO.core.fitter import PotentialFitter
 from discO.core.measurement import MeasurementErrorSampler
 from discO.core.sample import PotentialSampler
 from discO.core.wrapper import PotentialWrapper
+from discO.utils.vectorfield import CartesianVectorField
 
 ##############################################################################
 # PYTEST
@@ -97,8 +103,9 @@ class MockSampler(PotentialSampler):
         self, n, *, frame=None, representation_type=None, random=None, **kwargs
     ):
         # Get preferred frames
-        frame = self._infer_frame(frame)
-        representation_type = self._infer_representation(representation_type)
+        frame = self.frame if frame is None else frame
+        if representation_type is None:
+            representation_type = self.representation_type
 
         if random is None:
             random = np.random
@@ -106,9 +113,10 @@ class MockSampler(PotentialSampler):
             random = np.random.default_rng(random)
 
         # return
-        rep = coord.UnitSphericalRepresentation(
+        rep = coord.SphericalRepresentation(
             lon=random.uniform(size=n) * u.deg,
             lat=2 * random.uniform(size=n) * u.deg,
+            distance=10 * u.kpc,
         )
 
         if representation_type is None:
@@ -129,6 +137,36 @@ class MockSampler(PotentialSampler):
 # /class
 
 
+class MockFit:
+    """Fit with coefficients, which can be rebuilt from them."""
+
+    def __init__(self, Acos, kind="mock"):
+        self.Acos = Acos
+        self.kind = kind
+
+    def coefficients(self):
+        return dict(type=self.kind, Acos=self.Acos, amp=2.0)
+
+    def with_coefficients(self, coefficients):
+        return MockFit(coefficients["Acos"], coefficients["type"])
+
+
+# /class
+
+
+class MockFitter(PotentialFitter):
+    """Fitter that, unlike one defined in a function, can be pickled."""
+
+    def __call__(self, c, **kwargs):
+        c.represent_as(coord.CartesianRepresentation)
+        return PotentialWrapper(object(), frame=self.frame)
+
+    # /def
+
+
+# /class
+
+
 ##############################################################################
 # TESTS
 ##############################################################################
@@ -420,6 +458,273 @@ class Test_Pipeline(object):
 
     # /def
 
+    @pytest.mark.parametrize("batch", [False, True])
+    def test_run_parallel(self, batch):
+        """Test method ``run`` distributing the iterations."""
+        expected = self.inst.run(10, 4, random=0, n_jobs=1, batch=True)
+
+        # the results don't depend on the executor
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            res = self.inst.run(
+                10,
+                4,
+                random=0,
+                executor=executor,
+                batch=batch,
+            )
+            res = res if batch else list(res)
+
+        assert len(res) == 4
+        for got, exp in zip(res, expected):  # in iteration order
+            assert np.array_equal(got.sample.x, exp.sample.x)
+            assert np.array_equal(got.measured.ra, exp.measured.ra)
+
+        # each iteration has its own random state
+        assert not np.array_equal(expected[0].sample.x, expected[1].sample.x)
+
+    # /def
+
+    def test_run_processes(self):
+        """Test method ``run`` distributing the iterations over processes."""
+        # the pipeline is pickled to the workers, so has picklable parts
+        pipe = pipeline.Pipeline(
+            sampler=MockSampler(
+                PotentialWrapper(object(), frame="galactocentric"),
+                frame="galactocentric",
+                representation_type="cartesian",
+                total_mass=10 * u.solMass,
+            ),
+            measurer=self.measurer,
+            fitter=MockFitter(
+                object(),
+                frame="galactocentric",
+                representation_type="cartesian",
+            ),
+        )
+
+        expected = pipe.run(10, 4, random=0, n_jobs=1, batch=True)
+        res = pipe.run(10, 4, random=0, n_jobs=2, batch=True)
+
+        assert len(res) == 4
+        assert res._parent is pipe
+        for got, exp in zip(res, expected):  # in iteration order
+            assert np.array_equal(got.sample.x, exp.sample.x)
+            assert np.array_equal(got.measured.ra, exp.measured.ra)
+            assert isinstance(got.fit, PotentialWrapper)
+            assert isinstance(got.fit.frame, coord.Galactocentric)
+
+    # /def
+
+    @pytest.mark.parametrize("queue_size", [1, 3, dict(fit=2)])
+    @pytest.mark.parametrize("batch", [False, True])
+    def test_run_stream(self, batch, queue_size):
+        """Test method ``run``, overlapping the stages."""
+        expected = self.inst.run(10, 4, random=0, n_jobs=1, batch=True)
+
+        res = self.inst.run(
+            10,
+            4,
+            random=0,
+            stream=True,
+            queue_size=queue_size,
+            batch=batch,
+        )
+        res = res if batch else list(res)
+
+        # the same as the serial run, in order
+        assert len(res) == 4
+        for got, exp in zip(res, expected):
+            assert np.array_equal(got.sample.x, exp.sample.x)
+            assert np.array_equal(got.measured.ra, exp.measured.ra)
+            assert isinstance(got.fit, PotentialWrapper)
+
+        assert self.inst._result[0].sample is res[-1].sample
+
+    # /def
+
+    @pytest.mark.parametrize("stream", [False, True])
+    def test_run_checkpoint(self, tmp_path, stream):
+        """Test method ``run``, checkpointing and resuming."""
+        path = tmp_path / "checkpoint.pkl"
+        expected = self.inst.run(10, 5, random=0, checkpoint=path, batch=True)
+
+        # the same as the serial run
+        serial = self.inst.run(10, 5, random=0, n_jobs=1, batch=True)
+        for got, exp in zip(serial, expected):
+            assert np.array_equal(got.sample.x, exp.sample.x)
+
+        # resume from an interrupted run, with a truncated final record
+        path = tmp_path / "interrupted.pkl"
+        gen = self.inst.run(10, 5, random=0, checkpoint=path, stream=stream)
+        next(gen), next(gen), next(gen)
+        gen.close()
+        with open(path, "r+b") as file:
+            file.truncate(path.stat().st_size - 10)
+
+        store = pipeline._PipelineCheckpoint(path)
+        assert len(store.rows) == 2
+
+        # the arrays are stored, with the metadata only in the first row
+        (row, meta), (_, other) = store.rows
+        assert isinstance(row["sample"], np.ndarray)
+        assert row["sample"].shape == (1, 10, 3)
+        assert isinstance(meta["sample"]["frame"], coord.Galactocentric)
+        assert other == {}
+
+        res = list(
+            self.inst.run(
+                10,
+                5,
+                random=None,  # restored from the checkpoint
+                checkpoint=path,
+                stream=not stream,  # doesn't change the results
+            ),
+        )
+        assert len(res) == 5
+        for got, exp in zip(res, expected):
+            # restored from Cartesian arrays
+            assert u.allclose(got.sample.x, exp.sample.x, rtol=1e-12)
+            assert u.allclose(got.measured.ra, exp.measured.ra, rtol=1e-12)
+            assert isinstance(got.fit, PotentialWrapper)
+
+        # and nothing left to do, also when batched
+        assert len(pipeline._PipelineCheckpoint(path).rows) == 5
+        res = self.inst.run(10, 5, checkpoint=path, batch=True)
+        assert u.allclose(res[-1].sample.x, expected[-1].sample.x)
+
+        # won't replay the iterations of another run
+        for kw in (
+            dict(n_or_sample=11),
+            dict(iterations=4),
+            dict(start=1),
+            dict(stop=4),
+            dict(c_err=2 * u.percent),
+            dict(observable="potential"),
+            dict(total_mass=5 * u.solMass),
+            dict(Nmax=3),  # e.g. fitter options
+        ):
+            kw = dict(dict(n_or_sample=10, iterations=5), **kw)
+            with pytest.raises(ValueError, match="checkpoint of another run"):
+                list(self.inst.run(checkpoint=path, progress=False, **kw))
+
+        # won't overwrite other files
+        path = tmp_path / "other.txt"
+        path.write_text("not a checkpoint")
+        with pytest.raises(ValueError, match="not a pipeline checkpoint"):
+            self.inst.run(10, 2, checkpoint=path, batch=True)
+
+    # /def
+
+    def test_run_generator(self, tmp_path):
+        """Test method ``run`` with a Generator."""
+        expected = self.inst.run(
+            10,
+            4,
+            random=np.random.default_rng(0),
+            n_jobs=1,
+            batch=True,
+        )
+
+        # per-iteration streams don't depend on the executor
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            res = self.inst.run(
+                10,
+                4,
+                random=np.random.SeedSequence(0),  # same as default_rng(0)
+                executor=executor,
+                batch=True,
+            )
+        for got, exp in zip(res, expected):
+            assert np.array_equal(got.sample.x, exp.sample.x)
+            assert np.array_equal(got.measured.ra, exp.measured.ra)
+
+        assert not np.array_equal(expected[0].sample.x, expected[1].sample.x)
+
+        # and are restored from a checkpoint
+        path = tmp_path / "checkpoint.pkl"
+        gen = self.inst.run(
+            10,
+            4,
+            random=np.random.default_rng(0),
+            checkpoint=path,
+        )
+        next(gen)
+        gen.close()
+
+        res = list(self.inst.run(10, 4, checkpoint=path))
+        for got, exp in zip(res, expected):
+            assert np.array_equal(got.sample.x, exp.sample.x)
+
+    # /def
+
+    @pytest.mark.parametrize(
+        "random",
+        [0, np.random.SeedSequence(0)],
+    )
+    def test_run_start_stop(self, random):
+        """Test method ``run``, sharding the iterations."""
+        expected = self.inst.run(10, 5, random=random, n_jobs=1, batch=True)
+
+        # shards are the same slices of the full run
+        first = self.inst.run(10, 5, random=random, stop=2, batch=True)
+        second = self.inst.run(
+            10,
+            5,
+            random=random,
+            start=2,
+            stream=True,
+            batch=True,
+            columnar=True,
+        )
+        assert len(first) == 2 and len(second) == 3
+
+        got = [first[i] for i in range(2)] + [second[i] for i in range(3)]
+        for res, exp in zip(got, expected):
+            assert np.allclose(res.sample.x, exp.sample.x)
+
+        # an empty shard
+        assert len(self.inst.run(10, 5, random=0, start=5, batch=True)) == 0
+
+    # /def
+
+    def test_run_stream_stops(self):
+        """Test the streaming stages stop, on error or when closed."""
+
+        def n_stages():
+            return len(
+                [
+                    t
+                    for t in threading.enumerate()
+                    if t.name.startswith("discO-pipeline")
+                ],
+            )
+
+        # closing early
+        gen = self.inst.run(10, 20, stream=True, progress=False)
+        next(gen)
+        assert n_stages() > 0
+        gen.close()
+        assert n_stages() == 0
+
+        # errors are raised in order
+        gen = self.inst.run([10, "a", 10], stream=True, progress=False)
+        next(gen)
+        with pytest.raises(TypeError):
+            next(gen)
+        assert n_stages() == 0
+
+        # bad inputs
+        with pytest.raises(ValueError, match="stream and distribute"):
+            self.inst.run(10, 2, stream=True, n_jobs=2, batch=True)
+
+        with pytest.raises(ValueError, match="stages must be in"):
+            self.inst.run(10, 2, stream=True, queue_size=dict(a=1), batch=True)
+
+        with pytest.raises(ValueError, match="must be >= 1"):
+            self.inst.run(10, 2, stream=True, queue_size=0, batch=True)
+
+    # /def
+
     def test___repr__(self):
         """Test method ``__repr__``."""
         s = self.inst.__repr__()
@@ -546,5 +851,253 @@ class Test_PipelineResult(object):
 # /class
 
 
+#####################################################################
+
+
+class Test_ColumnarPipelineResult(object):
+    @classmethod
+    def setup_class(cls):
+        """Setup fixtures for testing."""
+        Test_Pipeline.setup_class(cls)
+        cls.pipe = cls.inst
+
+        cls.results = cls.pipe.run(10, 3, random=0, n_jobs=1, batch=True)
+        cls.inst = pipeline.ColumnarPipelineResult.from_results(cls.results)
+
+    # /def
+
+    #######################################################
+    # Method tests
+
+    def test___init__(self):
+        """Test method ``__init__``."""
+        res = pipeline.ColumnarPipelineResult(self.pipe, 4)
+
+        assert res._parent is self.pipe
+        assert res.iterations == len(res) == 4
+        assert res.sample_array is None
+        assert res.statistic is None
+        assert res.fit.shape == (4,)
+
+    # /def
+
+    def test_columns(self):
+        """Test the dense columns."""
+        assert self.inst.sample_array.shape == (3, 10, 3)  # no velocities
+        assert self.inst.measured_array.shape == (3, 10, 3)
+        assert self.inst.sample_mass.shape == (3, 10)
+        assert self.inst.units["sample"] == (u.kpc,)
+
+        for i, result in enumerate(self.results):
+            xyz = result.sample.cartesian.get_xyz(xyz_axis=1)
+            assert np.allclose(self.inst.sample_array[i, :, :3], xyz.value)
+
+        # no coefficients, residual or statistic
+        assert self.inst.coefficients == {}
+        assert self.inst.residual_array is None
+        assert self.inst.statistic is None
+
+    # /def
+
+    def test___getitem__(self):
+        """Test method ``__getitem__``, building views."""
+        for i in (0, -1):
+            got, expected = self.inst[i], self.results[i]
+
+            assert isinstance(got, np.record)
+            assert isinstance(got.sample, coord.SkyCoord)
+            assert isinstance(got.sample.frame, coord.Galactocentric)
+            assert got.sample.representation_type is (
+                expected.sample.representation_type
+            )
+            assert np.allclose(got.sample.x, expected.sample.x)
+            assert np.all(got.sample.mass == expected.sample.mass)
+
+            assert isinstance(got.measured.frame, coord.ICRS)
+            assert np.allclose(got.measured.ra, expected.measured.ra)
+
+            assert got.fit is expected.fit
+            assert got.residual is None
+
+        with pytest.raises(IndexError):
+            self.inst[3]
+
+        with pytest.raises(ValueError, match="field must be one of"):
+            self.inst.get("not it", 0)
+
+    # /def
+
+    def test_to_recarray(self):
+        """Test method ``to_recarray``."""
+        res = self.inst.to_recarray()
+
+        assert isinstance(res, pipeline.PipelineResult)
+        assert res._parent is self.pipe
+        assert len(res) == 3
+        assert np.allclose(res[1].sample.x, self.results[1].sample.x)
+
+    # /def
+
+    def test_velocities(self):
+        """Test samples with velocities."""
+        res = pipeline.ColumnarPipelineResult(self.pipe, 2)
+
+        sample = coord.SkyCoord(
+            x=[1, 2] * u.kpc,
+            y=[3, 4] * u.kpc,
+            z=[5, 6] * u.kpc,
+            v_x=[7, 8] * u.km / u.s,
+            v_y=[9, 10] * u.km / u.s,
+            v_z=[11, 12] * u.km / u.s,
+            frame="galactocentric",
+            representation_type="cartesian",
+        )
+        sample.mass = [1, 2] * u.solMass
+        res[1] = (sample, None, None, None, None)
+
+        assert res.sample_array.shape == (2, 2, 6)
+        assert np.all(np.isnan(res.sample_array[0]))
+        assert np.allclose(res.sample_array[1, 0, 3:], [7, 9, 11])
+        assert res.units["sample"] == (u.kpc, u.km / u.s)
+
+        got = res[1].sample
+        assert np.allclose(got.v_z, sample.v_z)
+        assert np.all(got.mass == sample.mass)
+
+    # /def
+
+    def test_no_mass(self):
+        """Test samples without masses, and with other sizes."""
+        res = pipeline.ColumnarPipelineResult(self.pipe, 2)
+
+        sample = coord.SkyCoord(
+            x=[1, 2] * u.kpc,
+            y=[3, 4] * u.kpc,
+            z=[5, 6] * u.kpc,
+            frame="galactocentric",
+            representation_type="cartesian",
+        )
+        res[0] = (sample, None, None, None, None)
+
+        assert np.allclose(res.sample_array[0, :, 0], [1, 2])
+        assert np.all(np.isnan(res.sample_mass))
+
+        with pytest.raises(ValueError, match="has 3 points"):
+            res[1] = (coord.concatenate([sample, sample[:1]]),) + (None,) * 4
+
+    # /def
+
+    def test_fit_coefficients(self):
+        """Test fits are stored as coefficients, and rebuilt on access."""
+        res = pipeline.ColumnarPipelineResult(self.pipe, 3)
+        for i in (0, 2):
+            res[i] = (None, None, MockFit(np.full((2, 2), i)), None, None)
+
+        assert "fit" not in res._columns  # no objects per iteration
+        assert res._meta["fit"]["template"].Acos[0, 0] == 0
+        assert res.coefficients["type"] == "mock"
+        assert res.coefficients["Acos"].shape == (3, 2, 2)
+        assert np.all(res.coefficients["amp"][[0, 2]] == 2)
+
+        got = res[2].fit
+        assert isinstance(got, MockFit)
+        assert np.all(got.Acos == 2)
+        assert res.get("fit", 1) is None  # not set
+        assert [fit is None for fit in res.fit] == [False, True, False]
+
+    # /def
+
+    def test_rows(self):
+        """Test getting and setting the columns of an iteration."""
+        res = pipeline.ColumnarPipelineResult(self.pipe, 2)
+        res[1] = (
+            self.results[0].sample,
+            None,
+            MockFit(np.ones((2, 2))),
+            "a",
+            1 * u.km,
+        )
+
+        row = res._get_row(1)
+        assert row["sample"].shape == (1, 10, 3)
+        assert row["statistic"].unit == u.km
+        assert row["coefficients"]["Acos"].shape == (1, 2, 2)
+
+        new = pipeline.ColumnarPipelineResult(self.pipe, 3)
+        new._meta.update(res._meta)
+        new._set_row(2, row)
+
+        assert np.array_equal(new.sample_array[2], res.sample_array[1])
+        assert np.all(np.isnan(new.sample_array[:2]))
+        assert new.get("residual", 2) == "a"
+        assert new.get("residual", 0) is None
+        assert new.statistic[2] == 1 * u.km
+        assert np.all(new[2].fit.Acos == 1)
+        assert new[0].fit is None
+
+    # /def
+
+    def test_residual_statistic(self):
+        """Test vector-field residuals and statistics."""
+        res = pipeline.ColumnarPipelineResult(self.pipe, 2)
+        points = coord.CartesianRepresentation(
+            [[1, 2], [3, 4], [5, 6]] * u.kpc
+        )
+
+        for i in range(2):
+            residual = CartesianVectorField(
+                points,
+                vf_x=[i, 1] * u.km / u.s ** 2,
+                vf_y=[2, 3] * u.km / u.s ** 2,
+                vf_z=[4, 5] * u.km / u.s ** 2,
+            ).represent_as(coord.SphericalRepresentation)
+            fields = (None, None, None, residual, i * u.km / u.s ** 2)
+            res[i] = fields
+
+        assert res.residual_array.shape == (2, 3, 2)
+        assert np.allclose(res.residual_array[:, 0, 0].value, [0, 1])
+        assert np.all(res.statistic == [0, 1] * u.km / u.s ** 2)
+
+        got = res[1].residual
+        assert got.__class__ is residual.__class__
+        assert np.allclose(got.to_cartesian().vf_x, [1, 1] * u.km / u.s ** 2)
+
+        # other kinds of statistics
+        res = pipeline.ColumnarPipelineResult(self.pipe, 2)
+        res[0] = (None, None, None, None, 1.5)
+        assert res.statistic.dtype == float
+        res = pipeline.ColumnarPipelineResult(self.pipe, 2)
+        res[0] = (None, None, None, None, "a")
+        assert res.statistic.dtype == object
+
+    # /def
+
+    def test_run(self):
+        """Test ``Pipeline.run`` gathering a columnar result."""
+        res = self.pipe.run(
+            10, 3, random=0, n_jobs=1, batch=True, columnar=True
+        )
+
+        assert isinstance(res, pipeline.ColumnarPipelineResult)
+        assert np.array_equal(res.sample_array, self.inst.sample_array)
+
+        with pytest.raises(ValueError, match="`columnar` requires `batch`"):
+            self.pipe.run(10, 3, columnar=True)
+
+    # /def
+
+    def test___repr__(self):
+        """Test method ``__repr__``."""
+        s = repr(self.inst)
+
+        assert s.startswith("ColumnarPipelineResult(iterations=3")
+        assert "sample(3, 10, 3)" in s
+
+    # /def
+
+
+# /class
+
+
 ##############################################################################
 # END
@@ -223,6 +223,18 @@ class Test_ResidualMethod(CommonBase_Test, obj=residual.ResidualMethod):
 
     # /def
 
+    def test_evaluate_potentials(self):
+        """Test method ``evaluate_potentials``."""
+        expected = self.inst.evaluate_potential(self.original_potential)
+        values = self.inst.evaluate_potentials([self.original_potential] * 2)
+
+        assert len(values) == 2
+        assert all([isinstance(v, expected.__class__) for v in values])
+
+        assert self.inst.evaluate_potentials([]) == []
+
+    # /def
+
     # -------------------------------
 
     def test___call__no_observable(self):
@@ -3,7 +3,9 @@
 """Testing :mod:`~discO.core.sample`."""
 
 __all__ = [
+    "Test_SampleArrays",
     "Test_PotentialSampler",
+    "Test_SnapshotSampler",
 ]
 
 
@@ -19,6 +21,7 @@ import astropy.coordinates as coord
 import astropy.units as u
 import numpy as np
 import pytest
+from astropy.table import QTable
 
 # PROJECT-SPECIFIC
 from discO.core import sample
@@ -46,6 +49,133 @@ class TestDF(object):
 ##############################################################################
 
 
+class Test_SampleArrays:
+    """Test :class:`~discO.core.sample.SampleArrays`."""
+
+    @classmethod
+    def setup_class(cls):
+        """Setup fixtures for testing."""
+        cls.frame = coord.Galactocentric()
+        cls.c = coord.SkyCoord(
+            cls.frame.realize_frame(
+                coord.CartesianRepresentation(
+                    np.arange(12.0).reshape(3, 4) * u.pc,
+                    differentials=coord.CartesianDifferential(
+                        np.arange(12.0).reshape(3, 4) * u.m / u.s,
+                    ),
+                ),
+            ),
+        )
+        cls.c.mass = np.arange(4.0) * u.Msun
+
+        cls.inst = sample.SampleArrays.from_coord(cls.c)
+
+    # /def
+
+    def test_from_coord(self):
+        """Test method ``from_coord`` converts to the fixed units."""
+        assert self.inst.shape == (4,)
+        assert self.inst.frame.is_equivalent_frame(self.frame)
+        assert np.allclose(
+            self.inst.positions,
+            np.arange(12.0).reshape(3, 4).T / 1e3,
+        )
+        assert np.allclose(
+            self.inst.velocities,
+            np.arange(12.0).reshape(3, 4).T / 1e3,
+        )
+        assert np.allclose(self.inst.masses, np.arange(4.0))
+
+        # no velocities, overriding mass
+        arrs = sample.SampleArrays.from_coord(
+            self.c.frame.realize_frame(
+                self.c.frame.data.without_differentials(),
+            ),
+            mass=1 * u.Msun,
+        )
+        assert arrs.velocities is None
+        assert np.array_equal(arrs.masses, np.ones(4))
+
+    # /def
+
+    def test_to_coord(self):
+        """Test method ``to_coord`` round-trips."""
+        c = self.inst.to_coord()
+        assert isinstance(c, coord.SkyCoord)
+        assert c.frame.is_equivalent_frame(self.frame)
+        assert np.allclose(c.cartesian.xyz, self.c.cartesian.xyz)
+        assert np.allclose(c.velocity.d_xyz, self.c.velocity.d_xyz)
+        assert np.allclose(c.mass, self.c.mass)
+
+        c = self.inst.to_coord("spherical")
+        assert c.representation_type is coord.SphericalRepresentation
+
+        with pytest.raises(ValueError, match="no frame"):
+            self.inst._replace(frame=None).to_coord()
+
+    # /def
+
+    def test_split_stack(self):
+        """Test methods ``split`` and ``stack``."""
+        assert self.inst.split() == [self.inst]
+
+        stacked = sample.SampleArrays.stack([self.inst, self.inst])
+        assert stacked.shape == (4, 2)
+        assert stacked.masses.shape == (4, 2)
+
+        split = stacked.split()
+        assert len(split) == 2
+        for arrs in split:
+            assert np.array_equal(arrs.positions, self.inst.positions)
+            assert np.array_equal(arrs.velocities, self.inst.velocities)
+            assert np.array_equal(arrs.masses, self.inst.masses)
+
+    # /def
+
+    def test_concatenate(self):
+        """Test method ``concatenate``."""
+        joined = sample.SampleArrays.concatenate([self.inst, self.inst])
+        assert joined.shape == (8,)
+        assert joined.frame is self.inst.frame
+        assert np.array_equal(joined.positions[4:], self.inst.positions)
+        assert np.array_equal(joined.velocities[:4], self.inst.velocities)
+        assert np.array_equal(joined.masses[4:], self.inst.masses)
+
+    # /def
+
+    def test_transform_to(self):
+        """Test method ``transform_to``."""
+        assert self.inst.transform_to(coord.Galactocentric()) is self.inst
+
+        # a static transformation, applied to the arrays
+        for frame in (coord.ICRS(), coord.GCRS()):  # static, or not
+            arrs = self.inst.transform_to(frame)
+            expected = self.c.transform_to(frame)
+
+            assert arrs.frame.is_equivalent_frame(frame)
+            assert np.allclose(
+                arrs.positions.T,
+                expected.cartesian.xyz.to_value(u.kpc),
+            )
+            assert np.allclose(
+                arrs.velocities.T,
+                expected.velocity.d_xyz.to_value(u.km / u.s),
+                rtol=1e-3,  # GCRS velocities are finite-differenced
+            )
+            assert np.array_equal(arrs.masses, self.inst.masses)
+
+        with pytest.raises(ValueError, match="no frame"):
+            self.inst._replace(frame=None).transform_to(coord.ICRS())
+
+    # /def
+
+
+# /class
+
+
+##############################################################################
+
+
 class Test_PotentialSampler(CommonBase_Test, obj=sample.PotentialSampler):
     @classmethod
     def setup_class(cls):
@@ -65,9 +195,10 @@ class Test_PotentialSampler(CommonBase_Test, obj=sample.PotentialSampler):
                     random = np.random.default_rng(random)
 
                 # return
-                rep = coord.UnitSphericalRepresentation(
+                rep = coord.SphericalRepresentation(
                     lon=random.uniform(size=n) * u.deg,
                     lat=2 * random.uniform(size=n) * u.deg,
+                    distance=np.ones(n) * u.kpc,
                 )
 
                 if representation_type is None:
@@ -79,7 +210,7 @@ class Test_PotentialSampler(CommonBase_Test, obj=sample.PotentialSampler):
                     ),
                     copy=False,
                 )
-                sample.mass = np.ones(n)
+                sample.mass = np.ones(n) * u.solMass
                 sample.potential = self.potential
 
                 return sample
@@ -417,6 +548,91 @@ class Test_PotentialSampler(CommonBase_Test, obj=sample.PotentialSampler):
 
     # /def
 
+    def test__run_batch(self):
+        """Test method ``_run_batch`` draws once and reshapes."""
+        single = self.inst(n=6, random=np.random.RandomState(0))
+        batch = self.inst.run(
+            n=2,
+            iterations=3,
+            random=np.random.RandomState(0),
+            batch=True,
+            progress=False,
+        )
+
+        assert batch.shape == (2, 3)
+        # iteration j is column j, in draw order
+        for j in range(3):
+            got = batch[:, j].cartesian.xyz
+            expected = single[2 * j : 2 * j + 2].cartesian.xyz  # noqa: E203
+            assert np.allclose(got, expected)
+
+        # each iteration has the total mass
+        assert np.allclose(batch.mass.sum(axis=0), single.mass.sum())
+        assert batch.potential is single.potential
+
+    # /def
+
+    def test_sample_arrays(self):
+        """Test method ``sample_arrays`` matches ``__call__``."""
+        arrs = self.inst.sample_arrays(n=5, random=np.random.RandomState(0))
+        expected = self.inst(n=5, random=np.random.RandomState(0))
+
+        assert isinstance(arrs, sample.SampleArrays)
+        assert arrs.positions.shape == (5, 3)
+        assert arrs.frame.is_equivalent_frame(self.inst.frame)
+        assert np.allclose(
+            arrs.positions.T,
+            expected.cartesian.xyz.to_value(u.kpc),
+        )
+        assert np.allclose(arrs.masses, u.Quantity(expected.mass).value)
+
+        if arrs.velocities is not None:
+            assert np.allclose(
+                arrs.velocities.T,
+                expected.velocity.d_xyz.to_value(u.km / u.s),
+            )
+
+    # /def
+
+    def test_sample_chunks(self):
+        """Test method ``sample_chunks``."""
+        chunks = self.inst.sample_chunks(10, 4, random=0)
+
+        # the streams are spawned up front, so are drawn consistently
+        expected = list(self.inst.sample_chunks(10, 4, random=0))
+        self.inst.sample_arrays(n=5, random=None)  # changes nothing
+        chunks = list(chunks)
+
+        assert [c.shape for c in chunks] == [(4,), (4,), (2,)]
+        for got, exp in zip(chunks, expected):
+            assert np.array_equal(got.positions, exp.positions)
+
+        # each is the fraction of a sample of the total mass
+        for chunk in chunks:
+            size = len(chunk.masses)
+            total = self.inst.sample_arrays(n=size).masses.sum()
+            assert np.isclose(chunk.masses.sum(), total * size / 10)
+
+        with pytest.raises(ValueError, match="chunksize"):
+            self.inst.sample_chunks(10, 0)
+
+    # /def
+
+    def test_run_chunks(self):
+        """Test method ``run`` with ``chunksize``."""
+        iterations = list(
+            self.inst.run(10, 2, chunksize=3, random=0, progress=False),
+        )
+        assert len(iterations) == 2
+        first, second = [list(chunks) for chunks in iterations]
+        assert [c.shape for c in first] == [(3,), (3,), (3,), (1,)]
+        assert not np.array_equal(first[0].positions, second[0].positions)
+
+        with pytest.raises(ValueError, match="both batch and chunk"):
+            self.inst.run(10, 2, chunksize=3, batch=True)
+
+    # /def
+
     def test_sample_error(self):
         """Test method ``run`` raises error."""
         with pytest.raises(ValueError):
@@ -473,7 +689,7 @@ class Test_PotentialSampler(CommonBase_Test, obj=sample.PotentialSampler):
 
         """
         # ----------------
-        # int or randomState
+        # int, RandomState, Generator, or SeedSequence
 
         ctx = self.inst._random_context(0)
         assert isinstance(ctx, NumpyRNGContext)
@@ -481,15 +697,18 @@ class Test_PotentialSampler(CommonBase_Test, obj=sample.PotentialSampler):
         ctx = self.inst._random_context(np.random.RandomState(0))
         assert isinstance(ctx, NumpyRNGContext)
 
+        ctx = self.inst._random_context(np.random.default_rng(0))
+        assert isinstance(ctx, NumpyRNGContext)
+
+        ctx = self.inst._random_context(np.random.SeedSequence(0))
+        assert isinstance(ctx, NumpyRNGContext)
+
         # ----------------
         # else
 
         ctx = self.inst._random_context(None)
         assert isinstance(ctx, contextlib.suppress)
 
-        ctx = self.inst._random_context(np.random.default_rng(0))
-        assert isinstance(ctx, contextlib.suppress)
-
     # /def
 
     #################################################################
@@ -502,5 +721,149 @@ class Test_PotentialSampler(CommonBase_Test, obj=sample.PotentialSampler):
 # -------------------------------------------------------------------
 
 
+class Test_SnapshotSampler:
+    """Test :class:`~discO.core.sample.SnapshotSampler`."""
+
+    @classmethod
+    def setup_class(cls):
+        """Setup fixtures for testing."""
+        rng = np.random.default_rng(0)
+        num = 100
+        cls.table = QTable(
+            dict(
+                ID=np.arange(num),
+                mass=rng.uniform(1, 2, size=num) * u.solMass,
+                x=rng.normal(size=num) * u.kpc,
+                y=rng.normal(size=num) * u.kpc,
+                z=rng.normal(size=num) * u.pc,  # converted
+                vx=rng.normal(size=num) * u.km / u.s,
+                vy=rng.normal(size=num) * u.km / u.s,
+                vz=rng.normal(size=num) * u.km / u.s,
+            ),
+        )
+        cls.potential = PotentialWrapper(cls.table, frame="galactocentric")
+
+        cls.inst = sample.SnapshotSampler(cls.potential)
+
+    # /def
+
+    def test___new__(self):
+        """Test method ``__new__`` dispatches on tables."""
+        inst = sample.PotentialSampler(self.potential)
+        assert isinstance(inst, sample.SnapshotSampler)
+
+    # /def
+
+    def test___init__(self):
+        """Test method ``__init__``."""
+        assert self.inst._positions.shape == (100, 3)
+        assert self.inst._positions.flags.c_contiguous
+        assert np.allclose(
+            self.inst._positions[:, 2],
+            self.table["z"].to_value(u.kpc),
+        )
+        assert self.inst._velocities.shape == (100, 3)
+        assert self.inst._total_mass == self.table["mass"].sum()
+
+        # without velocities
+        table = self.table.copy()
+        table.remove_columns(["vx", "vy", "vz"])
+        inst = sample.SnapshotSampler(
+            PotentialWrapper(table, frame="galactocentric"),
+            total_mass=10 * u.solMass,
+        )
+        assert inst.particles.velocities is None
+        assert inst._total_mass == 10 * u.solMass
+
+    # /def
+
+    def test_indices(self):
+        """Test method ``indices``."""
+        # bootstrap
+        indices = self.inst.indices(150, random=0)
+        assert indices.shape == (150,)
+        assert np.all((0 <= indices) & (indices < 100))
+        assert np.array_equal(indices, self.inst.indices(150, random=0))
+
+        indices = self.inst.indices(10, 3, random=np.random.default_rng(0))
+        assert indices.shape == (10, 3)
+
+        # subsample
+        indices = self.inst.indices(100, 3, replace=False, random=0)
+        assert indices.shape == (100, 3)
+        for column in indices.T:
+            assert np.array_equal(np.sort(column), np.arange(100))
+
+        with pytest.raises(ValueError, match="without replacement"):
+            self.inst.indices(101, replace=False)
+
+    # /def
+
+    def test_take(self):
+        """Test method ``take``, rescaling the masses."""
+        indices = self.inst.indices(10, 3, random=0)
+        arrs = self.inst.take(indices)
+
+        assert arrs.shape == (10, 3)
+        assert np.array_equal(
+            arrs.positions[:, 1],
+            self.inst._positions[indices[:, 1]],
+        )
+        assert np.array_equal(
+            arrs.velocities[:, 1],
+            self.inst._velocities[indices[:, 1]],
+        )
+        assert np.allclose(
+            arrs.masses.sum(axis=0),
+            self.table["mass"].sum().value,
+        )
+        # relative masses are kept
+        ratio = arrs.masses[:, 0] / self.inst._masses[indices[:, 0]]
+        assert np.allclose(ratio, ratio[0])
+
+    # /def
+
+    def test___call__(self):
+        """Test method ``__call__``."""
+        c = self.inst(10, random=0, representation_type="cartesian")
+
+        assert isinstance(c, coord.SkyCoord)
+        assert isinstance(c.frame, coord.Galactocentric)
+        assert c.shape == (10,)
+        assert c.potential is self.inst.potential
+        assert np.isclose(c.mass.sum(), self.table["mass"].sum())
+
+        indices = self.inst.indices(10, random=0)
+        assert np.allclose(
+            c.x.to_value(u.kpc), self.inst._positions[indices, 0]
+        )
+
+    # /def
+
+    def test_run_batch(self):
+        """Test method ``run`` in batch mode."""
+        c = self.inst.run(10, 3, random=0, batch=True, progress=False)
+
+        assert c.shape == (10, 3)
+        assert np.allclose(c.mass.sum(axis=0), self.table["mass"].sum())
+
+        expected = self.inst.take(self.inst.indices(10, 3, random=0))
+        assert np.allclose(
+            c.cartesian.xyz.to_value(u.kpc),
+            np.moveaxis(expected.positions, -1, 0),
+        )
+
+        c = self.inst.run(10, 1, random=0, batch=True, progress=False)
+        assert c.shape == (10,)
+
+    # /def
+
+
+# /class
+
+
+# -------------------------------------------------------------------
+
+
 ##############################################################################
 # END
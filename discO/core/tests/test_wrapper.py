@@ -13,6 +13,7 @@ __all__ = [
 
 # BUILT-IN
 import abc
+import pickle
 
 # THIRD PARTY
 import astropy.coordinates as coord
@@ -223,6 +224,34 @@ class Test_PotentialWrapperMeta(ObjectTest, obj=wrapper.PotentialWrapperMeta):
 
     # /def
 
+    def test_with_coefficients(self):
+        """Test method ``with_coefficients``."""
+        with pytest.raises(
+            NotImplementedError,
+            match="appropriate subpackage",
+        ):
+            self.subclass.with_coefficients(self.potential, {})
+
+    # /def
+
+    def test_batch_evaluate(self):
+        """Test method ``batch_evaluate``."""
+        # evaluates each potential, so same errors as ``specific_force``.
+        with pytest.raises(
+            NotImplementedError,
+            match="appropriate subpackage",
+        ):
+            self.subclass.batch_evaluate(
+                [self.potential],
+                "specific_force",
+                self.points,
+            )
+
+        # nothing to evaluate
+        assert self.subclass.batch_evaluate([], "potential", self.points) == []
+
+    # /def
+
     #################################################################
     # Usage Tests
 
@@ -443,6 +472,20 @@ class Test_PotentialWrapper(ObjectTest, obj=wrapper.PotentialWrapper):
 
     # /def
 
+    def test___getnewargs_ex__(self):
+        """Test method ``__getnewargs_ex__``, by pickling."""
+        args, kwargs = self.inst.__getnewargs_ex__()
+        assert args == (self.inst.__wrapped__,)
+        assert kwargs["frame"] is self.inst.frame
+
+        got = pickle.loads(pickle.dumps(self.inst))
+        assert got.__class__ is self.inst.__class__
+        assert got.__wrapped__.__class__ is self.inst.__wrapped__.__class__
+        assert got.frame == self.inst.frame
+        assert got.default_representation == self.inst.default_representation
+
+    # /def
+
 
 # /class
 
@@ -25,7 +25,7 @@ from astropy.utils.misc import indent
 # PROJECT-SPECIFIC
 import discO.type_hints as TH
 from discO.utils import resolve_framelike, resolve_representationlike
-from discO.utils.coordinates import UnFrame
+from discO.utils.coordinates import UnFrame, transform_to
 
 ##############################################################################
 # PARAMETERS
@@ -121,7 +121,7 @@ class PotentialWrapperMeta(ABCMeta):
         ):
             p = points
         else:
-            p = points.transform_to(resolved_frame)
+            p = transform_to(points, resolved_frame)
 
         # -----------
         # to rep
@@ -321,6 +321,88 @@ class PotentialWrapperMeta(ABCMeta):
 
     # /def
 
+    def with_coefficients(
+        self,
+        potential,
+        coefficients: T.Mapping[str, T.Any],
+    ) -> T.Any:
+        """A copy of the potential, with other coefficients.
+
+        Parameters
+        ----------
+        potential : object
+            The potential.
+        coefficients : Mapping
+            Like those from ``coefficients``.
+
+        Returns
+        -------
+        object
+            The potential, with `coefficients`.
+
+        """
+        raise NotImplementedError("Please use the appropriate subpackage.")
+
+    # /def
+
+    # -----------------------------------------------------
+
+    def batch_evaluate(
+        self,
+        potentials: T.Sequence[T.Any],
+        observable: str,
+        points: TH.PositionType,
+        *,
+        frame: T.Optional[TH.FrameType] = None,
+        representation_type: TH.OptRepresentationLikeType = None,
+        cache: T.Optional[T.Dict[T.Any, T.Any]] = None,
+        **kwargs,
+    ) -> T.List[T.Any]:
+        """Evaluate many potentials on the same points.
+
+        Subclasses can override this to share work between the potentials,
+        eg. basis functions that only depend on the points. Here each
+        potential is evaluated separately.
+
+        Parameters
+        ----------
+        potentials : sequence of objects
+            The potentials.
+        observable : str
+            Name of the method, eg. "acceleration".
+        points : coord-array or |Representation|
+            The points at which to evaluate the potentials.
+        frame : |CoordinateFrame| or None (optional, keyword-only)
+            The frame of the potentials.
+        representation_type : |Representation| or None (optional, keyword-only)
+            The representation type in which to return data.
+        cache : dict or None (optional, keyword-only)
+            Storage for anything that can be reused between calls with the
+            same `points` and `frame`. Not used here.
+        **kwargs
+            Arguments into the potentials.
+
+        Returns
+        -------
+        list
+            The result of `observable` for each potential.
+
+        """
+        method = getattr(self, observable)
+
+        return [
+            method(
+                potential,
+                points,
+                frame=frame,
+                representation_type=representation_type,
+                **kwargs,
+            )
+            for potential in potentials
+        ]
+
+    # /def
+
 
 # /class
 
@@ -430,6 +512,21 @@ class PotentialWrapper(metaclass=PotentialWrapperMeta):
 
     # /def
 
+    def __getnewargs_ex__(self) -> T.Tuple[tuple, dict]:
+        """Arguments to ``__new__`` when unpickling.
+
+        The instance ``__dict__`` is restored afterward, so ``__init__`` is
+        not re-run.
+
+        """
+        kwargs = dict(
+            frame=self.frame,
+            representation_type=self.default_representation,
+        )
+        return (self.__wrapped__,), kwargs
+
+    # /def
+
     ####################################################
     # On the instance
 
@@ -733,6 +830,35 @@ class PotentialWrapper(metaclass=PotentialWrapperMeta):
 
     # /def
 
+    @sharedmethod
+    def with_coefficients(
+        self,
+        coefficients: T.Mapping[str, T.Any],
+    ) -> "PotentialWrapper":
+        """A copy of the wrapper, with other coefficients.
+
+        E.g. to rebuild each of many fits from one template and their
+        coefficients.
+
+        Parameters
+        ----------
+        coefficients : Mapping
+            Like those from ``coefficients``.
+
+        Returns
+        -------
+        :class:`PotentialWrapper`
+            With the frame and representation type of this wrapper.
+
+        """
+        return self.__class__(
+            self.__class__.with_coefficients(self.__wrapped__, coefficients),
+            frame=self.frame,
+            representation_type=self.default_representation,
+        )
+
+    # /def
+
     ####################################################
     # Misc
 
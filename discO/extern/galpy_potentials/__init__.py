@@ -5,6 +5,11 @@
 
 __all__ = [
     "scf_compute_coeffs_nbody",
+    "scf_compute_coeffs_nbody_chunks",
+    "scf_compute_basis_nbody",
+    "scf_compute_coeffs_from_basis",
+    "scf_compute_grid_basis",
+    "scf_evaluate_from_grid_basis",
 ]
 
 
@@ -12,7 +17,14 @@ __all__ = [
 # IMPORTS
 
 # PROJECT-SPECIFIC
-from .self_consistent_field import scf_compute_coeffs_nbody
+from .self_consistent_field import (
+    scf_compute_basis_nbody,
+    scf_compute_coeffs_from_basis,
+    scf_compute_coeffs_nbody,
+    scf_compute_coeffs_nbody_chunks,
+    scf_compute_grid_basis,
+    scf_evaluate_from_grid_basis,
+)
 
 ##############################################################################
 # END
@@ -9,10 +9,21 @@
 
 """
 
+# BUILT-IN
+from itertools import repeat
+
 # THIRD PARTY
 import astropy.units as u
 import numpy as np
-from scipy.special import gamma, gegenbauer, lpmv
+from scipy.special import gamma
+
+# PROJECT-SPECIFIC
+from discO.utils.parallel import map_context
+
+##############################################################################
+# PARAMETERS
+
+SCF_CHUNKSIZE: int = 2 ** 14  # particles per chunk
 
 ##############################################################################
 # CODE
@@ -59,6 +70,409 @@ def _C(xi, N, L, alpha=lambda x: 2 * x + 3.0 / 2):
     return CC
 
 
+# -------------------------------------------------------------------
+
+
+def _gegenbauer_nl(xi, N, L):
+    """Gegenbauer polynomials :math:`C_n^{(2l+3/2)}(\\xi)`, by recurrence.
+
+    Parameters
+    ----------
+    xi : (P,) array
+        Radial transformed variable.
+    N, L : int
+        Sizes of the N and L dimensions.
+
+    Returns
+    -------
+    (L, N, P) array
+
+    """
+    alpha = 2.0 * np.arange(L)[:, None] + 1.5  # (L, 1)
+
+    CC = np.empty((L, N, len(xi)))
+    if N > 0:
+        CC[:, 0] = 1.0
+    if N > 1:
+        CC[:, 1] = 2.0 * alpha * xi
+    for n in range(1, N - 1):
+        CC[:, n + 1] = (
+            2.0 * (n + alpha) * xi * CC[:, n]
+            - (n + 2.0 * alpha - 1.0) * CC[:, n - 1]
+        ) / (n + 1.0)
+
+    return CC
+
+
+def _legendre_lm(x, L, M=None):
+    """Associated Legendre functions :math:`P_l^m(x)`, by recurrence.
+
+    Includes the Condon-Shortley phase, matching :func:`scipy.special.lpmv`.
+
+    Parameters
+    ----------
+    x : (P,) array
+        :math:`\\cos\\theta`
+    L : int
+        Size of the L dimension.
+    M : int or None (optional)
+        Size of the M dimension. If None (default), `L`.
+
+    Returns
+    -------
+    (L, M, P) array
+        Indexed [l, m, particle]. Zero where m > l.
+
+    """
+    M = L if M is None else M
+    PP = np.zeros((L, M, len(x)))
+    somx2 = np.sqrt((1.0 - x) * (1.0 + x))
+
+    # diagonal, P_m^m = (-1)^m (2m-1)!! (1-x^2)^{m/2}
+    pmm = np.ones_like(x)
+    for mm in range(min(L, M)):
+        PP[mm, mm] = pmm
+        pmm = -(2.0 * mm + 1.0) * somx2 * pmm
+
+    # recurse up in l, vectorized over m
+    ms = np.arange(M)[:, None]
+    for ll in range(1, L):
+        # first off-diagonal, P_{m+1}^m = x (2m+1) P_m^m
+        if ll - 1 < M:
+            PP[ll, ll - 1] = x * (2.0 * ll - 1.0) * PP[ll - 1, ll - 1]
+        # rest, P_l^m = ((2l-1) x P_{l-1}^m - (l+m-1) P_{l-2}^m) / (l-m)
+        mx = min(ll - 1, M)
+        m = ms[:mx]
+        PP[ll, :mx] = (
+            (2.0 * ll - 1.0) * x * PP[ll - 1, :mx]
+            - (ll + m - 1.0) * PP[ll - 2, :mx]
+        ) / (ll - m)
+
+    return PP
+
+
+def _trig_m(phi, L):
+    """:math:`\\cos(m\\phi)` and :math:`\\sin(m\\phi)`, by angle addition.
+
+    Parameters
+    ----------
+    phi : (P,) array
+    L : int
+        Size of the M dimension.
+
+    Returns
+    -------
+    (2, L, P) array
+        Indexed [(cos, sin), m, particle].
+
+    """
+    TT = np.empty((2, L, len(phi)))
+    if L == 0:
+        return TT
+
+    cosphi, sinphi = np.cos(phi), np.sin(phi)
+    TT[0, 0], TT[1, 0] = 1.0, 0.0
+    for mm in range(1, L):
+        TT[0, mm] = TT[0, mm - 1] * cosphi - TT[1, mm - 1] * sinphi
+        TT[1, mm] = TT[1, mm - 1] * cosphi + TT[0, mm - 1] * sinphi
+
+    return TT
+
+
+def _scf_Inl(N, L):
+    """Normalization :math:`I_{nl}` of the SCF basis.
+
+    Returns
+    -------
+    (N, L) array
+
+    """
+    nn = np.arange(N)[:, None]
+    ll = np.arange(L)[None, :]
+
+    Knl = 0.5 * nn * (nn + 4.0 * ll + 3.0) + (ll + 1) * (2.0 * ll + 1.0)
+    Inl = (
+        -Knl
+        * 4.0
+        * np.pi
+        / 2.0 ** (8.0 * ll + 6.0)
+        * gamma(nn + 4.0 * ll + 3.0)
+        / gamma(nn + 1)
+        / (nn + 2.0 * ll + 1.5)
+        / gamma(2.0 * ll + 1.5) ** 2
+    )
+    return Inl
+
+
+def _scf_Nlm(L):
+    """Normalization of the spherical harmonics.
+
+    Returns
+    -------
+    (L, L) array
+        Indexed [l, m]. Zero where m > l.
+
+    """
+    ll, mm = np.tril_indices(L)
+    Nlm = np.zeros((L, L))
+    Nlm[ll, mm] = np.sqrt(
+        (2.0 * ll + 1) * gamma(ll - mm + 1) / gamma(ll + mm + 1),
+    )
+    return Nlm
+
+
+def _scf_symmetry_terms(L, symmetry=None):
+    """The (l, (cos, sin), m) terms allowed by a symmetry.
+
+    Parameters
+    ----------
+    L : int
+        Size of the L and M dimensions.
+    symmetry : str or None (optional)
+        - None : no symmetry. All terms with :math:`m \\leq l`, except the
+          sine terms with :math:`m = 0`, which vanish.
+        - "spherical" : only :math:`l = 0`.
+        - "axisymmetric" : about the z axis. Only :math:`m = 0`.
+        - "reflection" : under :math:`z \\rightarrow -z`. Only even
+          :math:`l + m`.
+        - "triaxial" : under reflections in each of the x, y, and z planes.
+          Only even :math:`l` and :math:`m`, and only cosine terms.
+
+    Returns
+    -------
+    ll, cc, mm : (K,) int arrays
+        Indices of the allowed terms, sorted by l.
+
+    Raises
+    ------
+    ValueError
+        If `symmetry` is not one of the options.
+
+    """
+    ll, mm = np.tril_indices(L)
+    ll, mm = np.concatenate((ll, ll)), np.concatenate((mm, mm))
+    cc = np.repeat([0, 1], len(ll) // 2)
+
+    keep = (cc == 0) | (mm > 0)
+    if symmetry is None:
+        pass
+    elif symmetry == "spherical":
+        keep &= ll == 0
+    elif symmetry == "axisymmetric":
+        keep &= mm == 0
+    elif symmetry == "reflection":
+        keep &= (ll + mm) % 2 == 0
+    elif symmetry == "triaxial":
+        keep &= (cc == 0) & (ll % 2 == 0) & (mm % 2 == 0)
+    else:
+        raise ValueError(f"symmetry {symmetry!r} not supported.")
+
+    order = np.argsort(ll[keep], kind="stable")
+    return ll[keep][order], cc[keep][order], mm[keep][order]
+
+
+def _scf_radial_chunk(ra, N, L):
+    """Radial part of the SCF basis.
+
+    Parameters
+    ----------
+    ra : (P,) array
+        Radii, in units of the scale factor.
+    N, L : int
+
+    Returns
+    -------
+    (L, N, P) array
+        :math:`-(r/a)^l / (1 + r/a)^{2l+1} C_n^{(2l+3/2)}(\\xi)`
+
+    """
+    # Gegenbauer with the prefactor recursed in l.
+    pref = np.empty((L, 1, len(ra)))
+    if L > 0:
+        pref[0, 0] = -1.0 / (1.0 + ra)
+    for ll in range(1, L):
+        pref[ll, 0] = pref[ll - 1, 0] * ra / (1.0 + ra) ** 2
+
+    return _gegenbauer_nl((ra - 1.0) / (ra + 1.0), N, L) * pref
+
+
+def _scf_basis_chunk(pos, N, L, Nlm):
+    """Radial and angular parts of the SCF basis for a chunk of particles.
+
+    Parameters
+    ----------
+    pos : (3, P) array
+        Positions, in units of the scale factor.
+    N, L : int
+    Nlm : (L, L) array
+        From :func:`_scf_Nlm`.
+
+    Returns
+    -------
+    radial : (L, N, P) array
+        :math:`-(r/a)^l / (1 + r/a)^{2l+1} C_n^{(2l+3/2)}(\\xi)`
+    angular : (L, 2, L, P) array
+        :math:`N_{lm} P_l^m(\\cos\\theta) [\\cos(m\\phi), \\sin(m\\phi)]`,
+        indexed [l, (cos, sin), m, particle].
+
+    """
+    ra = np.sqrt(np.sum(np.square(pos), axis=0))
+    phi = np.arctan2(pos[1], pos[0])
+    with np.errstate(invalid="ignore", divide="ignore"):
+        costheta = pos[2] / ra
+
+    radial = _scf_radial_chunk(ra, N, L)
+
+    # angular: particles at the origin have no direction -> 0
+    Ylm = Nlm[:, :, None] * _legendre_lm(costheta, L)
+    Ylm[np.isnan(Ylm)] = 0.0
+    angular = Ylm[:, None, :, :] * _trig_m(phi, L)[None, :, :, :]
+
+    return radial, angular
+
+
+def _scf_sum_chunk(pos, mass, N, L, Nlm, covariance=False):
+    """Mass-weighted sum of the SCF basis over a chunk of particles.
+
+    Parameters
+    ----------
+    pos : (3, P) array
+        Positions, in units of the scale factor.
+    mass : (P,) array
+    N, L : int
+    Nlm : (L, L) array
+        From :func:`_scf_Nlm`.
+    covariance : bool (optional)
+        Whether to also sum the second moments of the particles'
+        contributions.
+
+    Returns
+    -------
+    (2, N, L, L) array
+        Not yet normalized by :math:`I_{nl}`.
+    (2NLL, 2NLL) array
+        Only if `covariance`. The second moments, not yet normalized.
+
+    """
+    radial, angular = _scf_basis_chunk(pos, N, L, Nlm)
+
+    if covariance:
+        # the contribution of each particle, (P, 2NLL)
+        phi = (
+            mass[:, None]
+            * np.einsum(
+                "lnp,lcmp->pcnlm",
+                radial,
+                angular,
+            ).reshape(pos.shape[1], -1)
+        )
+        return phi.sum(axis=0).reshape(2, N, L, L), phi.T @ phi
+
+    # contract over particles as a matmul batched in l
+    # (L, 2L, P) @ (L, P, N) -> (L, 2L, N)
+    Sum = np.matmul(
+        angular.reshape(L, 2 * L, pos.shape[1]),
+        (radial * mass).transpose(0, 2, 1),
+    )
+    # [l, (cos, sin), m, n] -> [(cos, sin), n, l, m]
+    return Sum.reshape(L, 2, L, N).transpose(1, 3, 0, 2)
+
+
+def _scf_terms_chunk(pos, N, Nlm, terms):
+    """The SCF basis of a chunk of particles for only some terms.
+
+    Only the orders of the Gegenbauer, Legendre and trigonometric functions
+    needed by `terms` are computed.
+
+    Parameters
+    ----------
+    pos : (3, P) array
+        Positions, in units of the scale factor.
+    N : int
+    Nlm : (L, L) array
+        From :func:`_scf_Nlm`.
+    terms : tuple of (K,) int arrays
+        From :func:`_scf_symmetry_terms`.
+
+    Returns
+    -------
+    radial : (L', N, P) array
+        For l up to the largest in `terms`. See :func:`_scf_basis_chunk`.
+    angular : (K, P) array
+        :math:`N_{lm} P_l^m(\\cos\\theta)` times :math:`\\cos(m\\phi)`
+        or :math:`\\sin(m\\phi)`, for each term.
+
+    """
+    ll, cc, mm = terms
+    L = ll.max() + 1 if len(ll) else 0
+    M = mm.max() + 1 if len(mm) else 0
+
+    ra = np.sqrt(np.sum(np.square(pos), axis=0))
+    phi = np.arctan2(pos[1], pos[0])
+    with np.errstate(invalid="ignore", divide="ignore"):
+        costheta = pos[2] / ra
+
+    radial = _scf_radial_chunk(ra, N, L)
+
+    # angular: particles at the origin have no direction -> 0
+    PP = _legendre_lm(costheta, L, M)
+    angular = Nlm[ll, mm, None] * PP[ll, mm] * _trig_m(phi, M)[cc, mm]
+    angular[np.isnan(angular)] = 0.0
+
+    return radial, angular
+
+
+def _scf_sum_terms_chunk(pos, mass, N, L, Nlm, terms, covariance=False):
+    """Mass-weighted sum of the SCF basis for only some terms.
+
+    Like :func:`_scf_sum_chunk`, but terms not in `terms` are never
+    computed and are zero.
+
+    Parameters
+    ----------
+    pos : (3, P) array
+        Positions, in units of the scale factor.
+    mass : (P,) array
+    N, L : int
+    Nlm : (L, L) array
+        From :func:`_scf_Nlm`.
+    terms : tuple of (K,) int arrays
+        From :func:`_scf_symmetry_terms`.
+    covariance : bool (optional)
+        Whether to also sum the second moments of the particles'
+        contributions.
+
+    Returns
+    -------
+    (2, N, L, L) array
+        Not yet normalized by :math:`I_{nl}`.
+    (KN, KN) array
+        Only if `covariance`. The second moments of the terms, not yet
+        normalized.
+
+    """
+    ll, cc, mm = terms
+    radial, angular = _scf_terms_chunk(pos, N, Nlm, terms)
+
+    Sum = np.zeros((2, N, L, L))
+
+    if covariance:
+        # the contribution of each particle, (K, N, P)
+        phi = angular[:, None, :] * radial[ll] * mass
+        Sum[cc, :, ll, mm] = phi.sum(axis=-1)
+
+        phi = phi.reshape(-1, pos.shape[1])
+        return Sum, phi @ phi.T
+
+    # contract over particles as a matmul for each l
+    # (K_l, P) @ (P, N) -> (K_l, N)
+    for lv in np.unique(ll):
+        sel = ll == lv
+        Sum[cc[sel], :, lv, mm[sel]] = angular[sel] @ (radial[lv] * mass).T
+
+    return Sum
+
+
 def scf_compute_coeffs_nbody(
     pos,
     mass,
@@ -68,94 +482,533 @@ def scf_compute_coeffs_nbody(
     radial_order=None,
     costheta_order=None,
     phi_order=None,
+    *,
+    chunksize=SCF_CHUNKSIZE,
+    n_jobs=None,
+    executor=None,
+    return_covariance=False,
+    symmetry=None,
 ):
     """Compute SCF Coefficients
 
     Numerically compute the expansion coefficients for a given triaxial
     density
 
+    All the Legendre, Gegenbauer and trigonometric terms are built by
+    recurrence relations in one pass over the particles, and the
+    coefficients are accumulated as array contractions. Particles are
+    processed in chunks of `chunksize`, so memory is bounded.
+
+    The chunks can be distributed over worker processes. The partial sums
+    are always reduced in chunk order, so the result depends only on
+    `chunksize`, not on the number of workers.
+
+    Optionally, the second moments of the particles' contributions are
+    accumulated in the same pass, giving the covariance of the coefficients
+    under Poisson (shot) noise:
+    :math:`C_{jk} = \\sum_i m_i^2 \\Phi_{ij} \\Phi_{ik} - A_j A_k / P`.
+
     Parameters
     ----------
-    pos : (3, N) array
+    pos : (3, N) array or |Quantity|
         Positions of particles
-    m : scalar or (N,) array
-        mass of particles
+    m : scalar or (N,) array or |Quantity|
+        mass of particles. If not a Quantity, assumed to be in
+        units of :math:`10^{12} M_\\odot`.
     N : int
         size of the Nth dimension of the expansion coefficients
     L : int
         size of the Lth and Mth dimension of the expansion coefficients
     a : float or Quantity
         parameter used to shift the basis functions
+    chunksize : int (optional, keyword-only)
+        Number of particles processed at once.
+    n_jobs : int or None (optional, keyword-only)
+        Number of worker processes over which to distribute the chunks.
+        None or 1 (default) runs serially, -1 uses all available cores.
+    executor : `~concurrent.futures.Executor` or None (optional, keyword-only)
+        Executor over which to distribute the chunks. Overrides `n_jobs`.
+    return_covariance : bool (optional, keyword-only)
+        Whether to also return the covariance of the coefficients.
+        Each chunk then builds a ``(chunksize, 2 * N * L * L)`` array.
+    symmetry : str or None (optional, keyword-only)
+        Symmetry of the density, one of None (default), "spherical",
+        "axisymmetric", "reflection" (:math:`z \\rightarrow -z`), or
+        "triaxial". Terms that vanish by the symmetry are not computed, and
+        are exactly zero. The covariance is only accumulated for the
+        remaining terms.
 
     Returns
     -------
     Acos, Asin : array
         Expansion coefficients for density dens that can be given to
         ``SCFPotential.__init__``
+    covariance : (2, N, L, L, 2, N, L, L) array
+        Only if `return_covariance`. The covariance of (Acos, Asin).
+        The variance is its diagonal.
 
     .. versionadded:: 1.7
        2020-11-18 - Written - Morgan Bennett
 
     """
-    mass = mass.to_value(1e12 * u.solMass)  # :(
-    ns = np.arange(0, N)
-    ls = np.arange(0, L)
-    ms = np.arange(0, L)
+    return scf_compute_coeffs_nbody_chunks(
+        [(pos, mass)],
+        N,
+        L,
+        a=a,
+        chunksize=chunksize,
+        n_jobs=n_jobs,
+        executor=executor,
+        return_covariance=return_covariance,
+        symmetry=symmetry,
+    )
 
-    ra = (np.sqrt(np.sum(np.square(pos), axis=0)) / a).to_value(u.one)
-    phi = np.arctan2(pos[1], pos[0])
-    costheta = (pos[2] / ra / a).to_value(u.one)
+
+# /def
+
+
+def scf_compute_coeffs_nbody_chunks(
+    chunks,
+    N,
+    L,
+    a=1.0,
+    *,
+    chunksize=SCF_CHUNKSIZE,
+    n_jobs=None,
+    executor=None,
+    return_covariance=False,
+    symmetry=None,
+):
+    """Compute SCF Coefficients, accumulating over chunks of particles.
+
+    Like :func:`scf_compute_coeffs_nbody`, but the particles are given as an
+    iterable of chunks, e.g. from a generator, so that only one chunk need
+    be in memory at a time. The sums are accumulated in chunk order, so
+    the result equals that of :func:`scf_compute_coeffs_nbody` on the
+    concatenated particles, up to the floating-point summation order.
+
+    Parameters
+    ----------
+    chunks : iterable of (pos, mass)
+        The positions, a (3, P) array or |Quantity|, and masses, a scalar
+        or (P,) array or |Quantity|, of each chunk of particles. See
+        :func:`scf_compute_coeffs_nbody`.
+    N, L : int
+    a : float or Quantity
+    chunksize : int (optional, keyword-only)
+        Number of particles processed at once, within each chunk.
+    n_jobs : int or None (optional, keyword-only)
+    executor : `~concurrent.futures.Executor` or None (optional, keyword-only)
+    return_covariance : bool (optional, keyword-only)
+    symmetry : str or None (optional, keyword-only)
+
+    Returns
+    -------
+    Acos, Asin : array
+    covariance : (2, N, L, L, 2, N, L, L) array
+        Only if `return_covariance`.
+
+    """
+    Nlm = _scf_Nlm(L)
+
+    if symmetry is None:
+        func, args, size = _scf_sum_chunk, (), 2 * N * L * L
+    else:
+        terms = _scf_symmetry_terms(L, symmetry)
+        func, args, size = _scf_sum_terms_chunk, (terms,), len(terms[0]) * N
 
     Anlm = np.zeros([2, N, L, L])
-    for i, nn in enumerate(ns):
-        for j, ll in enumerate(ls):
-            for k, mm in enumerate(ms[: j + 1]):
-
-                Plm = lpmv(mm, ll, costheta)
-
-                cosmphi = np.cos(phi * mm)
-                sinmphi = np.sin(phi * mm)
-
-                Ylm = (
-                    np.sqrt(
-                        (2.0 * ll + 1)
-                        * gamma(ll - mm + 1)
-                        / gamma(ll + mm + 1),
-                    )
-                    * Plm
-                )[None, :] * np.array([cosmphi, sinmphi])
-                Ylm = np.nan_to_num(Ylm)
-
-                C = gegenbauer(nn, 2.0 * ll + 1.5)
-                Cn = C(
-                    u.Quantity((ra - 1) / (ra + 1), copy=False).to_value(
-                        u.one,
-                    ),
-                )
+    Anlm2 = np.zeros([size] * 2) if return_covariance else None
+    npart = 0
+    with map_context(n_jobs=n_jobs, executor=executor) as map_func:
+        for pos, mass in chunks:
+            # work in units of "a" and 10^12 solar masses
+            pos = u.Quantity(pos / a, u.one, copy=False).value
+            mass = u.Quantity(mass, u.Unit(1e12 * u.solMass), copy=False)
+            mass = np.broadcast_to(mass.value, pos.shape[1:])
+            npart += pos.shape[1]
+
+            starts = range(0, pos.shape[1], chunksize)
+            pos_chunks = (
+                pos[:, i : i + chunksize] for i in starts  # noqa: E203
+            )
+            mass_chunks = (
+                mass[i : i + chunksize] for i in starts  # noqa: E203
+            )
+
+            partials = map_func(
+                func,
+                pos_chunks,
+                mass_chunks,
+                repeat(N),
+                repeat(L),
+                repeat(Nlm),
+                *(repeat(arg) for arg in args),
+                repeat(return_covariance),
+            )
+            for partial in partials:  # in chunk order -> deterministic
+                if return_covariance:
+                    Anlm += partial[0]
+                    Anlm2 += partial[1]
+                else:
+                    Anlm += partial
+
+    norm = 2.0 / _scf_Inl(N, L)[None, :, :, None]
+    Anlm = norm * Anlm
+
+    if not return_covariance:
+        return Anlm
+
+    norm = np.broadcast_to(norm, Anlm.shape)
+    if symmetry is None:
+        index = np.arange(Anlm.size)
+    else:  # flat indices of the (term, n) rows of the second moments
+        ll, cc, mm = terms
+        nn = np.arange(N)
+        index = np.ravel_multi_index(
+            (cc[:, None], nn[None, :], ll[:, None], mm[:, None]),
+            Anlm.shape,
+        ).ravel()
+
+    norm = norm.ravel()[index]
+    A = Anlm.ravel()[index]
+    cov = np.zeros((Anlm.size, Anlm.size))
+    cov[np.ix_(index, index)] = (
+        norm[:, None] * Anlm2 * norm[None, :] - np.outer(A, A) / npart
+    )
+
+    return Anlm, cov.reshape(Anlm.shape * 2)
 
-                phinlm = (
-                    -np.power(ra, ll) / np.power(ra + 1, (2.0 * ll + 1)) * Cn
-                )[None, :] * Ylm
 
-                Sum = np.sum(mass[None, :] * phinlm, axis=1)
+# /def
 
-                Knl = 0.5 * nn * (nn + 4.0 * ll + 3.0) + (ll + 1) * (
-                    2.0 * ll + 1.0
-                )
-                Inl = (
-                    -Knl
-                    * 4.0
-                    * np.pi
-                    / 2.0 ** (8.0 * ll + 6.0)
-                    * gamma(nn + 4.0 * ll + 3.0)
-                    / gamma(nn + 1)
-                    / (nn + 2.0 * ll + 1.5)
-                    / gamma(2.0 * ll + 1.5) ** 2
-                )
 
-                Anlm[:, i, j, k] = Inl ** (-1) * Sum
+def scf_compute_basis_nbody(
+    pos,
+    N,
+    L,
+    a=1.0,
+    *,
+    chunksize=SCF_CHUNKSIZE,
+    symmetry=None,
+):
+    """Compute the per-particle SCF basis.
+
+    The coefficients of any set of particle masses at these positions are a
+    weighted sum over the basis, see :func:`scf_compute_coeffs_from_basis`.
+    This is useful when the same positions are fit many times with different
+    weights, eg. when bootstrapping a fixed N-body snapshot.
+
+    .. warning::
+
+        The basis has shape ``(P, 2, N, L, L)``. For many particles and
+        large `N` and `L` this is a lot of memory.
+
+    Parameters
+    ----------
+    pos : (3, P) array or |Quantity|
+        Positions of particles
+    N : int
+        size of the Nth dimension of the expansion coefficients
+    L : int
+        size of the Lth and Mth dimension of the expansion coefficients
+    a : float or Quantity
+        parameter used to shift the basis functions
+    chunksize : int (optional, keyword-only)
+        Number of particles processed at once.
+    symmetry : str or None (optional, keyword-only)
+        Symmetry of the density. See :func:`scf_compute_coeffs_nbody`.
+
+    Returns
+    -------
+    (P, 2, N, L, L) array
+        Each particle's contribution to (Acos, Asin), per unit mass.
+
+    """
+    pos = u.Quantity(pos / a, u.one, copy=False).value
+
+    Nlm = _scf_Nlm(L)
+    norm = 2.0 / _scf_Inl(N, L)[None, None, :, :, None]  # (1, 1, N, L, 1)
+
+    if symmetry is not None:
+        ll, cc, mm = terms = _scf_symmetry_terms(L, symmetry)
+        norm = norm[0, 0, :, ll, 0][:, None, :]  # (K, 1, N)
+
+        basis = np.zeros((pos.shape[1], 2, N, L, L))
+        for i in range(0, pos.shape[1], chunksize):
+            radial, angular = _scf_terms_chunk(
+                pos[:, i : i + chunksize],  # noqa: E203
+                N,
+                Nlm,
+                terms,
+            )
+            phi = angular[:, None, :] * radial[ll]  # (K, N, P)
+            # a view. The advanced indices go first: (K, P, N)
+            chunk = basis[i : i + chunksize]  # noqa: E203
+            chunk[:, cc, :, ll, mm] = norm * phi.transpose(0, 2, 1)
+
+        return basis
+
+    basis = np.empty((pos.shape[1], 2, N, L, L))
+    for i in range(0, pos.shape[1], chunksize):
+        radial, angular = _scf_basis_chunk(
+            pos[:, i : i + chunksize],  # noqa: E203
+            N,
+            L,
+            Nlm,
+        )
+        basis[i : i + chunksize] = norm * np.einsum(  # noqa: E203
+            "lnp,lcmp->pcnlm",
+            radial,
+            angular,
+        )
+
+    return basis
+
+
+# /def
+
+
+def scf_compute_coeffs_from_basis(
+    basis,
+    mass,
+    *,
+    weights=None,
+    return_covariance=False,
+):
+    """Compute SCF Coefficients from a per-particle basis.
+
+    Parameters
+    ----------
+    basis : (P, 2, N, L, L) array
+        From :func:`scf_compute_basis_nbody`.
+    mass : (P,) or (I, P) array or |Quantity|
+        mass of particles, optionally for each of I iterations.
+        If not a Quantity, assumed to be in units of :math:`10^{12} M_\\odot`.
+    weights : (P,) or (I, P) array or None (optional, keyword-only)
+        Multiplicities of the particles, eg. from a multinomial draw when
+        bootstrapping. The coefficients and covariance are those of the
+        sample with each particle repeated that many times.
+        None (default) is once each.
+    return_covariance : bool (optional, keyword-only)
+        Whether to also return the covariance of the coefficients.
+        See :func:`scf_compute_coeffs_nbody`. `mass` and `weights` must
+        be 1D.
+
+    Returns
+    -------
+    (2, N, L, L) or (I, 2, N, L, L) array
+        The (Acos, Asin), optionally for each of the I iterations.
+    covariance : (2, N, L, L, 2, N, L, L) array
+        Only if `return_covariance`. The covariance of (Acos, Asin).
+
+    """
+    mass = u.Quantity(mass, u.Unit(1e12 * u.solMass), copy=False).value
+    weights = np.ones(len(basis)) if weights is None else np.asarray(weights)
+    Anlm = np.tensordot(mass * weights, basis, axes=(-1, 0))
+
+    if not return_covariance:
+        return Anlm
+    elif mass.ndim != 1 or weights.ndim != 1:
+        raise ValueError("the covariance needs a 1D mass and weights.")
+
+    # the second moments of the particles, each counted `weights` times
+    phi = mass[:, None] * basis.reshape(len(basis), -1)
+    cov = (weights[:, None] * phi).T @ phi
+    cov -= np.outer(Anlm, Anlm) / weights.sum()
+
+    return Anlm, cov.reshape(Anlm.shape * 2)
+
+
+# /def
+
+
+def _scf_grid_angular(costheta, phi, L, derivative=False):
+    """Angular parts of the SCF basis at a grid of points.
+
+    In the normalization of galpy's internal coefficients, ie. without
+    :math:`N_{lm}`.
+
+    Parameters
+    ----------
+    costheta, phi : (P,) array
+    L : int
+    derivative : bool
+        Whether to also return the derivatives in theta and phi.
+
+    Returns
+    -------
+    angular : (2, L, L, P) array
+        :math:`P_l^m(\\cos\\theta) [\\cos(m\\phi), \\sin(m\\phi)]`,
+        indexed [(cos, sin), l, m, point].
+    dtheta, dphi : (2, L, L, P) array
+        Only if `derivative`.
+
+    """
+    PP = _legendre_lm(costheta, L)  # (l, m, P)
+    TT = _trig_m(phi, L)[:, None]  # (c, 1, m, P)
+
+    angular = PP[None] * TT
+    if not derivative:
+        return angular
+
+    # dP_l^m / dtheta = (P_l^{m+1} - (l+m)(l-m+1) P_l^{m-1}) / 2
+    # which is regular at the poles. P_l^{-1} is absorbed for m = 0.
+    ll = np.arange(L)[:, None, None]
+    mm = np.arange(L)[None, :, None]
+    Pup = np.zeros_like(PP)
+    Pup[:, :-1] = PP[:, 1:]
+    Pdown = np.zeros_like(PP)
+    Pdown[:, 1:] = PP[:, :-1]
+    dPP = (Pup - (ll + mm) * (ll - mm + 1.0) * Pdown) / 2.0
+    dPP[:, 0] = Pup[:, 0]
+
+    # d/dphi: cos(m phi) -> -m sin(m phi), sin(m phi) -> m cos(m phi)
+    dTT = mm * np.stack((-TT[1], TT[0]))
+
+    return angular, dPP[None] * TT, PP[None] * dTT
+
+
+# /def
+
 
-    return 2.0 * Anlm
+def scf_compute_grid_basis(pos, N, L, a=1.0, *, observable="potential"):
+    """Compute the SCF basis functions at a grid of points.
+
+    The basis does not depend on the coefficients, so can be computed once
+    for a grid and then contracted with any number of coefficient sets, see
+    :func:`scf_evaluate_from_grid_basis`.
+
+    Parameters
+    ----------
+    pos : (3, P) array or |Quantity|
+        Cartesian positions of the grid points.
+    N : int
+        size of the Nth dimension of the expansion coefficients
+    L : int
+        size of the Lth and Mth dimension of the expansion coefficients
+    a : float or Quantity
+        parameter used to shift the basis functions
+    observable : {"potential", "density", "force"} (optional, keyword-only)
+        The basis of the potential, density, or specific force.
+
+    Returns
+    -------
+    (2, N, L, L, P) array or (3, 2, N, L, L, P) array
+        Per unit amplitude and for galpy's internal (normalized)
+        coefficients, eg. :attr:`~galpy.potential.SCFPotential._Acos`.
+        Lengths are in units of `pos`. The force is in cylindrical
+        components (R, phi, z), where the phi component is
+        :math:`-\\partial\\Phi / \\partial\\phi / R`.
+        As in galpy, the force is NaN on the z-axis (R = 0).
+
+    Raises
+    ------
+    ValueError
+        If `observable` is not one of the options.
+
+    """
+    if observable not in ("potential", "density", "force"):
+        raise ValueError(f"observable {observable!r} not supported.")
+
+    a = u.Quantity(a, copy=False)
+    pos = u.Quantity(pos / a, u.one, copy=False).value
+    a = a.value
+
+    R = np.sqrt(pos[0] ** 2 + pos[1] ** 2)
+    s = np.sqrt(R ** 2 + pos[2] ** 2)  # r / a
+    phi = np.arctan2(pos[1], pos[0])
+    with np.errstate(invalid="ignore", divide="ignore"):
+        costheta = pos[2] / s
+        sintheta = R / s
+
+    xi = (s - 1.0) / (s + 1.0)
+    CC = _gegenbauer_nl(xi, N, L)  # (l, n, P)
+    nn = np.arange(N)[None, :, None]
+    ll = np.arange(L)[:, None, None]
+    pref = s ** ll / (1.0 + s) ** (2 * ll + 1)  # (l, 1, P)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        if observable == "potential":
+            radial = -np.sqrt(4 * np.pi) / a * pref * CC
+        elif observable == "density":
+            Knl = 0.5 * nn * (nn + 4.0 * ll + 3.0) + (ll + 1) * (2 * ll + 1)
+            radial = Knl / np.sqrt(np.pi) / a ** 3 * pref * CC
+            radial = radial / (s * (1.0 + s) ** 2)
+        else:
+            # dC_n^alpha / ds, from
+            # (1 - xi^2) dC_n / dxi = (n + 2 alpha - 1) C_{n-1} - n xi C_n
+            CCm1 = np.zeros_like(CC)
+            CCm1[:, 1:] = CC[:, :-1]
+            alpha = 2.0 * ll + 1.5
+            dCC = ((nn + 2 * alpha - 1) * CCm1 - nn * xi * CC) / (2 * s)
+            radial = np.sqrt(4 * np.pi) / a * pref * CC
+            dradial = (
+                -np.sqrt(4 * np.pi)
+                / a ** 2
+                * pref
+                * ((ll / s - (2 * ll + 1) / (1 + s)) * CC + dCC)
+            )
+
+    if observable != "force":
+        angular = _scf_grid_angular(costheta, phi, L)
+        return np.einsum("lnp,clmp->cnlmp", radial, angular)
+
+    angular, dtheta, dphi = _scf_grid_angular(
+        costheta,
+        phi,
+        L,
+        derivative=True,
+    )
+    # F = -grad(Phi), with ``radial`` already being -Phi
+    Fr = -np.einsum("lnp,clmp->cnlmp", dradial, angular)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        Ftheta = np.einsum("lnp,clmp->cnlmp", radial, dtheta) / (a * s)
+        Fphi = np.einsum("lnp,clmp->cnlmp", radial, dphi) / (a * R)
+
+    force = np.stack(
+        (
+            Fr * sintheta + Ftheta * costheta,
+            Fphi,
+            Fr * costheta - Ftheta * sintheta,
+        ),
+    )
+    # galpy's SCF forces are NaN on the z-axis, where only the phi component
+    # is here, so batch evaluation matches evaluating each potential.
+    force[..., R == 0] = np.nan
+
+    return force
+
+
+# /def
+
+
+def scf_evaluate_from_grid_basis(basis, coeffs):
+    """Evaluate a stack of SCF coefficients with a grid basis.
+
+    Parameters
+    ----------
+    basis : (2, N, L, L, P) or (3, 2, N, L, L, P) array
+        From :func:`scf_compute_grid_basis`.
+    coeffs : (2, N, L, L) or (I, 2, N, L, L) array
+        The (Acos, Asin), times the amplitude, optionally for each of I
+        potentials.
+
+    Returns
+    -------
+    (P,), (3, P), (I, P) or (I, 3, P) array
+
+    """
+    coeffs = np.asanyarray(coeffs)
+    nb = basis.ndim
+    return np.tensordot(
+        coeffs,
+        basis,
+        axes=(
+            tuple(range(coeffs.ndim - 4, coeffs.ndim)),
+            tuple(range(nb - 5, nb - 1)),
+        ),
+    )
 
 
 # /def
@@ -0,0 +1,19 @@
+# -*- coding: utf-8 -*-
+# see LICENSE.rst
+
+"""Tests for :mod:`~discO.extern.galpy_potentials`."""
+
+__all__ = [
+    # modules
+    "self_consistent_field_tests",
+]
+
+
+##############################################################################
+# IMPORTS
+
+# PROJECT-SPECIFIC
+from . import test_self_consistent_field as self_consistent_field_tests
+
+##############################################################################
+# END
@@ -0,0 +1,444 @@
+# -*- coding: utf-8 -*-
+
+"""Testing :mod:`~discO.extern.galpy_potentials.self_consistent_field`."""
+
+__all__ = [
+    "test__gegenbauer_nl",
+    "test__legendre_lm",
+    "test__trig_m",
+    "test_scf_compute_coeffs_nbody_chunksize",
+    "test_scf_compute_coeffs_nbody_units",
+    "test_scf_compute_coeffs_nbody_parallel",
+    "test_scf_compute_coeffs_nbody_covariance",
+    "test_scf_compute_coeffs_from_basis_weights",
+    "test_scf_compute_coeffs_nbody_chunks",
+    "test_scf_compute_coeffs_nbody_symmetry",
+    "test__scf_symmetry_terms",
+    "test_scf_compute_coeffs_nbody_galpy",
+    "test_scf_compute_grid_basis",
+]
+
+
+##############################################################################
+# IMPORTS
+
+# BUILT-IN
+from concurrent.futures import ThreadPoolExecutor
+
+# THIRD PARTY
+import astropy.units as u
+import numpy as np
+import pytest
+from scipy.special import eval_gegenbauer, lpmv
+
+# PROJECT-SPECIFIC
+from discO.extern.galpy_potentials import self_consistent_field as scf
+from discO.setup_package import HAS_GALPY
+
+##############################################################################
+# PARAMETERS
+
+rng = np.random.default_rng(4)
+pos = rng.normal(size=(3, 1000))
+mass = rng.uniform(1, 2, size=1000) * 1e-2
+
+##############################################################################
+# TESTS
+##############################################################################
+
+
+def test__gegenbauer_nl():
+    """Test ``_gegenbauer_nl`` against scipy."""
+    xi = np.linspace(-1, 1, 11)
+    CC = scf._gegenbauer_nl(xi, 5, 4)
+
+    assert CC.shape == (4, 5, 11)
+    for ll in range(4):
+        for nn in range(5):
+            expected = eval_gegenbauer(nn, 2 * ll + 1.5, xi)
+            assert np.allclose(CC[ll, nn], expected)
+
+
+# /def
+
+
+def test__legendre_lm():
+    """Test ``_legendre_lm`` against scipy."""
+    x = np.linspace(-1, 1, 11)
+    PP = scf._legendre_lm(x, 5)
+
+    assert PP.shape == (5, 5, 11)
+    for ll in range(5):
+        for mm in range(5):
+            assert np.allclose(PP[ll, mm], lpmv(mm, ll, x))
+
+    # only some orders in m
+    for M in (1, 2, 5):
+        assert np.allclose(scf._legendre_lm(x, 5, M), PP[:, :M])
+
+    assert scf._legendre_lm(x, 2, 4)[:, 2:].sum() == 0
+
+
+# /def
+
+
+def test__trig_m():
+    """Test ``_trig_m``."""
+    phi = np.linspace(-np.pi, np.pi, 11)
+    TT = scf._trig_m(phi, 6)
+
+    assert TT.shape == (2, 6, 11)
+    for mm in range(6):
+        assert np.allclose(TT[0, mm], np.cos(mm * phi))
+        assert np.allclose(TT[1, mm], np.sin(mm * phi))
+
+
+# /def
+
+
+def test_scf_compute_coeffs_nbody_chunksize():
+    """The coefficients don't depend on the chunk size."""
+    expected = scf.scf_compute_coeffs_nbody(pos, mass, 4, 3, a=2.0)
+
+    for chunksize in (1, 7, 1000, 10000):
+        got = scf.scf_compute_coeffs_nbody(
+            pos,
+            mass,
+            4,
+            3,
+            a=2.0,
+            chunksize=chunksize,
+        )
+        assert np.allclose(got, expected, rtol=1e-12, atol=0)
+
+
+# /def
+
+
+def test_scf_compute_coeffs_nbody_units():
+    """Quantity inputs are converted to units of "a" and 1e12 solMass."""
+    expected = scf.scf_compute_coeffs_nbody(pos, mass, 4, 3, a=2.0)
+    got = scf.scf_compute_coeffs_nbody(
+        pos * u.kpc,
+        mass * 1e12 * u.solMass,
+        4,
+        3,
+        a=2000 * u.pc,
+    )
+
+    assert np.allclose(got, expected)
+
+
+# /def
+
+
+def test_scf_compute_coeffs_nbody_parallel():
+    """Parallel results are identical to serial results."""
+    expected = scf.scf_compute_coeffs_nbody(pos, mass, 4, 3, chunksize=100)
+
+    got = scf.scf_compute_coeffs_nbody(
+        pos,
+        mass,
+        4,
+        3,
+        chunksize=100,
+        n_jobs=2,
+    )
+    assert np.array_equal(got, expected)
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        got = scf.scf_compute_coeffs_nbody(
+            pos,
+            mass,
+            4,
+            3,
+            chunksize=100,
+            executor=executor,
+        )
+    assert np.array_equal(got, expected)
+
+    with pytest.raises(TypeError, match="concurrent.futures.Executor"):
+        scf.scf_compute_coeffs_nbody(pos, mass, 4, 3, executor=object())
+
+
+# /def
+
+
+def test_scf_compute_coeffs_nbody_covariance():
+    """The covariance is accumulated in the same pass."""
+    expected = scf.scf_compute_coeffs_nbody(pos, mass, 4, 3, chunksize=100)
+
+    Anlm, cov = scf.scf_compute_coeffs_nbody(
+        pos,
+        mass,
+        4,
+        3,
+        chunksize=100,
+        return_covariance=True,
+    )
+    assert np.allclose(Anlm, expected)
+    assert cov.shape == (2, 4, 3, 3) * 2
+
+    flat = cov.reshape(Anlm.size, -1)
+    assert np.allclose(flat, flat.T)
+    assert np.all(np.diagonal(flat) >= 0)
+
+    # the same from the per-particle basis
+    basis = scf.scf_compute_basis_nbody(pos, 4, 3, chunksize=100)
+    got = scf.scf_compute_coeffs_from_basis(
+        basis,
+        mass,
+        return_covariance=True,
+    )
+    assert np.allclose(got[0], Anlm)
+    assert np.allclose(got[1], cov)
+
+    # and in parallel
+    got = scf.scf_compute_coeffs_nbody(
+        pos,
+        mass,
+        4,
+        3,
+        chunksize=100,
+        n_jobs=2,
+        return_covariance=True,
+    )
+    assert np.array_equal(got[0], Anlm)
+    assert np.array_equal(got[1], cov)
+
+    with pytest.raises(ValueError, match="1D mass"):
+        scf.scf_compute_coeffs_from_basis(
+            basis,
+            np.stack((mass, mass)),
+            return_covariance=True,
+        )
+
+
+# /def
+
+
+def test_scf_compute_coeffs_from_basis_weights():
+    """Weights match fitting the explicitly resampled particles."""
+    rng = np.random.default_rng(5)
+    weights = rng.multinomial(len(mass), np.ones(len(mass)) / len(mass))
+    index = np.repeat(np.arange(len(mass)), weights)
+
+    expected = scf.scf_compute_coeffs_nbody(
+        pos[:, index],
+        mass[index],
+        4,
+        3,
+        return_covariance=True,
+    )
+
+    basis = scf.scf_compute_basis_nbody(pos, 4, 3)
+    got = scf.scf_compute_coeffs_from_basis(
+        basis,
+        mass,
+        weights=weights,
+        return_covariance=True,
+    )
+    assert np.allclose(got[0], expected[0])
+    assert np.allclose(got[1], expected[1])
+
+    with pytest.raises(ValueError, match="1D mass and weights"):
+        scf.scf_compute_coeffs_from_basis(
+            basis,
+            mass,
+            weights=np.stack((weights, weights)),
+            return_covariance=True,
+        )
+
+
+# /def
+
+
+@pytest.mark.parametrize("symmetry", [None, "reflection"])
+def test_scf_compute_coeffs_nbody_chunks(symmetry):
+    """Accumulating over chunks matches the whole sample."""
+    expected = scf.scf_compute_coeffs_nbody(
+        pos,
+        mass,
+        4,
+        3,
+        a=2.0,
+        chunksize=100,
+        return_covariance=True,
+        symmetry=symmetry,
+    )
+
+    splits = (300, 600, 900)
+    chunks = zip(np.split(pos, splits, axis=1), np.split(mass, splits))
+    got = scf.scf_compute_coeffs_nbody_chunks(
+        chunks,
+        4,
+        3,
+        a=2.0,
+        chunksize=100,
+        return_covariance=True,
+        symmetry=symmetry,
+    )
+    assert np.allclose(got[0], expected[0], rtol=1e-12, atol=0)
+    assert np.allclose(got[1], expected[1], rtol=1e-10, atol=1e-16)
+
+
+# /def
+
+
+@pytest.mark.parametrize(
+    "symmetry",
+    [None, "spherical", "axisymmetric", "reflection", "triaxial"],
+)
+def test_scf_compute_coeffs_nbody_symmetry(symmetry):
+    """Only the terms allowed by the symmetry are computed."""
+    ll, cc, mm = scf._scf_symmetry_terms(4, symmetry)
+    allowed = np.zeros((2, 5, 4, 4), dtype=bool)
+    allowed[cc, :, ll, mm] = True
+
+    expected, ecov = scf.scf_compute_coeffs_nbody(
+        pos,
+        mass,
+        5,
+        4,
+        chunksize=100,
+        return_covariance=True,
+    )
+    got, cov = scf.scf_compute_coeffs_nbody(
+        pos,
+        mass,
+        5,
+        4,
+        chunksize=100,
+        return_covariance=True,
+        symmetry=symmetry,
+    )
+    assert np.allclose(got[allowed], expected[allowed])
+    assert np.all(got[~allowed] == 0)
+
+    both = np.outer(allowed.ravel(), allowed.ravel())
+    ecov, cov = ecov.reshape(both.shape), cov.reshape(both.shape)
+    assert np.allclose(cov[both], ecov[both])
+    assert np.all(cov[~both] == 0)
+
+    # and the basis
+    basis = scf.scf_compute_basis_nbody(pos, 5, 4, symmetry=symmetry)
+    assert np.allclose(scf.scf_compute_coeffs_from_basis(basis, mass), got)
+
+
+# /def
+
+
+def test__scf_symmetry_terms():
+    """Test :func:`~discO.extern.galpy_potentials._scf_symmetry_terms`."""
+    ll, cc, mm = scf._scf_symmetry_terms(3)
+    assert len(ll) == 6 + 3  # cos & sin with m <= l, except sin m = 0
+    assert np.all(np.diff(ll) >= 0)
+
+    ll, cc, mm = scf._scf_symmetry_terms(3, "spherical")
+    assert list(zip(ll, cc, mm)) == [(0, 0, 0)]
+
+    ll, cc, mm = scf._scf_symmetry_terms(3, "axisymmetric")
+    assert np.all(mm == 0) and np.all(cc == 0)
+
+    ll, cc, mm = scf._scf_symmetry_terms(3, "reflection")
+    assert np.all((ll + mm) % 2 == 0)
+
+    ll, cc, mm = scf._scf_symmetry_terms(3, "triaxial")
+    assert np.all(ll % 2 == 0) and np.all(mm % 2 == 0) and np.all(cc == 0)
+
+    with pytest.raises(ValueError, match="not supported"):
+        scf._scf_symmetry_terms(3, "not it")
+
+
+# /def
+
+
+@pytest.mark.skipif(not HAS_GALPY, reason="needs galpy")
+def test_scf_compute_coeffs_nbody_galpy():
+    """Test against :func:`~galpy.potential.scf_compute_coeffs_nbody`."""
+    # THIRD PARTY
+    from galpy.potential import scf_compute_coeffs_nbody
+
+    Acos, Asin = scf.scf_compute_coeffs_nbody(pos, mass, 5, 4, a=2.0)
+    gAcos, gAsin = scf_compute_coeffs_nbody(pos, 5, 4, mass=mass, a=2.0)
+
+    assert Acos.shape == gAcos.shape == (5, 4, 4)
+    assert np.allclose(Acos, gAcos)
+    assert np.allclose(Asin, gAsin)
+
+
+# /def
+
+
+@pytest.mark.skipif(not HAS_GALPY, reason="needs galpy")
+def test_scf_compute_grid_basis():
+    """Test against evaluating :class:`~galpy.potential.SCFPotential`."""
+    # THIRD PARTY
+    from galpy.potential import SCFPotential
+
+    rng = np.random.default_rng(4)
+    pots = []
+    for _ in range(2):
+        Acos = np.tril(rng.normal(size=(5, 4, 4)))
+        Asin = np.tril(rng.normal(size=(5, 4, 4)))
+        Asin[:, :, 0] = 0
+        pots.append(SCFPotential(amp=1.3, Acos=Acos, Asin=Asin, a=1.7))
+    coeffs = np.array([p._amp * np.stack((p._Acos, p._Asin)) for p in pots])
+
+    points = rng.normal(size=(3, 20))
+    points[:2, -1] = 0  # on the z-axis
+    R = np.hypot(points[0], points[1])
+    z = points[2]
+    phi = np.arctan2(points[1], points[0])
+
+    basis = scf.scf_compute_grid_basis(points, 5, 4, a=1.7)
+    got = scf.scf_evaluate_from_grid_basis(basis, coeffs)
+    assert got.shape == (2, 20)
+    for pot, value in zip(pots, got):
+        assert np.allclose(value, pot(R, z, phi=phi, use_physical=False))
+
+    basis = scf.scf_compute_grid_basis(
+        points,
+        5,
+        4,
+        a=1.7,
+        observable="density",
+    )
+    got = scf.scf_evaluate_from_grid_basis(basis, coeffs)
+    for pot, value in zip(pots, got):
+        assert np.allclose(value, pot.dens(R, z, phi=phi, use_physical=False))
+
+    basis = scf.scf_compute_grid_basis(
+        points,
+        5,
+        4,
+        a=1.7,
+        observable="force",
+    )
+    got = scf.scf_evaluate_from_grid_basis(basis, coeffs)
+    assert got.shape == (2, 3, 20)
+    for pot, (FR, Fphi, Fz) in zip(pots, got):
+        kw = dict(phi=phi, use_physical=False)
+        assert np.allclose(FR, pot.Rforce(R, z, **kw), equal_nan=True)
+        assert np.allclose(Fz, pot.zforce(R, z, **kw), equal_nan=True)
+        assert np.allclose(
+            Fphi * R,
+            pot.phitorque(R, z, **kw),
+            equal_nan=True,
+        )
+        # NaN on the z-axis, as in galpy
+        assert np.all(np.isnan([FR[-1], Fphi[-1], Fz[-1]]))
+
+    # a single set of coefficients
+    got = scf.scf_evaluate_from_grid_basis(basis, coeffs[0])
+    assert got.shape == (3, 20)
+
+    with pytest.raises(ValueError, match="not supported"):
+        scf.scf_compute_grid_basis(points, 5, 4, observable="not it")
+
+
+# /def
+
+
+##############################################################################
+# END
@@ -8,7 +8,7 @@ __all__ = []
 
 
 # PROJECT-SPECIFIC
-from discO.setup_package import HAS_AGAMA, HAS_GALPY
+from discO.setup_package import HAS_AGAMA, HAS_GALA, HAS_GALPY
 
 if HAS_AGAMA:
     # PROJECT-SPECIFIC
@@ -17,6 +17,13 @@ if HAS_AGAMA:
     __all__ += ["agama"]
 
 
+if HAS_GALA:
+    # PROJECT-SPECIFIC
+    from . import gala
+
+    __all__ += ["gala"]
+
+
 if HAS_GALPY:
     # PROJECT-SPECIFIC
     from . import galpy
@@ -17,7 +17,6 @@ from types import MappingProxyType
 
 # THIRD PARTY
 import agama
-import astropy.coordinates as coord
 
 # PROJECT-SPECIFIC
 import discO.type_hints as TH
@@ -139,7 +138,7 @@ class AGAMAPotentialFitter(PotentialFitter, key="agama"):
 
         Parameters
         ----------
-        sample : coord-like
+        sample : coord-like or `~discO.core.sample.SampleArrays`
 
         Returns
         -------
@@ -178,11 +177,8 @@ class AGAMAPotentialFitter(PotentialFitter, key="agama"):
         )
 
         # --------------
-        if mass is None:
-            mass = sample.mass
-
-        sample = sample.transform_to(frame)  # FIXME!
-        position = sample.represent_as(coord.CartesianRepresentation).xyz.T
+        position, mass = self._cartesian_positions(sample, mass, frame=frame)
+        position = position.T
         # TODO! velocities
 
         particles = (position, mass)
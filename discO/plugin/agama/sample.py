@@ -11,14 +11,11 @@ __all__ = [
 # IMPORTS
 
 # THIRD PARTY
-import astropy.coordinates as coord
-import astropy.units as u
 import numpy as np
-from astropy.coordinates import SkyCoord
 
 # PROJECT-SPECIFIC
 import discO.type_hints as TH
-from discO.core.sample import PotentialSampler
+from discO.core.sample import PotentialSampler, SampleArrays
 from discO.utils.random import RandomLike
 
 ##############################################################################
@@ -62,37 +59,54 @@ class AGAMAPotentialSampler(PotentialSampler, key="agama"):
         SkyCoord
 
         """
-        # Get preferred frame and representation
-        frame = self.frame
         representation_type = self._infer_representation(representation_type)
 
+        samples = self.sample_arrays(n=n, random=random, **kwargs).to_coord(
+            representation_type=representation_type,
+        )
+        samples.potential = self.potential
+
+        return samples
+
+    # /def
+
+    def sample_arrays(
+        self, n: int = 1, *, random: RandomLike = None, **kwargs
+    ) -> SampleArrays:
+        """Sample, returning plain arrays in fixed units.
+
+        Parameters
+        ----------
+        n : int
+            number of samples
+        random : int or |RandomState| or None (optional, keyword-only)
+            Random state.
+        **kwargs:
+            ignored.
+
+        Returns
+        -------
+        `~discO.core.sample.SampleArrays`
+
+        """
         # TODO accepts a potential parameter. what does this do?
         # TODO confirm random seed.
         with self._random_context(random):
             pos, masses = self._potential.sample(n=n)
 
-        # process the position and mass
+        # process the position and mass. Units are set in ``setup_package``.
+        pos = np.asarray(pos, dtype=float)
         if np.shape(pos)[1] == 6:
-            pos, vel = pos[:, :3], pos[:, 3:]  # TODO: vel
-            differentials = dict(
-                s=coord.CartesianDifferential(*vel.T * u.km / u.s),
-            )
+            pos, vel = pos[:, :3], pos[:, 3:]
         else:
-            differentials = None
-        rep = coord.CartesianRepresentation(
-            *pos.T * u.kpc, differentials=differentials
-        )
+            vel = None
 
-        if representation_type is None:
-            representation_type = rep.__class__
-        samples = SkyCoord(
-            frame.realize_frame(rep, representation_type=representation_type),
-            copy=False,
+        return SampleArrays(
+            pos,
+            vel,
+            np.asarray(masses, dtype=float),
+            self.frame,
         )
-        samples.mass = masses * u.solMass
-        samples.potential = self.potential
-
-        return samples
 
     # /def
 
@@ -12,7 +12,12 @@ __all__ = [
 # IMPORTS
 
 # PROJECT-SPECIFIC
+from . import sample
+from .sample import *  # noqa: F401, F403
 from .wrapper import GalaPotentialWrapper
 
+# __all__
+__all__ += sample.__all__  # flatten
+
 ##############################################################################
 # END
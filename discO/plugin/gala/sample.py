@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+
+""":mod:`~gala` Potential Sampler."""
+
+__all__ = [
+    "GalaPotentialSampler",
+]
+
+
+##############################################################################
+# IMPORTS
+
+# PROJECT-SPECIFIC
+from discO.core.sample import RejectionPotentialSampler
+
+##############################################################################
+# CODE
+##############################################################################
+
+
+class GalaPotentialSampler(RejectionPotentialSampler, key="gala"):
+    """Sample a :mod:`~gala` Potential, by rejection from its density.
+
+    :mod:`~gala` potentials have no distribution functions, so only
+    positions are sampled. See
+    :class:`~discO.core.sample.RejectionPotentialSampler`.
+
+    Parameters
+    ----------
+    potential : :class:`~discO.plugin.gala.GalaPotentialWrapper`
+        The potential object.
+    total_mass : |Quantity| (keyword-only)
+        The total mass of the potential. :mod:`~gala` potentials do not
+        evaluate their total mass, so this is required.
+    **kwargs
+        Into :class:`~discO.core.sample.RejectionPotentialSampler`.
+
+    """
+
+
+# /class
+
+
+##############################################################################
+# END
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+
+"""Testing :mod:`~discO.plugin.gala.sample`."""
+
+__all__ = [
+    "Test_GalaPotentialSampler",
+]
+
+
+##############################################################################
+# IMPORTS
+
+# THIRD PARTY
+import astropy.coordinates as coord
+import astropy.units as u
+import gala.potential as gpot
+import numpy as np
+from gala.units import galactic
+
+# PROJECT-SPECIFIC
+from discO.core.sample import PotentialSampler
+from discO.plugin.gala import GalaPotentialWrapper, sample
+
+##############################################################################
+# TESTS
+##############################################################################
+
+
+class Test_GalaPotentialSampler:
+    """Test :class:`~discO.plugin.gala.sample.GalaPotentialSampler`."""
+
+    @classmethod
+    def setup_class(cls):
+        """Setup fixtures for testing."""
+        cls.mass = 1e11 * u.solMass
+        cls.potential = gpot.MiyamotoNagaiPotential(
+            m=cls.mass,
+            a=3 * u.kpc,
+            b=0.3 * u.kpc,
+            units=galactic,
+        )
+
+        cls.inst = PotentialSampler(
+            GalaPotentialWrapper(cls.potential, frame="galactocentric"),
+            total_mass=cls.mass,
+            rmax=300 * u.kpc,
+        )
+
+    # /def
+
+    def test___new__(self):
+        """Test the sampler is found from the registry."""
+        assert isinstance(self.inst, sample.GalaPotentialSampler)
+
+    # /def
+
+    def test___call__(self):
+        """Test method ``__call__`` samples the flattened density."""
+        res = self.inst(20000, random=0)
+
+        assert isinstance(res, coord.SkyCoord)
+        assert np.isclose(res.mass.sum(), self.mass)
+
+        xyz = res.cartesian.xyz.to_value(u.kpc)
+        assert np.allclose(np.median(xyz, axis=1), 0, atol=0.2)
+        # a thin disc
+        assert np.std(xyz[2]) < np.std(xyz[0]) / 10
+        assert np.isclose(np.median(np.abs(xyz[2])), 0.17, atol=0.01)
+
+        assert self.inst.stats["adapted"] == 0
+
+    # /def
+
+
+# /class
+
+##############################################################################
+# END
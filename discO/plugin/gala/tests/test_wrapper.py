@@ -198,6 +198,31 @@ class Test_GalaPotentialWrapperMeta(
 
     # /def
 
+    def test_batch_evaluate(self):
+        """Test method ``batch_evaluate``."""
+        # when there isn't a frame
+        with pytest.raises(TypeError, match="must have a frame."):
+            self.subclass.batch_evaluate(
+                [self.potential],
+                "specific_force",
+                self.points,
+            )
+
+        # each potential is evaluated
+        vfs = self.subclass.batch_evaluate(
+            [self.potential, self.potential],
+            "specific_force",
+            self.points.data,
+        )
+        expected = self.subclass.specific_force(
+            self.potential,
+            self.points.data,
+        )
+        assert len(vfs) == 2
+        assert all(u.allclose(vf.vf_x, expected.vf_x) for vf in vfs)
+
+    # /def
+
     def test_specific_force(self):
         """Test method ``specific_force``."""
         # ---------------
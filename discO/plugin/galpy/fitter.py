@@ -13,19 +13,26 @@ __all__ = [
 
 # BUILT-IN
 import typing as T
+from concurrent.futures import Executor
+from itertools import chain
 
 # THIRD PARTY
-import astropy.coordinates as coord
 import astropy.units as u
-from galpy.potential import SCFPotential, scf_compute_coeffs_nbody
+import numpy as np
+from galpy.potential import SCFPotential
 
 # PROJECT-SPECIFIC
 import discO.type_hints as TH
 from .wrapper import GalpyPotentialWrapper
 from discO.core.fitter import PotentialFitter
-
-# from discO.extern.galpy_potentials import scf_compute_coeffs_nbody
+from discO.extern.galpy_potentials import (
+    scf_compute_basis_nbody,
+    scf_compute_coeffs_from_basis,
+    scf_compute_coeffs_nbody,
+    scf_compute_coeffs_nbody_chunks,
+)
 from discO.utils.coordinates import resolve_representationlike
+from discO.utils.pbar import get_progress_bar
 
 ##############################################################################
 # PARAMETERS
@@ -191,6 +198,10 @@ class GalpySCFPotentialFitter(GalpyPotentialFitter, key="scf"):
         Nmax: int = None,
         Lmax: int = None,
         scale_factor: TH.QuantityType = None,
+        n_jobs: T.Optional[int] = None,
+        executor: T.Optional[Executor] = None,
+        covariance: T.Optional[bool] = None,
+        symmetry: T.Optional[str] = None,
         **kwargs,
     ) -> TH.SkyCoordType:
         """Fit Potential given particles.
@@ -202,7 +213,7 @@ class GalpySCFPotentialFitter(GalpyPotentialFitter, key="scf"):
 
         Parameters
         ----------
-        sample : |CoordinateFrame| or |SkyCoord|
+        sample : coord-like or `~discO.core.sample.SampleArrays`
         mass : |QuantityType|
         Nmax, Lmax : int or None (optional, keyword-only)
             The number of radial (N) and angular (L) coefficients.
@@ -211,6 +222,31 @@ class GalpySCFPotentialFitter(GalpyPotentialFitter, key="scf"):
             initialization. If None set, raises ValueError.
         scale_factor : scalar |Quantity|
             units of distance or dimensionless
+        n_jobs : int or None (optional, keyword-only)
+            Number of processes over which to split the particles when
+            computing the coefficients. None or 1 runs serially, -1 uses all
+            available cores. The result does not depend on `n_jobs`.
+            If None (default) tries to draw from kwargs set at class
+            initialization.
+        executor : Executor or None (optional, keyword-only)
+            A `~concurrent.futures.Executor` over which to split the
+            particles. Overrides `n_jobs`.
+            If None (default) tries to draw from kwargs set at class
+            initialization.
+        covariance : bool or None (optional, keyword-only)
+            Whether to also estimate the covariance of the coefficients from
+            the scatter of the particles' contributions, in the same pass.
+            It is available from ``.coefficients()`` on the fit potential.
+            If None (default) tries to draw from kwargs set at class
+            initialization, else False.
+        symmetry : str or None (optional, keyword-only)
+            Symmetry of the potential: "spherical", "axisymmetric",
+            "reflection" (:math:`z \\rightarrow -z`), or "triaxial".
+            Coefficients that vanish by the symmetry are not computed and are
+            exactly zero. Spherical and axisymmetric potentials only store the
+            :math:`l = 0` and :math:`m = 0` coefficients, respectively.
+            If None (default) tries to draw from kwargs set at class
+            initialization, else no symmetry.
 
         Returns
         -------
@@ -222,14 +258,259 @@ class GalpySCFPotentialFitter(GalpyPotentialFitter, key="scf"):
             If `Nmax`, `Lmax` are None and no default set at initialization.
 
         """
+        Nmax, Lmax, scale_factor, kw = self._parse_options(
+            Nmax=Nmax,
+            Lmax=Lmax,
+            scale_factor=scale_factor,
+            n_jobs=n_jobs,
+            executor=executor,
+            covariance=covariance,
+            symmetry=symmetry,
+            **kwargs,
+        )
+        covariance = kw.pop("covariance", False)
+        symmetry = kw.pop("symmetry", None)
+
         # --------------
 
-        if mass is None:
-            mass = sample.mass
+        position, mass = self._cartesian_positions(sample, mass)
+
+        # a dimensionless scale factor is assigned the same units as the
+        # positions, so that (r / a) does not introduce an inadvertent scaling
+        # from the units.
+        if scale_factor.unit == u.one:
+            scale_factor = scale_factor.value * position.unit
+
+        # TODO don't do ``to_value`` when galpy supports units
+        result = scf_compute_coeffs_nbody(
+            position.to_value(position.unit),
+            mass=mass.to_value(1e12 * u.solMass),
+            N=Nmax,
+            L=Lmax,
+            a=scale_factor.to_value(position.unit),
+            return_covariance=covariance,
+            symmetry=symmetry,
+            **kw,
+        )
+        (Acos, Asin), cov = result if covariance else (result, None)
+
+        return self._make_potential(
+            mass,
+            Acos,
+            Asin,
+            scale_factor,
+            cov,
+            symmetry=symmetry,
+        )
+
+    # /def
+
+    def fit_chunks(
+        self,
+        chunks: T.Iterable[TH.CoordinateType],
+        *,
+        Nmax: int = None,
+        Lmax: int = None,
+        scale_factor: TH.QuantityType = None,
+        **kwargs,
+    ) -> GalpyPotentialWrapper:
+        """Fit a sample given in chunks, accumulating the coefficients.
+
+        Only one chunk is in memory at a time. The coefficients are the
+        same as from fitting the joined chunks with ``__call__``, up to the
+        floating-point summation order.
+
+        Parameters
+        ----------
+        chunks : iterable of coord-like or `~discO.core.sample.SampleArrays`
+            Each of shape (nchunk, ), with masses. E.g. from
+            ``PotentialSampler.sample_chunks``.
+        Nmax, Lmax : int or None (optional, keyword-only)
+        scale_factor : scalar |Quantity| or None (optional, keyword-only)
+        **kwargs
+            See ``__call__``.
+
+        Returns
+        -------
+        :class:`~discO.plugin.galpy.GalpyPotentialWrapper`
+
+        """
+        Nmax, Lmax, scale_factor, kw = self._parse_options(
+            Nmax=Nmax,
+            Lmax=Lmax,
+            scale_factor=scale_factor,
+            **kwargs,
+        )
+        covariance = kw.pop("covariance", False)
+        symmetry = kw.pop("symmetry", None)
+
+        # a dimensionless scale factor is in the units of the positions,
+        # taken from the first chunk.
+        chunks = iter(chunks)
+        position, mass = self._cartesian_positions(next(chunks))
+        unit = position.unit
+        if scale_factor.unit == u.one:
+            scale_factor = scale_factor.value * unit
+
+        total_mass = []  # of each chunk
+
+        def arrays() -> T.Iterator[T.Tuple[np.ndarray, np.ndarray]]:
+            for pos, m in chain(
+                [(position, mass)],
+                map(self._cartesian_positions, chunks),
+            ):
+                total_mass.append(m.sum())
+                yield pos.to_value(unit), m.to_value(1e12 * u.solMass)
+
+        result = scf_compute_coeffs_nbody_chunks(
+            arrays(),
+            N=Nmax,
+            L=Lmax,
+            a=scale_factor.to_value(unit),
+            return_covariance=covariance,
+            symmetry=symmetry,
+            **kw,
+        )
+        (Acos, Asin), cov = result if covariance else (result, None)
+
+        return self._make_potential(
+            u.Quantity(total_mass).sum(),
+            Acos,
+            Asin,
+            scale_factor,
+            cov,
+            symmetry=symmetry,
+        )
+
+    # /def
+
+    def _run_iter(
+        self,
+        sample: TH.CoordinateType,
+        mass: T.Optional[TH.QuantityType] = None,
+        *,
+        weights: T.Optional[np.ndarray] = None,
+        progress: bool = True,
+        **kwargs,
+    ) -> object:
+        """Fit.
+
+        If `weights` are given the per-particle SCF basis is computed once and
+        each iteration's coefficients are a weighted sum over the basis.
+        This is much faster than fitting each iteration separately, at the
+        cost of memory: see
+        :func:`~discO.extern.galpy_potentials.scf_compute_basis_nbody`.
+
+        Parameters
+        ----------
+        sample : coord-like or `~discO.core.sample.SampleArrays`
+            can have shape (nsamp, ) or (nsamp, niter)
+        mass : `~astropy.units.Quantity`
+            The mass.
+        weights : (nsamp, niter) array or None (optional, keyword-only)
+            Multiplicities of the particles in each iteration, eg. from a
+            multinomial draw when bootstrapping. `sample` must have shape
+            (nsamp, ).
+        **kwargs
+            passed to fitting potential.
+
+        Yields
+        ------
+        :class:`~discO.plugin.galpy.GalpyPotentialWrapper`
+
+        """
+        if weights is None:
+            yield from super()._run_iter(
+                sample,
+                mass=mass,
+                progress=progress,
+                **kwargs,
+            )
+            return
+
+        weights = self._resolve_weights(sample, weights)
+        Nmax, Lmax, scale_factor, kw = self._parse_options(**kwargs)
+        covariance = kw.pop("covariance", False)
+        symmetry = kw.pop("symmetry", None)
+
+        position, mass = self._cartesian_positions(sample, mass)
+        if scale_factor.unit == u.one:
+            scale_factor = scale_factor.value * position.unit
+
+        basis = scf_compute_basis_nbody(
+            position.to_value(position.unit),
+            N=Nmax,
+            L=Lmax,
+            a=scale_factor.to_value(position.unit),
+            symmetry=symmetry,
+            **{k: kw[k] for k in ("chunksize",) if k in kw},
+        )
+
+        with get_progress_bar(progress, weights.shape[1]) as pbar:
+
+            for weight in weights.T:
+                pbar.update(1)
+
+                result = scf_compute_coeffs_from_basis(
+                    basis,
+                    mass.to_value(1e12 * u.solMass),
+                    weights=weight,
+                    return_covariance=covariance,
+                )
+                (Acos, Asin), cov = result if covariance else (result, None)
+
+                yield self._make_potential(
+                    mass * weight,
+                    Acos,
+                    Asin,
+                    scale_factor,
+                    cov,
+                    symmetry=symmetry,
+                )
+
+    # /def
+
+    #######################################################
+    # Utils
+
+    def _parse_options(
+        self,
+        *,
+        Nmax: T.Optional[int] = None,
+        Lmax: T.Optional[int] = None,
+        scale_factor: T.Optional[TH.QuantityType] = None,
+        **kwargs,
+    ) -> T.Tuple[int, int, TH.QuantityType, T.Dict[str, T.Any]]:
+        """Resolve fit options, defaulting to those set at initialization.
+
+        Parameters
+        ----------
+        Nmax, Lmax : int or None (optional, keyword-only)
+        scale_factor : scalar |Quantity| or None (optional, keyword-only)
+        **kwargs
+            Other options. Options that are None are set from the defaults.
+
+        Returns
+        -------
+        Nmax, Lmax : int
+        scale_factor : scalar |Quantity|
+        kwargs : dict
+            Other options, for
+            :func:`~discO.extern.galpy_potentials.scf_compute_coeffs_nbody`.
 
+        Raises
+        ------
+        ValueError
+            If `Nmax`, `Lmax` are None and no default set at initialization.
+            If `Nmax`, `Lmax` are < 0.
+            If `scale_factor` is not a scalar.
+        `~astropy.units.UnitsError`
+            If `scale_factor` is not a length or dimensionless.
+
+        """
         # kwargs
         kw = dict(self.potential_kwargs.items())  # deepcopy MappingProxyType
-        kw.update(kwargs)
+        kw.update({k: v for k, v in kwargs.items() if v is not None})
 
         # get from defaults if not passed
         _Nmax = kw.pop("Nmax", None)  # always try to pop
@@ -247,13 +528,6 @@ class GalpySCFPotentialFitter(GalpyPotentialFitter, key="scf"):
             scale_factor if scale_factor is not None else _scale_factor
         )
 
-        # --------------
-
-        representation_type = resolve_representationlike(
-            self.representation_type,
-            error_if_not_type=False,
-        )
-
         # --------------
         # Validation
 
@@ -267,36 +541,77 @@ class GalpySCFPotentialFitter(GalpyPotentialFitter, key="scf"):
         elif not scale_factor.isscalar:
             raise ValueError("scale factor must be a scalar.")
 
-        # --------------
+        return Nmax, Lmax, scale_factor, kw
 
-        sample = sample.transform_to(self.frame)
-        position = sample.represent_as(coord.CartesianRepresentation).xyz
+    # /def
 
-        # a dimensionless scale factor is assigned the same units as the
-        # positions, so that (r / a) does not introduce an inadvertent scaling
-        # from the units.
-        if scale_factor.unit == u.one:
-            scale_factor = scale_factor.value * position.unit
+    def _make_potential(
+        self,
+        mass: TH.QuantityType,
+        Acos: np.ndarray,
+        Asin: np.ndarray,
+        scale_factor: TH.QuantityType,
+        covariance: T.Optional[np.ndarray] = None,
+        *,
+        symmetry: T.Optional[str] = None,
+    ) -> GalpyPotentialWrapper:
+        """Make the wrapped :class:`~galpy.potential.SCFPotential`.
 
-        # TODO don't do ``to_value`` when galpy supports units
-        Acos, Asin = scf_compute_coeffs_nbody(
-            position.to_value(position.unit),
-            mass=mass.to_value(1e12 * u.solMass),
-            N=Nmax,
-            L=Lmax,
-            a=scale_factor.to_value(position.unit),
-            **kw,
+        Parameters
+        ----------
+        mass : |Quantity|
+        Acos, Asin : (N, L, L) ndarray
+        scale_factor : scalar |Quantity|
+        covariance : (2, N, L, L, 2, N, L, L) ndarray or None (optional)
+            The covariance of (Acos, Asin). If not None, it is converted to
+            galpy's normalization of the coefficients and stored on the
+            wrapper, for ``coefficients()``.
+        symmetry : str or None (optional, keyword-only)
+            The symmetry of the coefficients. Spherical and axisymmetric
+            potentials only keep the :math:`l = 0` and :math:`m = 0`
+            coefficients, respectively. Stored on the wrapper.
+
+        Returns
+        -------
+        :class:`~discO.plugin.galpy.GalpyPotentialWrapper`
+
+        """
+        representation_type = resolve_representationlike(
+            self.representation_type,
+            error_if_not_type=False,
+        )
+
+        # drop the storage of coefficients that vanish
+        if symmetry == "spherical":
+            Acos, Asin = Acos[:, :1, :1], None
+        elif symmetry == "axisymmetric":
+            Acos, Asin = Acos[:, :, :1], None
+
+        if covariance is not None:
+            _, L, M = Acos.shape
+            covariance = covariance[:, :, :L, :M, :, :, :L, :M]
+
+        potential = self.potential_cls(
+            amp=mass.sum(),
+            Acos=Acos,
+            Asin=Asin,
+            a=scale_factor,
         )
 
+        if covariance is not None:
+            # galpy stores the coefficients multiplied by a normalization
+            NN = potential._Nroot(*Acos.shape[1:])
+            NN = np.broadcast_to(NN, (2, *Acos.shape)).ravel()
+            covariance = (
+                NN[:, None] * covariance.reshape(len(NN), -1) * NN[None, :]
+            ).reshape(covariance.shape)
+
         return GalpyPotentialWrapper(
-            self.potential_cls(
-                amp=mass.sum(),
-                Acos=Acos,
-                Asin=Asin,
-                a=scale_factor,
-            ),
+            potential,
             frame=self.frame,
             representation_type=representation_type,
+            symmetry=symmetry,
+            covariance=covariance,
         )
 
     # /def
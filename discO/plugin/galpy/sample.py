@@ -14,13 +14,12 @@ __all__ = [
 import typing as T
 
 # THIRD PARTY
-import astropy.coordinates as coord
 import galpy.df as gdf
 import numpy as np
 
 # PROJECT-SPECIFIC
 import discO.type_hints as TH
-from discO.core.sample import PotentialSampler
+from discO.core.sample import PotentialSampler, SampleArrays
 from discO.core.wrapper import PotentialWrapper
 from discO.utils.random import RandomLike
 
@@ -69,24 +68,28 @@ class GalpyPotentialSampler(PotentialSampler, key="galpy"):
         representation_type: TH.OptRepresentationLikeType = None,
         **defaults
     ):
-        # infer DF class if None
-        if df is None:
-            df = DF_REGISTRY[potential.wrapped.__class__.__name__]
-
-        # create DF instance
-        df = df(potential.wrapped, **(df_kwargs or {}))
-
-        # initialize & store DF
         super().__init__(
             potential,
             representation_type=representation_type,
             total_mass=total_mass,
             **defaults
         )
-        self._df: gdf.df.df = df
 
         # make sure physical is on  # TODO enfore more strictly
         getattr(self._potential, "turn_physical_on", object)()
+
+        # infer DF class if None
+        if df is None:
+            df = DF_REGISTRY[potential.wrapped.__class__.__name__]
+
+        # create DF instance, or get an equal one (with its sampling tables)
+        # from the cache.
+        df_kwargs = df_kwargs or {}
+        self._df: gdf.df.df = self._cached(
+            "df",
+            (df, df_kwargs),
+            lambda: df(potential.wrapped, **df_kwargs),
+        )
         getattr(self._df._pot, "turn_physical_on", object)()
 
     # /def
@@ -122,10 +125,37 @@ class GalpyPotentialSampler(PotentialSampler, key="galpy"):
         :class:`~astropy.coordinates.SkyCoord`
 
         """
-        # Get preferred frames
-        frame = self.frame
         representation_type = self._infer_representation(representation_type)
 
+        samples = self.sample_arrays(n=n, random=random, **kwargs).to_coord(
+            representation_type=representation_type,
+        )
+        # TODO! better storage of these properties, so stay when transform.
+        samples.potential = self.potential
+
+        return samples
+
+    # /def
+
+    def sample_arrays(
+        self, n: int = 1, *, random: RandomLike = None, **kwargs
+    ) -> SampleArrays:
+        """Sample, returning plain arrays in fixed units.
+
+        Parameters
+        ----------
+        n : int (optional)
+            number of samples
+        random : int or |RandomState| or None (optional, keyword-only)
+            Random state.
+        **kwargs
+            ignored
+
+        Returns
+        -------
+        `~discO.core.sample.SampleArrays`
+
+        """
         # can't pass a random seed, set in context
         with self._random_context(random):
             orbits = self._df.sample(
@@ -136,32 +166,23 @@ class GalpyPotentialSampler(PotentialSampler, key="galpy"):
                 return_orbit=True,
             )
 
+        # physical floats are in kpc and km / s
         t = orbits.time()
-        dif = coord.CartesianDifferential(
-            d_x=orbits.vx(t, use_physical=True),
-            d_y=orbits.vy(t, use_physical=True),
-            d_z=orbits.vz(t, use_physical=True),
-        )
-        rep = coord.CartesianRepresentation(
-            x=orbits.x(t, use_physical=True),
-            y=orbits.y(t, use_physical=True),
-            z=orbits.z(t, use_physical=True),
-            differentials=dict(s=dif),
-        )
+        kw = dict(use_physical=True, quantity=False)
+        positions = np.empty((n, 3))
+        positions[:, 0] = orbits.x(t, **kw)
+        positions[:, 1] = orbits.y(t, **kw)
+        positions[:, 2] = orbits.z(t, **kw)
+        velocities = np.empty((n, 3))
+        velocities[:, 0] = orbits.vx(t, **kw)
+        velocities[:, 1] = orbits.vy(t, **kw)
+        velocities[:, 2] = orbits.vz(t, **kw)
 
-        if representation_type is None:
-            representation_type = rep.__class__
-        samples = coord.SkyCoord(
-            frame.realize_frame(rep, representation_type=representation_type),
-            copy=False,
-        )
-
-        # TODO! better storage of these properties, so stay when transform.
-        samples.potential = self.potential
         # from init if divergent mass, preloaded total_mass() otherwise.
-        samples.mass = np.ones(n) * self._total_mass / n  # AGAMA compatibility
+        mass = self._total_mass.to_value(SampleArrays.units["masses"]) / n
+        masses = np.full(n, mass)  # AGAMA compatibility
 
-        return samples
+        return SampleArrays(positions, velocities, masses, self.frame)
 
     # /def
 
@@ -11,12 +11,18 @@ __all__ = [
 ##############################################################################
 # IMPORTS
 
+# BUILT-IN
+import pickle
+
 # THIRD PARTY
+import astropy.coordinates as coord
 import astropy.units as u
+import numpy as np
 import pytest
 from galpy import potential as gpot
 
 # PROJECT-SPECIFIC
+from discO.core.sample import SampleArrays
 from discO.core.tests.test_fitter import (
     Test_PotentialFitter as PotentialFitterTester,
 )
@@ -190,7 +196,281 @@ class Test_GalpySCFPotentialFitter(
         with pytest.raises(ValueError, match="scale factor must be a scalar."):
             self.inst(None, scale_factor=[1, 2] * u.km, mass=1 * u.solMass)
 
-        # TODO! actually run tests
+        # -------------------
+        # compare against galpy
+
+        rng = np.random.default_rng(0)
+        xyz = rng.normal(size=(3, 100)) * u.kpc
+        mass = np.ones(100) * 1e10 * u.solMass
+        sample = coord.SkyCoord(
+            coord.Galactocentric(coord.CartesianRepresentation(xyz)),
+        )
+
+        fit = self.inst(sample, mass=mass, scale_factor=2 * u.kpc)
+        coeffs = fit.coefficients()
+
+        Acos, Asin = gpot.scf_compute_coeffs_nbody(
+            xyz.to_value(u.kpc),
+            4,
+            3,
+            mass=mass.to_value(1e12 * u.solMass),
+            a=2,
+        )
+        expected = gpot.SCFPotential(
+            amp=mass.sum(),
+            Acos=Acos,
+            Asin=Asin,
+            a=2 * u.kpc,
+        )
+        assert np.allclose(coeffs["Acos"], expected._Acos)
+        assert np.allclose(coeffs["Asin"], expected._Asin)
+
+    # /def
+
+    def test___call__arrays(self):
+        """Fits of sample arrays match fits of coordinates."""
+        rng = np.random.default_rng(3)
+        xyz = rng.normal(size=(3, 50)) * u.kpc
+        sample = coord.SkyCoord(
+            coord.Galactocentric(coord.CartesianRepresentation(xyz)),
+        )
+        sample.mass = np.ones(50) * 1e10 * u.solMass
+        arrs = SampleArrays.from_coord(sample)
+
+        fit = self.inst(arrs, scale_factor=2 * u.kpc)
+        expected = self.inst(sample, scale_factor=2 * u.kpc)
+        assert np.allclose(
+            fit.coefficients()["Acos"],
+            expected.coefficients()["Acos"],
+        )
+
+        # in another frame, the arrays are transformed
+        icrs = SampleArrays.from_coord(sample.icrs, mass=sample.mass)
+        fit = self.inst(icrs, scale_factor=2 * u.kpc)
+        assert np.allclose(
+            fit.coefficients()["Acos"],
+            expected.coefficients()["Acos"],
+        )
+
+        # (N, iterations) arrays are split into iterations
+        fits = tuple(
+            self.inst.run(
+                SampleArrays.stack([arrs, arrs]),
+                scale_factor=2 * u.kpc,
+                progress=False,
+            ),
+        )
+        assert len(fits) == 2
+        for fit in fits:
+            assert np.allclose(
+                fit.coefficients()["Acos"],
+                expected.coefficients()["Acos"],
+            )
+
+    # /def
+
+    @pytest.mark.parametrize("covariance", [False, True])
+    def test_fit_chunks(self, covariance):
+        """Fits accumulated over chunks match fitting the whole sample."""
+        rng = np.random.default_rng(5)
+        xyz = rng.normal(size=(3, 60)) * u.kpc
+        sample = coord.SkyCoord(
+            coord.Galactocentric(coord.CartesianRepresentation(xyz)),
+        )
+        sample.mass = rng.uniform(1, 2, size=60) * 1e10 * u.solMass
+        arrs = SampleArrays.from_coord(sample)
+
+        # arrays and coordinates, in any frame
+        rest = sample[25:].icrs
+        rest.mass = sample.mass[25:]
+        chunks = [
+            arrs._replace(
+                positions=arrs.positions[:25], masses=arrs.masses[:25]
+            ),
+            rest,
+        ]
+
+        expected = self.inst(
+            sample,
+            scale_factor=2 * u.kpc,
+            covariance=covariance,
+        )
+        fits = (
+            self.inst.fit_chunks(
+                iter(chunks),
+                scale_factor=2 * u.kpc,
+                covariance=covariance,
+            ),
+            # the default joins the chunks
+            fitter.PotentialFitter.fit_chunks(
+                self.inst,
+                chunks,
+                scale_factor=2 * u.kpc,
+                covariance=covariance,
+            ),
+        )
+        for fit in fits:
+            assert isinstance(fit, GalpyPotentialWrapper)
+            assert np.isclose(fit.wrapped._amp, expected.wrapped._amp)
+            coeffs = fit.coefficients()
+            for key, value in expected.coefficients().items():
+                if key != "type":
+                    assert np.allclose(coeffs[key], value)
+
+    # /def
+
+    def test_run_weights_fastpath(self):
+        """Weighted fits match fitting the re-weighted masses directly."""
+        rng = np.random.default_rng(1)
+        xyz = rng.normal(size=(3, 50)) * u.kpc
+        sample = coord.SkyCoord(
+            coord.Galactocentric(coord.CartesianRepresentation(xyz)),
+        )
+        sample.mass = np.ones(50) * 1e10 * u.solMass
+        weights = rng.multinomial(50, np.ones(50) / 50, size=4).T
+
+        fits = tuple(
+            self.inst.run(
+                sample,
+                weights=weights,
+                covariance=True,
+                progress=False,
+            ),
+        )
+
+        assert len(fits) == 4
+        for fit, weight in zip(fits, weights.T):
+            expected = self.inst(sample, mass=sample.mass * weight)
+            assert np.allclose(
+                fit.coefficients()["Acos"],
+                expected.coefficients()["Acos"],
+            )
+            assert np.allclose(
+                fit.coefficients()["Asin"],
+                expected.coefficients()["Asin"],
+            )
+
+            # the covariance is that of the explicitly resampled particles
+            index = np.repeat(np.arange(50), weight)
+            resampled = self.inst(
+                sample[index],
+                mass=sample.mass[index],
+                covariance=True,
+            )
+            assert np.allclose(
+                fit.coefficients()["covariance"],
+                resampled.coefficients()["covariance"],
+            )
+
+    # /def
+
+    @pytest.mark.parametrize("weighted", [False, True])
+    def test_covariance(self, weighted):
+        """Coefficient covariances are exposed by ``coefficients()``."""
+        rng = np.random.default_rng(2)
+        xyz = rng.normal(size=(3, 50)) * u.kpc
+        sample = coord.SkyCoord(
+            coord.Galactocentric(coord.CartesianRepresentation(xyz)),
+        )
+        sample.mass = np.ones(50) * 1e10 * u.solMass
+
+        if weighted:
+            weights = np.ones((50, 1), dtype=int)
+            (fit,) = self.inst.run(
+                sample,
+                weights=weights,
+                covariance=True,
+                progress=False,
+            )
+        else:
+            fit = self.inst(sample, covariance=True)
+
+        coeffs = fit.coefficients()
+        shape = coeffs["Acos"].shape
+        assert coeffs["covariance"].shape == (2, *shape) * 2
+        assert coeffs["Acos_var"].shape == shape
+        assert coeffs["Asin_var"].shape == shape
+        assert np.all(coeffs["Acos_var"] >= 0)
+
+        # the variance is in galpy's normalization, like the coefficients
+        flat = coeffs["covariance"].reshape(2 * coeffs["Acos"].size, -1)
+        assert np.allclose(
+            np.diagonal(flat).reshape((2, *shape))[0],
+            coeffs["Acos_var"],
+        )
+
+        # no covariance by default
+        assert "covariance" not in self.inst(sample).coefficients()
+
+    # /def
+
+    @pytest.mark.parametrize(
+        "symmetry, shape",
+        [
+            ("spherical", (4, 1, 1)),
+            ("axisymmetric", (4, 3, 1)),
+            ("reflection", (4, 3, 3)),
+            ("triaxial", (4, 3, 3)),
+        ],
+    )
+    def test_symmetry(self, symmetry, shape):
+        """Coefficients that vanish by symmetry are zero or not stored."""
+        rng = np.random.default_rng(3)
+        xyz = rng.normal(size=(3, 50)) * u.kpc
+        sample = coord.SkyCoord(
+            coord.Galactocentric(coord.CartesianRepresentation(xyz)),
+        )
+        sample.mass = np.ones(50) * 1e10 * u.solMass
+
+        fit = self.inst(
+            sample,
+            Nmax=4,
+            Lmax=3,
+            symmetry=symmetry,
+            covariance=True,
+        )
+        expected = self.inst(sample, Nmax=4, Lmax=3).coefficients()
+
+        coeffs = fit.coefficients()
+        assert coeffs["symmetry"] == symmetry
+        assert coeffs["Acos"].shape == shape
+        assert coeffs["covariance"].shape == (2, *shape) * 2
+
+        # stored on the wrapper, not the galpy potential, and kept when
+        # re-wrapping and pickling
+        assert not hasattr(fit.__wrapped__, "_symmetry")
+        for other in (
+            GalpyPotentialWrapper(fit, frame="icrs"),
+            pickle.loads(pickle.dumps(fit)),
+        ):
+            assert other.coefficients()["symmetry"] == symmetry
+            assert np.array_equal(
+                other.coefficients()["covariance"],
+                coeffs["covariance"],
+            )
+
+        _, L, M = shape
+        Acos = expected["Acos"][:, :L, :M]
+        nonzero = coeffs["Acos"] != 0
+        assert np.allclose(coeffs["Acos"][nonzero], Acos[nonzero])
+
+        if symmetry == "reflection":  # l + m odd vanish
+            assert np.all(coeffs["Acos"][:, 1, 0] == 0)
+            assert np.all(coeffs["Asin"][:, 2, 1] == 0)
+        elif symmetry == "triaxial":
+            assert np.all(coeffs["Asin"] == 0)
+            assert np.all(coeffs["Acos"][:, 2, 1] == 0)
+
+        # and the bootstrap fast path
+        (fit,) = self.inst.run(
+            sample,
+            weights=np.ones((50, 1)),
+            Nmax=4,
+            Lmax=3,
+            symmetry=symmetry,
+            progress=False,
+        )
+        assert np.allclose(fit.coefficients()["Acos"], coeffs["Acos"])
 
     # /def
 
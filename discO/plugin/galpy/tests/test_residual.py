@@ -182,6 +182,45 @@ class Test_GridResidual_Galpy(GridResidual_Test, obj=residual.GridResidual):
 
     # /def
 
+    def test_run_scf_batch(self):
+        """Test method ``run`` with many SCF potentials, evaluated together."""
+        rng = np.random.default_rng(0)
+        pots = []
+        for _ in range(3):
+            Acos = np.tril(rng.normal(size=(4, 3, 3)))
+            Asin = np.tril(rng.normal(size=(4, 3, 3)))
+            Asin[:, :, 0] = 0
+            pots.append(
+                gpot.SCFPotential(
+                    amp=1e12 * u.solMass,
+                    Acos=Acos,
+                    Asin=Asin,
+                    a=10 * u.kpc,
+                ),
+            )
+
+        inst = self.klass(
+            grid=self.points,
+            original_potential=self.original_potential,
+            observable=self.observable,
+            representation_type=coord.CartesianRepresentation,
+        )
+        resids = inst.run(pots, batch=True, progress=False)
+
+        assert len(resids) == 3
+        assert len(inst._grid_cache) == 1  # basis is cached
+        for pot, resid in zip(pots, resids):
+            expected = inst(pot)
+            assert isinstance(resid, vectorfield.CartesianVectorField)
+            assert u.allclose(resid.vf_x, expected.vf_x)
+            assert u.allclose(resid.vf_z, expected.vf_z)
+
+        # setting the grid resets the cache
+        inst.points = self.points
+        assert inst._grid_cache == {}
+
+    # /def
+
 
 # /class
 
@@ -4,6 +4,8 @@
 
 __all__ = [
     "Test_GalpyPotentialSampler",
+    "Test_SphericalPotentialSampler",
+    "Test_RejectionPotentialSampler",
 ]
 
 
@@ -19,8 +21,15 @@ from galpy.df import isotropicHernquistdf
 from galpy.potential import HernquistPotential
 
 # PROJECT-SPECIFIC
+from discO.config import conf
+from discO.core.sample import (
+    SAMPLER_CACHE,
+    RejectionPotentialSampler,
+    SphericalPotentialSampler,
+)
 from discO.core.tests.test_sample import Test_PotentialSampler
 from discO.plugin.galpy import GalpyPotentialWrapper, sample
+from discO.utils.cache import LRUCache, hash_key
 
 ##############################################################################
 # TESTS
@@ -59,6 +68,17 @@ class Test_GalpyPotentialSampler(
 
     # /def
 
+    def test_sample_arrays_default_mass(self):
+        """Test the default total mass, which galpy can give as a float."""
+        potential = HernquistPotential(amp=2)  # no physical outputs
+        inst = self.obj(GalpyPotentialWrapper(potential))
+        assert inst._total_mass == 1 * u.solMass
+
+        arrs = inst.sample_arrays(10, random=0)
+        assert np.isclose(arrs.masses.sum(), 1)
+
+    # /def
+
     # -------------------------------
 
     def test___call__(self):
@@ -106,6 +126,59 @@ class Test_GalpyPotentialSampler(
 
     # /def
 
+    def test_df_cache(self):
+        """Test the DF is shared between samplers of equal potentials."""
+        potential = HernquistPotential(amp=2 * self.mass)
+        potential.turn_physical_on()
+        inst = self.obj(GalpyPotentialWrapper(potential))
+        assert inst._df is self.inst._df
+
+        # a different potential
+        potential = HernquistPotential(amp=self.mass)
+        potential.turn_physical_on()
+        inst = self.obj(GalpyPotentialWrapper(potential))
+        assert inst._df is not self.inst._df
+
+        # opt out
+        with conf.set_temp("sampler_cache", False):
+            inst = self.obj(GalpyPotentialWrapper(self.potential))
+        assert inst._df is not self.inst._df
+
+    # /def
+
+    def test_df_cache_size(self):
+        """Test the cache follows ``conf.sampler_cache_size`` at runtime."""
+        potential = HernquistPotential(amp=3 * self.mass)
+        potential.turn_physical_on()
+        items = dict(SAMPLER_CACHE)  # restored, for the other tests
+
+        with conf.set_temp("sampler_cache_size", 1):
+            self.obj(GalpyPotentialWrapper(potential))
+            assert SAMPLER_CACHE.maxsize == 1
+            assert len(SAMPLER_CACHE) == 1
+
+        self.obj(GalpyPotentialWrapper(potential))
+        assert SAMPLER_CACHE.maxsize == conf.sampler_cache_size
+
+        SAMPLER_CACHE.update(items)
+
+    # /def
+
+    def test_df_cache_dump_load(self, tmp_path):
+        """Test the cached DFs, with their tables, can be loaded from disk."""
+        self.inst(10, random=0)  # build the DF's sampling tables
+        path = tmp_path / "cache.pkl"
+        SAMPLER_CACHE.dump(path)
+
+        cache = LRUCache()
+        cache.load(path)
+        df = cache[hash_key(self.potential, "df", (type(self.df), {}))]
+
+        assert df is not self.inst._df
+        assert hasattr(df, "_v_vesc_pvr_interpolator")
+
+    # /def
+
     @pytest.mark.skip("TODO https://github.com/jobovy/galpy/pull/443")
     def test_specific_call(self):
         assert NotImplementedError("See above.")
@@ -144,5 +217,311 @@ class Test_GalpyPotentialSampler(
 # -------------------------------------------------------------------
 
 
+class Test_SphericalPotentialSampler:
+    """Test :class:`~discO.core.sample.SphericalPotentialSampler`."""
+
+    @classmethod
+    def setup_class(cls):
+        """Setup fixtures for testing."""
+        cls.mass = 1e12 * u.solMass
+        cls.potential = HernquistPotential(amp=2 * cls.mass, a=10 * u.kpc)
+        cls.potential.turn_physical_on()
+
+        cls.inst = SphericalPotentialSampler(
+            GalpyPotentialWrapper(cls.potential, frame="galactocentric"),
+        )
+
+    # /def
+
+    def test___init__(self):
+        """Test method ``__init__``."""
+        with pytest.raises(ValueError, match="rmin < rmax"):
+            SphericalPotentialSampler(
+                self.inst.potential,
+                rmin=1 * u.kpc,
+                rmax=1 * u.pc,
+            )
+
+    # /def
+
+    def test_table(self):
+        """Test attribute ``table`` is cached across samplers."""
+        table = self.inst.table
+        assert table[0] == 0
+        assert np.all(np.diff(table) >= 0)
+
+        other = SphericalPotentialSampler(self.inst.potential)
+        assert other.table is table
+
+        other = SphericalPotentialSampler(self.inst.potential, num=100)
+        assert other.table is not table
+
+        with conf.set_temp("sampler_cache", False):
+            other = SphericalPotentialSampler(self.inst.potential)
+            assert other.table is not table
+            assert np.array_equal(other.table, table)
+
+    # /def
+
+    def test_sample_arrays_default_mass(self):
+        """Test the default total mass, which galpy can give as a float."""
+        potential = HernquistPotential(amp=2)  # no physical outputs
+        inst = SphericalPotentialSampler(GalpyPotentialWrapper(potential))
+        assert inst._total_mass == 1 * u.solMass
+
+        arrs = inst.sample_arrays(10, random=0)
+        assert np.isclose(arrs.masses.sum(), 1)
+
+    # /def
+
+    def test_sample_arrays(self):
+        """Test method ``sample_arrays`` follows the enclosed mass."""
+        arrs = self.inst.sample_arrays(100000, random=0)
+
+        assert arrs.positions.shape == (100000, 3)
+        assert arrs.velocities is None
+        assert np.isclose(arrs.masses.sum(), self.mass.value)
+
+        r = np.linalg.norm(arrs.positions, axis=1)
+        for radius in (1, 10, 100) * u.kpc:
+            expected = self.potential.mass(radius) / self.potential.mass(
+                1e4 * u.kpc,
+            )
+            assert np.isclose(np.mean(r < radius.value), expected, atol=5e-3)
+
+        # isotropic
+        unit = arrs.positions / r[:, None]
+        assert np.allclose(unit.mean(axis=0), 0, atol=0.01)
+
+        # random state
+        arrs2 = self.inst.sample_arrays(10, random=np.random.default_rng(1))
+        arrs3 = self.inst.sample_arrays(10, random=np.random.default_rng(1))
+        assert np.array_equal(arrs2.positions, arrs3.positions)
+
+        # the azimuth is in double precision
+        *_, phi = np.random.default_rng(1).random((3, 10))
+        x, y, _ = arrs2.positions.T
+        got = np.mod(np.arctan2(y, x), 2 * np.pi)
+        assert np.allclose(got, 2 * np.pi * phi, rtol=1e-12, atol=0)
+
+    # /def
+
+    def test___call__(self):
+        """Test method ``__call__``."""
+        res = self.inst(10, random=0)
+
+        assert isinstance(res, coord.SkyCoord)
+        assert res.potential is self.inst.potential
+        assert np.isclose(res.mass.sum(), self.mass)
+        assert np.allclose(
+            res.cartesian.xyz.to_value(u.kpc).T,
+            self.inst.sample_arrays(10, random=0).positions,
+        )
+
+    # /def
+
+    @pytest.mark.parametrize("qmc", ["sobol", "halton"])
+    def test_sample_arrays_qmc(self, qmc):
+        """Test quasi-random sampling, which reduces the variance."""
+        rng = np.random.default_rng(1)
+        radius = 10  # kpc
+        expected = self.potential.mass(radius * u.kpc) / self.potential.mass(
+            1e4 * u.kpc,
+        )
+
+        def enclosed(qmc):  # fraction within the radius, of 20 samples
+            return [
+                np.mean(
+                    np.linalg.norm(
+                        self.inst.sample_arrays(
+                            1024,
+                            random=rng,
+                            qmc=qmc,
+                        ).positions,
+                        axis=1,
+                    )
+                    < radius,
+                )
+                for _ in range(20)
+            ]
+
+        pseudo, quasi = enclosed(None), enclosed(qmc)
+        assert np.isclose(np.mean(quasi), expected, atol=5e-3)  # unbiased
+        assert np.std(quasi) < np.std(pseudo) / 3
+
+        # reproducible, and scrambled anew by the random state
+        arrs = self.inst.sample_arrays(8, random=0, qmc=qmc)
+        assert np.array_equal(
+            arrs.positions,
+            self.inst.sample_arrays(8, random=0, qmc=qmc).positions,
+        )
+        assert not np.array_equal(
+            arrs.positions,
+            self.inst.sample_arrays(8, random=1, qmc=qmc).positions,
+        )
+
+        # the default from initialization
+        inst = SphericalPotentialSampler(self.inst.potential, qmc=qmc)
+        assert np.array_equal(
+            inst.sample_arrays(8, random=0).positions,
+            arrs.positions,
+        )
+
+        with pytest.raises(ValueError, match="qmc must be"):
+            self.inst.sample_arrays(8, qmc="not it")
+        with pytest.raises(ValueError, match="qmc must be"):
+            SphericalPotentialSampler(self.inst.potential, qmc="not it")
+
+    # /def
+
+
+# /class
+
+
+# -------------------------------------------------------------------
+
+
+class Test_RejectionPotentialSampler:
+    """Test :class:`~discO.core.sample.RejectionPotentialSampler`."""
+
+    @classmethod
+    def setup_class(cls):
+        """Setup fixtures for testing."""
+        cls.mass = 1e12 * u.solMass
+        cls.potential = HernquistPotential(amp=2 * cls.mass, a=10 * u.kpc)
+        cls.potential.turn_physical_on()
+
+        cls.inst = RejectionPotentialSampler(
+            GalpyPotentialWrapper(cls.potential, frame="galactocentric"),
+        )
+
+    # /def
+
+    def test___init__(self):
+        """Test method ``__init__``."""
+        with pytest.raises(ValueError, match="rmin < rmax"):
+            RejectionPotentialSampler(self.inst.potential, rmax=1 * u.pc)
+        with pytest.raises(ValueError, match="nbands"):
+            RejectionPotentialSampler(self.inst.potential, nbands=0)
+        with pytest.raises(ValueError, match="safety"):
+            RejectionPotentialSampler(self.inst.potential, safety=0.5)
+        with pytest.raises(ValueError, match="blocksize"):
+            RejectionPotentialSampler(self.inst.potential, blocksize=0)
+
+    # /def
+
+    def test_envelope(self):
+        """Test attribute ``envelope`` bounds the density, and is cached."""
+        inner, outer, bound = self.inst.envelope
+        assert inner[0] == 0
+        assert np.array_equal(inner[1:], outer[:-1])
+        assert bound.shape == (len(outer), 16)
+
+        # the density on the shells' outer radii, in the midplane
+        _, density = self.inst.potential.density(
+            coord.CartesianRepresentation(outer, 0, 0, unit=u.kpc),
+        )
+        assert np.all(bound[:, 8] >= density.value)
+
+        other = RejectionPotentialSampler(self.inst.potential)
+        assert other.envelope is self.inst.envelope
+
+        other = RejectionPotentialSampler(self.inst.potential, nbands=1)
+        assert other.envelope[2].shape == (len(outer), 1)
+
+    # /def
+
+    def test_sample_arrays_default_mass(self):
+        """Test the default total mass, which galpy can give as a float."""
+        potential = HernquistPotential(amp=2)  # no physical outputs
+        inst = RejectionPotentialSampler(GalpyPotentialWrapper(potential))
+        assert inst._total_mass == 1 * u.solMass
+
+        arrs = inst.sample_arrays(10, random=0)
+        assert np.isclose(arrs.masses.sum(), 1)
+
+    # /def
+
+    def test_sample_arrays(self):
+        """Test method ``sample_arrays`` follows the enclosed mass."""
+        arrs = self.inst.sample_arrays(100000, random=0)
+
+        assert arrs.positions.shape == (100000, 3)
+        assert arrs.velocities is None
+        assert np.isclose(arrs.masses.sum(), self.mass.value)
+
+        r = np.linalg.norm(arrs.positions, axis=1)
+        for radius in (1, 10, 100) * u.kpc:
+            expected = self.potential.mass(radius) / self.potential.mass(
+                1e4 * u.kpc,
+            )
+            assert np.isclose(np.mean(r < radius.value), expected, atol=5e-3)
+
+        # isotropic
+        unit = arrs.positions / r[:, None]
+        assert np.allclose(unit.mean(axis=0), 0, atol=0.01)
+
+        # random state
+        arrs2 = self.inst.sample_arrays(10, random=np.random.default_rng(1))
+        arrs3 = self.inst.sample_arrays(10, random=np.random.default_rng(1))
+        assert np.array_equal(arrs2.positions, arrs3.positions)
+
+    # /def
+
+    def test_stats(self):
+        """Test attribute ``stats``."""
+        inst = RejectionPotentialSampler(self.inst.potential)
+        assert inst.stats["acceptance"] == 0
+
+        inst.sample_arrays(1000, random=0)
+        stats = inst.stats
+        assert stats["accepted"] == 1000
+        assert stats["proposed"] > 1000
+        assert np.isclose(stats["acceptance"], 1000 / stats["proposed"])
+        assert stats["throughput"] > 0
+
+    # /def
+
+    def test_adapt(self):
+        """Test a too-low envelope is raised."""
+        inst = RejectionPotentialSampler(self.inst.potential)
+        inner, outer, bound = inst.envelope
+        cached = bound.copy()
+        inst._envelope = (inner, outer, bound / 10)
+
+        arrs = inst.sample_arrays(20000, random=0)
+        assert inst.stats["adapted"] > 0
+
+        # the points are all from the raised envelope, so aren't biased
+        r = np.linalg.norm(arrs.positions, axis=1)
+        expected = self.potential.mass(10 * u.kpc) / self.potential.mass(
+            1e4 * u.kpc,
+        )
+        assert np.isclose(np.mean(r < 10), expected, atol=0.01)
+
+        # on a copy, not the cached envelope
+        assert np.all(inst.envelope[2] >= bound / 10)
+        assert not np.array_equal(inst.envelope[2], bound / 10)
+        assert np.array_equal(self.inst.envelope[2], cached)
+
+    # /def
+
+    def test___call__(self):
+        """Test method ``__call__``."""
+        res = self.inst(10, random=0)
+
+        assert isinstance(res, coord.SkyCoord)
+        assert res.potential is self.inst.potential
+        assert np.isclose(res.mass.sum(), self.mass)
+        assert np.allclose(
+            res.cartesian.xyz.to_value(u.kpc).T,
+            self.inst.sample_arrays(10, random=0).positions,
+        )
+
+    # /def
+
+
+# /class
+
 ##############################################################################
 # END
@@ -295,6 +295,132 @@ class Test_GalpyPotentialWrapperMeta(
 
     # /def
 
+    def test_with_coefficients(self):
+        """Test method ``with_coefficients``."""
+        # No coefficients
+        with pytest.raises(NotImplementedError, match="no coefficients"):
+            self.subclass.with_coefficients(gpot.KeplerPotential(), {})
+
+        # SCF
+        rng = np.random.default_rng(1)
+        Acos = np.tril(rng.normal(size=(4, 3, 3)))
+        Asin = np.tril(rng.normal(size=(4, 3, 3)))
+        Asin[:, :, 0] = 0
+        pot = gpot.SCFPotential(amp=2, Acos=Acos, Asin=Asin, a=3)
+        other = gpot.SCFPotential(
+            amp=3,
+            Acos=Acos[::-1],
+            Asin=Asin[::-1],
+            a=3,
+        )
+        pot.Rforce(1.0, 0.5, phi=0.3)  # galpy caches the last forces evaluated
+
+        got = self.subclass.with_coefficients(
+            pot,
+            self.subclass.coefficients(other),
+        )
+        assert got is not pot
+        assert got._amp == other._amp
+        assert np.array_equal(pot._Acos[0], other._Acos[-1])  # unchanged
+        for method in ("Rforce", "zforce", "phitorque", "dens"):
+            assert np.isclose(
+                getattr(got, method)(1.0, 0.5, phi=0.3),
+                getattr(other, method)(1.0, 0.5, phi=0.3),
+            )
+
+        # DiskSCFPotential
+        pot = gpot.DiskSCFPotential()
+        got = self.subclass.with_coefficients(
+            pot,
+            dict(Acos=2 * pot._scf._Acos, Asin=pot._scf._Asin),
+        )
+        assert np.array_equal(got._scf._Acos, 2 * pot._scf._Acos)
+        assert got._scf is not pot._scf
+
+    # /def
+
+    def test_batch_evaluate(self):
+        """Test method ``batch_evaluate``."""
+        rng = np.random.default_rng(0)
+        pots = []
+        for _ in range(3):
+            Acos = np.tril(rng.normal(size=(4, 3, 3)))
+            Asin = np.tril(rng.normal(size=(4, 3, 3)))
+            Asin[:, :, 0] = 0
+            pots.append(
+                gpot.SCFPotential(
+                    amp=1e12 * u.solMass,
+                    Acos=Acos,
+                    Asin=Asin,
+                    a=10 * u.kpc,
+                ),
+            )
+        points = coord.CartesianRepresentation(
+            x=[1, 2, -3, 0] * u.kpc,
+            y=[2, -1, 4, 0] * u.kpc,
+            z=[0.5, 3, -2, 1] * u.kpc,  # and on the z-axis
+        )
+
+        # -------------------
+        # scalars
+
+        cache = dict()
+        for observable in ("potential", "density"):
+            values = self.subclass.batch_evaluate(
+                pots,
+                observable,
+                points,
+                cache=cache,
+            )
+            for pot, (_, value) in zip(pots, values):
+                _, expected = getattr(self.subclass, observable)(pot, points)
+                assert u.allclose(value, expected)
+
+        assert len(cache) == 2  # potential & density basis
+
+        # -------------------
+        # force
+
+        values = self.subclass.batch_evaluate(
+            pots,
+            "acceleration",
+            points,
+            representation_type=coord.CartesianRepresentation,
+            cache=cache,
+        )
+        for pot, value in zip(pots, values):
+            expected = self.subclass.acceleration(
+                pot,
+                points,
+                representation_type=coord.CartesianRepresentation,
+            )
+            assert isinstance(value, vectorfield.CartesianVectorField)
+            for c in ("vf_x", "vf_y", "vf_z"):
+                got, want = getattr(value, c), getattr(expected, c)
+                assert u.allclose(got, want, equal_nan=True)
+                assert np.isnan(got[-1])  # on the z-axis
+
+        # all cylindrical components are NaN on the z-axis, as in galpy
+        values = self.subclass.batch_evaluate(pots, "acceleration", points)
+        for value in values:
+            for c in value.components:
+                assert np.isnan(getattr(value, c)[-1])
+
+        assert len(cache) == 3
+
+        # -------------------
+        # can't batch different potentials
+
+        values = self.subclass.batch_evaluate(
+            [pots[0], self.potential],
+            "potential",
+            points,
+        )
+        _, expected = self.subclass.potential(self.potential, points)
+        assert u.allclose(values[1][1], expected)
+
+    # /def
+
     #################################################################
     # Usage Tests
 
@@ -589,6 +715,29 @@ class Test_GalpyPotentialWrapper(
 
     # /def
 
+    def test_with_coefficients(self):
+        """Test method ``with_coefficients``."""
+        pot = gpot.SCFPotential(Acos=np.ones((2, 1, 1)))
+        inst = self.obj(pot, frame="galactocentric")
+
+        coeffs = inst.coefficients()
+        coeffs.update(
+            Acos=2 * coeffs["Acos"],
+            symmetry="spherical",
+            covariance=np.eye(4).reshape((2, 2, 1, 1) * 2),
+        )
+        got = inst.with_coefficients(coeffs)
+
+        assert isinstance(got, self.obj)
+        assert isinstance(got.frame, coord.Galactocentric)
+        assert np.array_equal(got.__wrapped__._Acos, 2 * pot._Acos)
+
+        expected = got.coefficients()
+        assert expected["symmetry"] == "spherical"
+        assert np.array_equal(expected["covariance"], coeffs["covariance"])
+
+    # /def
+
 
 # /class
 
@@ -12,6 +12,7 @@ __all__ = [
 # IMPORTS
 
 # BUILT-IN
+import copy
 import typing as T
 
 # THIRD PARTY
@@ -19,11 +20,17 @@ import astropy.coordinates as coord
 import astropy.units as u
 import galpy.potential as gpot
 import numpy as np
+from astropy.utils import sharedmethod
+from galpy.util import conversion
 
 # PROJECT-SPECIFIC
 import discO.type_hints as TH
 from .type_hints import PotentialType
 from discO.core.wrapper import PotentialWrapper, PotentialWrapperMeta
+from discO.extern.galpy_potentials import (
+    scf_compute_grid_basis,
+    scf_evaluate_from_grid_basis,
+)
 from discO.utils import resolve_representationlike, vectorfield
 
 ##############################################################################
@@ -31,6 +38,14 @@ from discO.utils import resolve_representationlike, vectorfield
 
 _KMS2 = u.km / u.s ** 2
 
+# observables with a batched SCF evaluation : kind of basis
+_SCF_BATCH_OBSERVABLES = {
+    "potential": "potential",
+    "density": "density",
+    "specific_force": "force",
+    "acceleration": "force",
+}
+
 ##############################################################################
 # CODE
 ##############################################################################
@@ -229,7 +244,8 @@ class GalpyPotentialMeta(PotentialWrapperMeta):
         -------
         None or dict
             None if there aren't coefficients, a dict of the coefficients
-            if there are.
+            if there are. See ``GalpyPotentialWrapper.coefficients`` for
+            the covariance and symmetry of fitted coefficients.
 
         """
         coeffs = None  # start with None, then figure out.
@@ -239,7 +255,9 @@ class GalpyPotentialMeta(PotentialWrapperMeta):
                 type="SCF",
                 Acos=potential._Acos,
                 Asin=potential._Asin,
+                amp=potential._amp,
             )
+
         elif isinstance(potential, gpot.DiskSCFPotential):
             coeffs = dict(
                 type="diskSCF",
@@ -251,6 +269,208 @@ class GalpyPotentialMeta(PotentialWrapperMeta):
 
     # /def
 
+    def with_coefficients(
+        self,
+        potential: PotentialType,
+        coefficients: T.Mapping[str, T.Any],
+    ) -> PotentialType:
+        """A copy of the potential, with other coefficients.
+
+        Parameters
+        ----------
+        potential : :class:`~galpy.potential.Potential`
+            The potential.
+        coefficients : Mapping
+            Like those from ``coefficients``: "Acos", "Asin" and, optionally,
+            "amp". In galpy's normalization of the coefficients.
+
+        Returns
+        -------
+        :class:`~galpy.potential.Potential`
+
+        Raises
+        ------
+        NotImplementedError
+            If `potential` doesn't have coefficients.
+
+        """
+        if isinstance(potential, gpot.DiskSCFPotential):
+            new = copy.copy(potential)
+            new._scf = self.with_coefficients(potential._scf, coefficients)
+            return new
+        elif not isinstance(potential, gpot.SCFPotential):
+            raise NotImplementedError(f"{potential} has no coefficients.")
+
+        new = copy.copy(potential)
+        new._Acos = np.asarray(coefficients["Acos"])
+        new._Asin = np.asarray(coefficients["Asin"])
+        new._amp = float(coefficients.get("amp", potential._amp))
+        new._force_hash = None  # galpy caches the last forces evaluated
+
+        return new
+
+    # /def
+
+    # -----------------------------------------------------
+
+    def batch_evaluate(
+        self,
+        potentials: T.Sequence[PotentialType],
+        observable: str,
+        points: TH.PositionType,
+        *,
+        frame: TH.OptFrameLikeType = None,
+        representation_type: TH.OptRepresentationLikeType = None,
+        cache: T.Optional[T.Dict[T.Any, T.Any]] = None,
+        **kwargs,
+    ) -> T.List[T.Any]:
+        """Evaluate many potentials on the same points.
+
+        If all the potentials are :class:`~galpy.potential.SCFPotential` with
+        the same expansion size, scale length and units, the basis functions
+        are computed once at `points` and contracted with all the
+        coefficients together. Otherwise each potential is evaluated
+        separately.
+
+        Parameters
+        ----------
+        potentials : sequence of `~galpy.potential.Potential`
+            The potentials.
+        observable : str
+            Name of the method, eg. "acceleration".
+        points : coord-array or |Representation|
+            The points at which to evaluate the potentials.
+        frame : |CoordinateFrame| or None (optional, keyword-only)
+            The frame of the potentials.
+        representation_type : |Representation| or None (optional, keyword-only)
+            The representation type in which to return data.
+        cache : dict or None (optional, keyword-only)
+            Storage for the basis functions at `points`, reused between calls
+            with the same `points` and `frame`.
+        **kwargs
+            Arguments into the potentials.
+
+        Returns
+        -------
+        list
+            The result of `observable` for each potential.
+
+        """
+        key = self._scf_batch_key(potentials)
+        if kwargs or key is None or observable not in _SCF_BATCH_OBSERVABLES:
+            return super().batch_evaluate(
+                potentials,
+                observable,
+                points,
+                frame=frame,
+                representation_type=representation_type,
+                cache=cache,
+                **kwargs,
+            )
+
+        kind = _SCF_BATCH_OBSERVABLES[observable]
+        N, L, _, a, ro, vo = key
+
+        p, _ = self._convert_to_frame(points, frame, representation_type)
+        shape = p.shape
+
+        # the basis, from the cache if possible
+        cache = {} if cache is None else cache
+        basis = cache.get((kind, *key[:-1]))
+        if basis is None:
+            xyz = p.represent_as(coord.CartesianRepresentation).xyz
+            basis = scf_compute_grid_basis(
+                xyz.reshape((3, -1)).to_value(u.kpc) / ro,
+                N,
+                L,
+                a=a,
+                observable=kind,
+            )
+            cache[(kind, *key[:-1])] = basis
+
+        # pad (eg. axisymmetric) coefficients to the basis
+        coeffs = np.zeros((len(potentials), 2, N, L, L))
+        for i, pot in enumerate(potentials):
+            M = pot._Acos.shape[-1]
+            coeffs[i, ..., :M] = pot._amp * np.stack((pot._Acos, pot._Asin))
+        values = scf_evaluate_from_grid_basis(basis, coeffs)
+
+        # -----------
+        # scalars
+
+        if kind != "force":
+            if kind == "potential":
+                values = values * vo ** 2 * (u.km / u.s) ** 2
+            else:  # density
+                values = (
+                    values
+                    * conversion.dens_in_msolpc3(vo, ro)
+                    * (u.solMass / u.pc ** 3)
+                )
+
+            p, _ = self._convert_to_frame(p, frame, representation_type)
+            return [(p, v.reshape(shape)) for v in values]
+
+        # -----------
+        # force
+
+        r = p.represent_as(coord.CylindricalRepresentation)
+        values = (
+            values * conversion.force_in_kmsMyr(vo, ro) * (u.km / u.s / u.Myr)
+        ).to(_KMS2)
+
+        vfs = []
+        for Frho, Fphi, Fz in values:
+            vf = vectorfield.CylindricalVectorField(
+                points=r,
+                vf_rho=Frho.reshape(shape),
+                vf_phi=Fphi.reshape(shape),
+                vf_z=Fz.reshape(shape),
+                frame=frame,
+            )
+
+            if representation_type is not None:
+                vf = vf.represent_as(
+                    resolve_representationlike(representation_type),
+                )
+
+            vfs.append(vf)
+
+        return vfs
+
+    # /def
+
+    @staticmethod
+    def _scf_batch_key(
+        potentials: T.Sequence[PotentialType],
+    ) -> T.Optional[tuple]:
+        """What the potentials must share to be evaluated as a batch.
+
+        Parameters
+        ----------
+        potentials : sequence of `~galpy.potential.Potential`
+
+        Returns
+        -------
+        tuple or None
+            (N, L, M, a, ro, vo), or None if the potentials aren't all
+            :class:`~galpy.potential.SCFPotential` that agree on these.
+
+        """
+        if len(potentials) == 0:
+            return None
+
+        keys = set()
+        for pot in potentials:
+            # DiskSCFPotential is not a subclass, but be safe
+            if type(pot) is not gpot.SCFPotential:
+                return None
+            keys.add((*pot._Acos.shape, pot._a, pot._ro, pot._vo))
+
+        return keys.pop() if len(keys) == 1 else None
+
+    # /def
+
 
 # /class
 
@@ -267,8 +487,125 @@ class GalpyPotentialWrapper(
         Be careful about galpy coordinate conventions!
         phi is different?
 
+    Parameters
+    ----------
+    potential : `~galpy.potential.Potential`
+    frame : frame-like or None (optional, keyword-only)
+    representation_type : representation-like or None (optional, keyword-only)
+    symmetry : str or None (optional, keyword-only)
+        The symmetry with which the coefficients were fit, if any.
+        Coefficients that vanish by the symmetry are zero or not stored.
+        If None and `potential` is a wrapper, that of `potential`.
+    covariance : (2, N, L, M, 2, N, L, M) ndarray or None (optional, keyword-only)
+        The covariance of the fit coefficients (Acos, Asin), in galpy's
+        normalization of the coefficients. If None and `potential` is a
+        wrapper, that of `potential`.
+
     """
 
+    def __new__(
+        cls,
+        potential: T.Any,
+        *,
+        frame: T.Optional[TH.FrameLikeType] = None,
+        representation_type: TH.OptRepresentationLikeType = None,
+        symmetry: T.Optional[str] = None,
+        covariance: T.Optional[np.ndarray] = None,
+    ):
+        return super().__new__(
+            cls,
+            potential,
+            frame=frame,
+            representation_type=representation_type,
+        )
+
+    # /def
+
+    def __init__(
+        self,
+        potential: T.Any,
+        *,
+        frame: TH.OptFrameLikeType = None,
+        representation_type: TH.OptRepresentationLikeType = None,
+        symmetry: T.Optional[str] = None,
+        covariance: T.Optional[np.ndarray] = None,
+    ):
+        if isinstance(potential, GalpyPotentialWrapper):
+            symmetry = potential._symmetry if symmetry is None else symmetry
+            if covariance is None:
+                covariance = potential._covariance
+
+        super().__init__(
+            potential,
+            frame=frame,
+            representation_type=representation_type,
+        )
+
+        self._symmetry = symmetry
+        self._covariance = covariance
+
+    # /def
+
+    @sharedmethod
+    def coefficients(self) -> T.Optional[T.Dict[str, T.Any]]:
+        """Coefficients of the potential.
+
+        Returns
+        -------
+        None or dict
+            None if there aren't coefficients, a dict of the coefficients
+            if there are. If the potential was fit with a symmetry, also has
+            "symmetry". If the covariance of the coefficients was estimated
+            when fitting, also has "covariance" and the variances
+            "Acos_var" and "Asin_var".
+
+        """
+        coeffs = self.__class__.coefficients(self.__wrapped__)
+        if coeffs is None:
+            return coeffs
+
+        if self._symmetry is not None:
+            coeffs["symmetry"] = self._symmetry
+
+        cov = self._covariance
+        if cov is not None:
+            shape = cov.shape[:4]  # (2, N, L, M)
+            var = np.diagonal(cov.reshape(np.prod(shape), -1))
+            var = var.reshape(shape)
+            coeffs.update(covariance=cov, Acos_var=var[0], Asin_var=var[1])
+
+        return coeffs
+
+    # /def
+
+    @sharedmethod
+    def with_coefficients(
+        self,
+        coefficients: T.Mapping[str, T.Any],
+    ) -> "GalpyPotentialWrapper":
+        """A copy of the wrapper, with other coefficients.
+
+        Parameters
+        ----------
+        coefficients : Mapping
+            Like those from ``coefficients``, including, if present, the
+            "symmetry" and "covariance".
+
+        Returns
+        -------
+        :class:`GalpyPotentialWrapper`
+
+        """
+        return self.__class__(
+            self.__class__.with_coefficients(self.__wrapped__, coefficients),
+            frame=self.frame,
+            representation_type=self.default_representation,
+            symmetry=coefficients.get("symmetry"),
+            covariance=coefficients.get("covariance"),
+        )
+
+    # /def
+
 
 # /class
 
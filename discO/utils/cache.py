@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+
+"""Caching."""
+
+__all__ = [
+    "LRUCache",
+    "hash_key",
+]
+
+
+##############################################################################
+# IMPORTS
+
+# BUILT-IN
+import hashlib
+import os
+import pickle
+import typing as T
+from collections import OrderedDict
+from collections.abc import MutableMapping
+
+##############################################################################
+# CODE
+##############################################################################
+
+
+def hash_key(*objs: T.Any) -> T.Optional[str]:
+    """Key objects by the hash of their pickled contents.
+
+    Equal objects, eg. potentials with the same parameters, have the same key
+    even if they are different instances.
+
+    Parameters
+    ----------
+    *objs : Any
+
+    Returns
+    -------
+    str or None
+        None if `objs` cannot be pickled.
+
+    """
+    try:
+        data = pickle.dumps(objs, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception:  # many possible errors
+        return None
+
+    return hashlib.sha1(data).hexdigest()
+
+
+# /def
+
+
+# -------------------------------------------------------------------
+
+
+class LRUCache(MutableMapping):
+    """Mapping that evicts the least-recently-used item when full.
+
+    Parameters
+    ----------
+    maxsize : int (optional)
+        The maximum number of items. Must be > 0.
+
+    Raises
+    ------
+    ValueError
+        If `maxsize` is not > 0.
+
+    """
+
+    def __init__(self, maxsize: int = 128) -> None:
+        self._data: OrderedDict = OrderedDict()
+        self.maxsize = maxsize
+
+    # /def
+
+    @property
+    def maxsize(self) -> int:
+        """The maximum number of items."""
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, value: int) -> None:
+        if not value > 0:
+            raise ValueError("maxsize must be > 0.")
+        self._maxsize = int(value)
+        self._evict()
+
+    # /def
+
+    #################################################################
+    # Mapping
+
+    def __getitem__(self, key: T.Hashable) -> T.Any:
+        value = self._data[key]
+        self._data.move_to_end(key)  # most recently used
+        return value
+
+    # /def
+
+    def __setitem__(self, key: T.Hashable, value: T.Any) -> None:
+        self._data[key] = value
+        self._data.move_to_end(key)
+        self._evict()
+
+    # /def
+
+    def __delitem__(self, key: T.Hashable) -> None:
+        del self._data[key]
+
+    # /def
+
+    def __iter__(self) -> T.Iterator:
+        return iter(self._data)
+
+    # /def
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    # /def
+
+    def _evict(self) -> None:
+        """Remove the least-recently-used items, down to ``maxsize``."""
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    # /def
+
+    #################################################################
+    # Serialization
+
+    def dump(self, path: T.Union[str, os.PathLike]) -> None:
+        """Pickle the cache to a file.
+
+        Parameters
+        ----------
+        path : path-like
+
+        """
+        with open(path, "wb") as file:
+            pickle.dump(
+                dict(self._data),
+                file,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+
+    # /def
+
+    def load(self, path: T.Union[str, os.PathLike]) -> None:
+        """Add the items of a pickled cache, eg. in a worker process.
+
+        Parameters
+        ----------
+        path : path-like
+
+        Raises
+        ------
+        TypeError
+            If `path` does not hold a pickled cache.
+
+        """
+        with open(path, "rb") as file:
+            data = pickle.load(file)
+
+        if not isinstance(data, dict):
+            raise TypeError(f"{path} is not a pickled cache.")
+
+        self.update(data)
+
+    # /def
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(maxsize={self.maxsize}, "
+            f"size={len(self)})"
+        )
+
+    # /def
+
+
+# /class
+
+##############################################################################
+# END
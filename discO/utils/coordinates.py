@@ -6,8 +6,11 @@
 __all__ = [
     "resolve_framelike",
     "resolve_representationlike",
+    "static_transform",
+    "transform_to",
     #
     "UnFrame",
+    "StaticTransform",
 ]
 
 
@@ -19,19 +22,45 @@ import inspect
 import typing as T
 
 # THIRD PARTY
+import astropy.units as u
+import numpy as np
 from astropy.coordinates import (
+    BaseAffineTransform,
     BaseCoordinateFrame,
     BaseRepresentation,
+    BaseRepresentationOrDifferential,
+    CartesianDifferential,
+    CartesianRepresentation,
+    RadialDifferential,
     SkyCoord,
+    UnitSphericalCosLatDifferential,
+    UnitSphericalDifferential,
+    UnitSphericalRepresentation,
+    frame_transform_graph,
     sky_coordinate_parsers,
 )
 from astropy.coordinates.representation import (
     REPRESENTATION_CLASSES as _REP_CLSs,
 )
+from astropy.time import Time
 
 # PROJECT-SPECIFIC
 import discO.type_hints as TH
 from discO.config import conf
+from discO.utils.cache import LRUCache
+
+##############################################################################
+# PARAMETERS
+
+# (from frame, to frame) : StaticTransform or False, if not static.
+_STATIC_TRANSFORMS = LRUCache(maxsize=128)
+
+# differentials without the full velocity
+_NOT_VELOCITIES = (
+    UnitSphericalDifferential,
+    UnitSphericalCosLatDifferential,
+    RadialDifferential,
+)
 
 ##############################################################################
 # CODE
@@ -147,5 +176,308 @@ def resolve_representationlike(
 # /def
 
 
+# -------------------------------------------------------------------
+
+
+class StaticTransform(T.NamedTuple):
+    """A time-independent frame transformation, as an affine map.
+
+    Positions are mapped as ``matrix @ x + offset`` and velocities as
+    ``matrix @ v + velocity_offset``, on Cartesian arrays.
+
+    Parameters
+    ----------
+    matrix : (3, 3) ndarray
+    offset : (3, ) ndarray
+        In ``StaticTransform.units["positions"]``.
+    velocity_offset : (3, ) ndarray
+        In ``StaticTransform.units["velocities"]``.
+
+    """
+
+    matrix: np.ndarray
+    offset: np.ndarray
+    velocity_offset: np.ndarray
+
+    units = dict(positions=u.kpc, velocities=u.km / u.s)
+
+    def positions(self, xyz: np.ndarray) -> np.ndarray:
+        """Map (..., 3) Cartesian positions."""
+        return xyz @ self.matrix.T + self.offset
+
+    # /def
+
+    def velocities(self, vxyz: np.ndarray) -> np.ndarray:
+        """Map (..., 3) Cartesian velocities."""
+        return vxyz @ self.matrix.T + self.velocity_offset
+
+    # /def
+
+
+# /class
+
+
+# -------------------------------------------------------------------
+
+
+def _value_key(value: T.Any) -> T.Any:
+    """Key a frame attribute by its contents.
+
+    Parameters
+    ----------
+    value : Any
+
+    Returns
+    -------
+    Any
+        Hashable if `value` is a frame, representation, differential,
+        |Time| or |Quantity|, or is itself hashable.
+
+    """
+    if isinstance(value, BaseCoordinateFrame):  # eg. galcen_coord
+        value = (
+            _frame_key(value),
+            _value_key(value.data) if value.has_data else None,
+        )
+    elif isinstance(value, BaseRepresentationOrDifferential):
+        value = (
+            value.__class__,
+            np.asarray(value._values).tobytes(),
+            tuple(map(str, value._units.values())),
+        )
+    elif isinstance(value, Time):
+        value = (
+            np.asarray(value.jd1).tobytes(),
+            np.asarray(value.jd2).tobytes(),
+            value.scale,
+        )
+    elif isinstance(value, u.Quantity):
+        value = (np.asarray(value.value).tobytes(), str(value.unit))
+
+    return value
+
+
+# /def
+
+
+def _frame_key(frame: TH.FrameType) -> T.Optional[tuple]:
+    """Key a frame, without data, by its class and attributes.
+
+    Parameters
+    ----------
+    frame : |CoordinateFrame|
+
+    Returns
+    -------
+    tuple or None
+        None if an attribute can't be hashed.
+
+    """
+    key = (frame.__class__,) + tuple(
+        (name, _value_key(getattr(frame, name)))
+        for name in frame.frame_attributes
+    )
+    try:
+        hash(key)
+    except TypeError:
+        return None
+
+    return key
+
+
+# /def
+
+
+def _make_static_transform(
+    from_frame: TH.FrameType,
+    to_frame: TH.FrameType,
+) -> T.Optional[StaticTransform]:
+    """Make the static transformation between two frames.
+
+    Parameters
+    ----------
+    from_frame, to_frame : |CoordinateFrame|
+
+    Returns
+    -------
+    `StaticTransform` or None
+        None if the transformation is not a composition of affine
+        transformations.
+
+    """
+    path = frame_transform_graph.get_transform(
+        from_frame.__class__,
+        to_frame.__class__,
+    )
+    if path is None or not all(
+        isinstance(step, BaseAffineTransform) for step in path.transforms
+    ):
+        return None
+
+    # transform the origin and unit vectors, and a check point
+    check = np.array([[3.1], [-2.7], [1.3]])
+    x = np.hstack((np.zeros((3, 1)), np.eye(3), check))
+    rep = CartesianRepresentation(
+        x,
+        unit=StaticTransform.units["positions"],
+        differentials=CartesianDifferential(
+            x,
+            unit=StaticTransform.units["velocities"],
+        ),
+    )
+    rep = (
+        from_frame.realize_frame(rep)
+        .transform_to(to_frame)
+        .data.represent_as(CartesianRepresentation, CartesianDifferential)
+    )
+    xyz = rep.xyz.to_value(StaticTransform.units["positions"])
+    vxyz = rep.differentials["s"].d_xyz.to_value(
+        StaticTransform.units["velocities"],
+    )
+
+    transform = StaticTransform(
+        xyz[:, 1:4] - xyz[:, :1],
+        xyz[:, 0],
+        vxyz[:, 0],
+    )
+    if not (
+        np.allclose(vxyz[:, 1:4] - vxyz[:, :1], transform.matrix)
+        and np.allclose(transform.positions(check.T)[0], xyz[:, 4])
+        and np.allclose(transform.velocities(check.T)[0], vxyz[:, 4])
+    ):
+        return None
+
+    return transform
+
+
+# /def
+
+
+def static_transform(
+    from_frame: TH.FrameType,
+    to_frame: TH.FrameType,
+) -> T.Optional[StaticTransform]:
+    """The static transformation between two frames, if there is one.
+
+    A transformation is static if it is a composition of affine
+    transformations, eg. ICRS to Galactocentric with fixed parameters.
+    It is computed once per pair of frames and cached.
+
+    Parameters
+    ----------
+    from_frame, to_frame : |CoordinateFrame|
+        With or without data.
+
+    Returns
+    -------
+    `StaticTransform` or None
+        None if the transformation is not static.
+
+    """
+    from_key, to_key = _frame_key(from_frame), _frame_key(to_frame)
+    if from_key is None or to_key is None:  # can't be cached
+        return _make_static_transform(from_frame, to_frame)
+
+    key = (from_key, to_key)
+    transform = _STATIC_TRANSFORMS.get(key)
+    if transform is None:
+        transform = _make_static_transform(from_frame, to_frame)
+        _STATIC_TRANSFORMS[key] = False if transform is None else transform
+
+    return transform or None
+
+
+# /def
+
+
+def transform_to(
+    c: TH.CoordinateType,
+    frame: TH.FrameType,
+) -> TH.CoordinateType:
+    """Transform coordinates, by a static transformation if possible.
+
+    Equivalent to ``c.transform_to(frame)``. If the transformation is
+    static (see `static_transform`) it is applied to the Cartesian arrays
+    of `c`, bypassing astropy's transformation graph. Otherwise, and for
+    data without distances, or |SkyCoord| whose attributes would be merged
+    into `frame`, astropy transforms `c`.
+
+    Parameters
+    ----------
+    c : |CoordinateFrame| or |SkyCoord|
+    frame : |CoordinateFrame|
+
+    Returns
+    -------
+    |CoordinateFrame| or |SkyCoord|
+        The same type as `c`.
+
+    """
+    cframe = c.frame if isinstance(c, SkyCoord) else c
+    data = cframe.data
+    differentials = data.differentials
+
+    if (
+        # SkyCoord merges its attributes into the frame's defaults
+        (
+            isinstance(c, SkyCoord)
+            and (
+                c._extra_frameattr_names
+                or any(
+                    frame.is_frame_attr_default(name)
+                    and not cframe.is_frame_attr_default(name)
+                    for name in frame.frame_attributes
+                    if name in cframe.frame_attributes
+                )
+            )
+        )
+        # only positions, with distances, & velocities
+        or isinstance(data, UnitSphericalRepresentation)
+        or set(differentials) - {"s"}
+        or isinstance(differentials.get("s"), _NOT_VELOCITIES)
+    ):
+        return c.transform_to(frame)
+
+    transform = static_transform(cframe, frame)
+    if transform is None:
+        return c.transform_to(frame)
+
+    # Cartesian arrays, (..., 3)
+    if differentials:
+        rep = data.represent_as(CartesianRepresentation, CartesianDifferential)
+        dif = rep.differentials["s"]
+    else:
+        rep, dif = data.represent_as(CartesianRepresentation), None
+
+    if rep.x.unit.physical_type != "length" or (
+        dif is not None and dif.d_x.unit.physical_type != "speed"
+    ):
+        return c.transform_to(frame)
+
+    if dif is not None:
+        vxyz = dif.d_xyz.to_value(StaticTransform.units["velocities"])
+        dif = CartesianDifferential(
+            np.moveaxis(transform.velocities(np.moveaxis(vxyz, 0, -1)), -1, 0),
+            unit=StaticTransform.units["velocities"],
+            copy=False,
+        )
+
+    xyz = rep.xyz.to_value(StaticTransform.units["positions"])
+    new_rep = CartesianRepresentation(
+        np.moveaxis(transform.positions(np.moveaxis(xyz, 0, -1)), -1, 0),
+        unit=StaticTransform.units["positions"],
+        differentials=dif,
+        copy=False,
+    )
+
+    new_c = frame.realize_frame(new_rep)
+    if isinstance(c, SkyCoord):
+        new_c = SkyCoord(new_c, copy=False)
+
+    return new_c
+
+
+# /def
+
 ##############################################################################
 # END
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+
+"""Parallel Execution."""
+
+__all__ = [
+    "map_context",
+]
+
+
+##############################################################################
+# IMPORTS
+
+# BUILT-IN
+import contextlib
+import typing as T
+from concurrent.futures import Executor, ProcessPoolExecutor
+
+##############################################################################
+# CODE
+##############################################################################
+
+
+@contextlib.contextmanager
+def map_context(
+    n_jobs: T.Optional[int] = None,
+    executor: T.Optional[Executor] = None,
+) -> T.Iterator[T.Callable]:
+    """Context manager yielding an order-preserving ``map`` function.
+
+    Parameters
+    ----------
+    n_jobs : int or None (optional)
+        Number of worker processes. None or 1 (default) runs serially,
+        -1 uses all available cores.
+    executor : `~concurrent.futures.Executor` or None (optional)
+        Overrides `n_jobs`. Not shut down on exit.
+
+    Yields
+    ------
+    callable
+        Order-preserving ``map``.
+
+    Raises
+    ------
+    TypeError
+        If `executor` is not a `~concurrent.futures.Executor`.
+
+    """
+    if executor is not None:
+        if not isinstance(executor, Executor):
+            raise TypeError("executor must be a concurrent.futures.Executor.")
+        yield executor.map
+    elif n_jobs is None or n_jobs == 1:
+        yield map
+    else:
+        max_workers = None if n_jobs == -1 else n_jobs
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            yield pool.map
+
+
+# /def
+
+##############################################################################
+# END
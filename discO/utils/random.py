@@ -4,6 +4,9 @@
 
 __all__ = [
     "NumpyRNGContext",
+    "resolve_random",
+    "spawn_generators",
+    "spawn_random_states",
 ]
 
 
@@ -11,8 +14,8 @@ __all__ = [
 # IMPORTS
 
 # BUILT-IN
+import threading
 import typing as T
-import warnings
 
 # THIRD PARTY
 import numpy as np
@@ -20,7 +23,16 @@ import numpy as np
 ##############################################################################
 # PARAMETERS
 
-RandomLike = T.Union[int, np.random.RandomState, None]
+RandomLike = T.Union[
+    int,
+    np.random.RandomState,
+    np.random.Generator,
+    np.random.SeedSequence,
+    None,
+]
+
+# held while the global random state is set, so threads don't interleave.
+_GLOBAL_RANDOM_LOCK = threading.RLock()
 
 ##############################################################################
 # CODE
@@ -71,6 +83,9 @@ class NumpyRNGContext:
 
     def __enter__(self):
         """Start random state."""
+        # only one thread at a time can set the global state
+        _GLOBAL_RANDOM_LOCK.acquire()
+
         # store old state
         self.startstate = np.random.get_state()
 
@@ -81,7 +96,10 @@ class NumpyRNGContext:
             np.random.set_state(state)
 
         elif isinstance(self.seed, np.random.Generator):
-            warnings.warn("Can't set random context from Generator.")
+            # seeded from, and so advancing, the Generator
+            np.random.seed(
+                self.seed.integers(0, 2 ** 32, size=4, dtype=np.uint32),
+            )
 
     # /def
 
@@ -91,13 +109,16 @@ class NumpyRNGContext:
         deletes stored random state.
 
         """
-        # need to advance the random state by the same amount
-        # if it was a random state
-        if isinstance(self.seed, np.random.RandomState):
-            self.seed.set_state(np.random.get_state())
+        try:
+            # need to advance the random state by the same amount
+            # if it was a random state
+            if isinstance(self.seed, np.random.RandomState):
+                self.seed.set_state(np.random.get_state())
 
-        # reset global stat to starting value
-        np.random.set_state(self.startstate)
+            # reset global stat to starting value
+            np.random.set_state(self.startstate)
+        finally:
+            _GLOBAL_RANDOM_LOCK.release()
 
         del self.seed
 
@@ -109,5 +130,139 @@ class NumpyRNGContext:
 
 # -------------------------------------------------------------------
 
+
+def resolve_random(
+    random: RandomLike,
+) -> T.Union[np.random.RandomState, np.random.Generator]:
+    """Resolve a random state or seed.
+
+    Parameters
+    ----------
+    random : int or |RandomState| or Generator or SeedSequence or None
+        A seed (int or None) makes a |RandomState|, for backward
+        compatibility. A `~numpy.random.SeedSequence` makes a
+        `~numpy.random.Generator`.
+
+    Returns
+    -------
+    |RandomState| or `~numpy.random.Generator`
+
+    """
+    if isinstance(random, (np.random.RandomState, np.random.Generator)):
+        return random
+    elif isinstance(random, np.random.SeedSequence):
+        return np.random.default_rng(random)
+
+    return np.random.RandomState(random)
+
+
+# /def
+
+
+def _spawn_seeds(
+    random: RandomLike,
+    num: int,
+    start: int = 0,
+) -> T.List[np.random.SeedSequence]:
+    """Spawn independent seed sequences, drawing entropy from `random`.
+
+    Child ``i`` is keyed by its index ``start + i``, not by the order of
+    spawning, so any slice of the children can be made on its own.
+
+    """
+    if isinstance(random, np.random.SeedSequence):
+        parent = random
+    else:
+        random = resolve_random(random)
+        if isinstance(random, np.random.Generator):
+            entropy = random.integers(0, 2 ** 32, size=4, dtype=np.uint32)
+        else:
+            entropy = random.randint(0, 2 ** 32, size=4, dtype=np.uint32)
+        parent = np.random.SeedSequence(entropy)
+
+    # the same as ``parent.spawn(start + num)[start:]``, without making the
+    # first `start` children.
+    return [
+        np.random.SeedSequence(
+            parent.entropy,
+            spawn_key=(*parent.spawn_key, index),
+            pool_size=parent.pool_size,
+        )
+        for index in range(start, start + num)
+    ]
+
+
+# /def
+
+
+def spawn_generators(
+    random: RandomLike,
+    num: int,
+    start: int = 0,
+) -> T.List[np.random.Generator]:
+    """Independent random generators, e.g. one per iteration or stage.
+
+    The children are spawned from a :class:`~numpy.random.SeedSequence`,
+    so they are reproducible from the parent seed and do not depend on the
+    order, or the thread, in which they are used.
+
+    Parameters
+    ----------
+    random : int or |RandomState| or Generator or SeedSequence or None
+        The parent random state or seed. A |RandomState| or
+        `~numpy.random.Generator` is advanced. A
+        `~numpy.random.SeedSequence` is the parent and is not advanced.
+    num : int
+        The number of generators.
+    start : int (optional)
+        The index of the first generator. Generators ``start`` to
+        ``start + num`` are the same as that slice of a larger spawn from
+        the same parent seed, e.g. for sharding iterations over hosts.
+
+    Returns
+    -------
+    list of `~numpy.random.Generator`
+
+    """
+    seeds = _spawn_seeds(random, num, start=start)
+
+    return [np.random.default_rng(s) for s in seeds]
+
+
+# /def
+
+
+def spawn_random_states(
+    random: RandomLike,
+    num: int,
+    start: int = 0,
+) -> T.List[np.random.RandomState]:
+    """Independent random states, e.g. one per iteration.
+
+    The children are seeded from a :class:`~numpy.random.SeedSequence`
+    whose entropy is drawn from `random`, so they are reproducible from the
+    parent seed and do not depend on the order in which they are used.
+
+    Parameters
+    ----------
+    random : int or |RandomState| or `~numpy.random.Generator` or None
+        The parent random state or seed, which is advanced.
+    num : int
+        The number of random states.
+    start : int (optional)
+        The index of the first random state. See ``spawn_generators``.
+
+    Returns
+    -------
+    list of |RandomState|
+
+    """
+    seeds = _spawn_seeds(random, num, start=start)
+
+    return [np.random.RandomState(np.random.MT19937(s)) for s in seeds]
+
+
+# /def
+
 ##############################################################################
 # END
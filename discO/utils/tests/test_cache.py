@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+
+"""Testing :mod:`~discO.utils.cache`."""
+
+__all__ = [
+    "test_hash_key",
+    "Test_LRUCache",
+]
+
+
+##############################################################################
+# IMPORTS
+
+# BUILT-IN
+import pickle
+
+# THIRD PARTY
+import numpy as np
+import pytest
+
+# PROJECT-SPECIFIC
+from discO.utils import cache
+
+##############################################################################
+# TESTS
+##############################################################################
+
+
+def test_hash_key():
+    """Test :func:`~discO.utils.cache.hash_key`."""
+    # equal contents have equal keys
+    key = cache.hash_key(np.arange(3), "a")
+    assert isinstance(key, str)
+    assert key == cache.hash_key(np.arange(3), "a")
+    assert key != cache.hash_key(np.arange(4), "a")
+
+    # unpicklable
+    assert cache.hash_key(lambda x: x) is None
+
+
+# /def
+
+
+# -------------------------------------------------------------------
+
+
+class Test_LRUCache:
+    """Test :class:`~discO.utils.cache.LRUCache`."""
+
+    def test_maxsize(self):
+        """Test attribute ``maxsize``."""
+        inst = cache.LRUCache(maxsize=3)
+        assert inst.maxsize == 3
+
+        inst.update(a=1, b=2, c=3)
+        inst.maxsize = 2  # evicts
+        assert list(inst) == ["b", "c"]
+
+        with pytest.raises(ValueError, match="maxsize must be > 0."):
+            inst.maxsize = 0
+
+    # /def
+
+    def test_eviction(self):
+        """Test the least-recently-used item is evicted."""
+        inst = cache.LRUCache(maxsize=2)
+        inst["a"] = 1
+        inst["b"] = 2
+        assert inst["a"] == 1  # now "b" is least-recently used
+
+        inst["c"] = 3
+        assert len(inst) == 2
+        assert "b" not in inst
+        assert inst.get("a") == 1 and inst.get("c") == 3
+
+        del inst["a"]
+        assert list(inst) == ["c"]
+
+    # /def
+
+    def test_dump_load(self, tmp_path):
+        """Test methods ``dump`` and ``load``."""
+        inst = cache.LRUCache(maxsize=2)
+        inst.update(a=np.arange(3), b=2)
+
+        path = tmp_path / "cache.pkl"
+        inst.dump(path)
+
+        other = cache.LRUCache(maxsize=2)
+        other["c"] = 3
+        other.load(path)
+        assert list(other) == ["a", "b"]  # "c" evicted
+        assert np.array_equal(other["a"], np.arange(3))
+
+        with open(path, "wb") as file:
+            pickle.dump([1, 2], file)
+        with pytest.raises(TypeError, match="not a pickled cache"):
+            other.load(path)
+
+    # /def
+
+    def test___repr__(self):
+        """Test method ``__repr__``."""
+        inst = cache.LRUCache(maxsize=2)
+        inst["a"] = 1
+        assert repr(inst) == "LRUCache(maxsize=2, size=1)"
+
+    # /def
+
+
+# /class
+
+##############################################################################
+# END
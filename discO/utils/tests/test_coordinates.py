@@ -5,6 +5,8 @@
 __all__ = [
     "Test_resolve_framelike",
     "Test_resolve_representationlike",
+    "test_static_transform",
+    "test_transform_to",
 ]
 
 
@@ -14,14 +16,18 @@ __all__ = [
 # THIRD PARTY
 import astropy.coordinates as coord
 import astropy.units as u
+import numpy as np
 import pytest
 
 # PROJECT-SPECIFIC
 from discO.config import conf
 from discO.utils.coordinates import (
+    StaticTransform,
     UnFrame,
     resolve_framelike,
     resolve_representationlike,
+    static_transform,
+    transform_to,
 )
 
 ##############################################################################
@@ -201,5 +207,96 @@ class Test_resolve_representationlike:
 # -------------------------------------------------------------------
 
 
+# -------------------------------------------------------------------
+
+
+def test_static_transform():
+    """Test function :func:`~discO.utils.coordinates.static_transform`."""
+    frame = coord.Galactocentric()
+    transform = static_transform(coord.ICRS(), frame)
+    assert isinstance(transform, StaticTransform)
+
+    # cached, for equal frames
+    assert static_transform(coord.ICRS(), coord.Galactocentric()) is transform
+    other = coord.Galactocentric(galcen_distance=8 * u.kpc)
+    assert not np.array_equal(
+        static_transform(coord.ICRS(), other).offset,
+        transform.offset,
+    )
+
+    # matches astropy
+    c = coord.ICRS(
+        coord.CartesianRepresentation(
+            [[1, -2], [3, 4], [5, 6]] * u.kpc,
+            differentials=coord.CartesianDifferential(
+                [[10, 20], [-30, 40], [50, 60]] * u.km / u.s,
+            ),
+        ),
+    )
+    expected = c.transform_to(frame)
+    assert np.allclose(
+        transform.positions(c.cartesian.xyz.to_value(u.kpc).T).T,
+        expected.cartesian.xyz.to_value(u.kpc),
+    )
+    assert np.allclose(
+        transform.velocities(c.velocity.d_xyz.to_value(u.km / u.s).T).T,
+        expected.velocity.d_xyz.to_value(u.km / u.s),
+    )
+
+    # not static
+    assert static_transform(coord.ICRS(), coord.GCRS()) is None
+
+
+# /def
+
+
+def test_transform_to():
+    """Test function :func:`~discO.utils.coordinates.transform_to`."""
+    c = coord.SkyCoord(
+        coord.ICRS(
+            ra=[10, 200] * u.deg,
+            dec=[-30, 60] * u.deg,
+            distance=[1, 20] * u.kpc,
+            pm_ra_cosdec=[1, -2] * u.mas / u.yr,
+            pm_dec=[3, 4] * u.mas / u.yr,
+            radial_velocity=[-50, 100] * u.km / u.s,
+        ),
+    )
+    frames = (
+        coord.Galactocentric(),
+        coord.Galactic(),
+        coord.FK5(equinox="J2010"),
+        coord.GCRS(),  # not static
+    )
+    for frame in frames:
+        expected = c.transform_to(frame)
+
+        for crd in (c, c.frame):  # the same type out
+            got = transform_to(crd, frame)
+            assert isinstance(got, coord.SkyCoord) == (crd is c)
+            assert got.is_equivalent_frame(expected.frame)
+            assert np.allclose(got.cartesian.xyz, expected.cartesian.xyz)
+            assert np.allclose(got.velocity.d_xyz, expected.velocity.d_xyz)
+
+    # without distances, and SkyCoord merging its attributes: astropy
+    c = coord.SkyCoord(ra=[10, 200] * u.deg, dec=[-30, 60] * u.deg)
+    got = transform_to(c, coord.Galactic())
+    assert np.allclose(got.l, c.transform_to(coord.Galactic()).l)
+
+    c = coord.SkyCoord(
+        coord.Galactocentric(
+            [1, 2] * u.kpc,
+            [3, 4] * u.kpc,
+            [5, 6] * u.kpc,
+            galcen_distance=8 * u.kpc,
+        ),
+    )
+    got = transform_to(c, coord.Galactocentric())
+    expected = c.transform_to(coord.Galactocentric())
+    assert np.allclose(got.cartesian.xyz, expected.cartesian.xyz)
+
+
+# /def
+
 ##############################################################################
 # END
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+
+"""Testing :mod:`~discO.utils.parallel`."""
+
+__all__ = [
+    "test_map_context",
+]
+
+
+##############################################################################
+# IMPORTS
+
+# BUILT-IN
+from concurrent.futures import ThreadPoolExecutor
+
+# THIRD PARTY
+import pytest
+
+# PROJECT-SPECIFIC
+from discO.utils import parallel
+
+##############################################################################
+# TESTS
+##############################################################################
+
+
+def test_map_context():
+    """Test :func:`~discO.utils.parallel.map_context`."""
+    # serial
+    with parallel.map_context() as map_func:
+        assert map_func is map
+
+    with parallel.map_context(n_jobs=1) as map_func:
+        assert map_func is map
+
+    # processes, in order
+    with parallel.map_context(n_jobs=2) as map_func:
+        assert list(map_func(abs, range(-5, 0))) == [5, 4, 3, 2, 1]
+
+    # an executor, which is not shut down
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        with parallel.map_context(n_jobs=4, executor=executor) as map_func:
+            assert list(map_func(abs, range(-5, 0))) == [5, 4, 3, 2, 1]
+
+        assert executor.submit(abs, -1).result() == 1
+
+    with pytest.raises(TypeError, match="concurrent.futures.Executor"):
+        with parallel.map_context(executor=object()):
+            pass
+
+
+# /def
+
+##############################################################################
+# END
@@ -4,15 +4,20 @@
 
 __all__ = [
     "Test_NumpyRNGContext",
+    "test_resolve_random",
+    "test_spawn_generators",
+    "test_spawn_random_states",
 ]
 
 
 ##############################################################################
 # IMPORTS
 
+# BUILT-IN
+from concurrent.futures import ThreadPoolExecutor
+
 # THIRD PARTY
 import numpy as np
-import pytest
 
 # PROJECT-SPECIFIC
 from discO.tests.helper import ObjectTest
@@ -93,10 +98,16 @@ class Test_NumpyRNGContext(ObjectTest, obj=random.NumpyRNGContext):
             )
 
         # Generator
-        with pytest.warns(UserWarning):
-            with self.obj(np.random.default_rng(3)):
-                ns = np.random.rand(5)
-                assert len(ns) == 5
+        with self.obj(np.random.default_rng(3)):
+            ns = np.random.rand(5)
+        with self.obj(np.random.default_rng(3)):
+            assert np.array_equal(np.random.rand(5), ns)  # reproducible
+
+        rng = np.random.default_rng(3)
+        with self.obj(rng):
+            pass
+        with self.obj(rng):  # the Generator was advanced
+            assert not np.array_equal(np.random.rand(5), ns)
 
     # /def
 
@@ -110,6 +121,21 @@ class Test_NumpyRNGContext(ObjectTest, obj=random.NumpyRNGContext):
     #######################################################
     # Usage tests
 
+    def test_threads(self):
+        """Test contexts in threads don't interleave."""
+
+        def draw(seed):
+            with self.obj(seed):
+                return [np.random.rand() for _ in range(200)]
+
+        serial = [draw(seed) for seed in range(8)]
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            threaded = list(executor.map(draw, range(8)))
+
+        assert np.array_equal(threaded, serial)
+
+    # /def
+
 
 # /class
 
@@ -117,5 +143,90 @@ class Test_NumpyRNGContext(ObjectTest, obj=random.NumpyRNGContext):
 # -------------------------------------------------------------------
 
 
+def test_resolve_random():
+    """Test :func:`~discO.utils.random.resolve_random`."""
+    # seeds make a RandomState
+    assert isinstance(random.resolve_random(None), np.random.RandomState)
+    rs = random.resolve_random(2)
+    assert rs.uniform() == np.random.RandomState(2).uniform()
+
+    # random states and generators are passed thru
+    rs = np.random.RandomState(3)
+    assert random.resolve_random(rs) is rs
+    rng = np.random.default_rng(3)
+    assert random.resolve_random(rng) is rng
+
+    # a SeedSequence makes a Generator
+    rng = random.resolve_random(np.random.SeedSequence(4))
+    assert isinstance(rng, np.random.Generator)
+    assert rng.uniform() == np.random.default_rng(4).uniform()
+
+
+# /def
+
+
+def test_spawn_generators():
+    """Test :func:`~discO.utils.random.spawn_generators`."""
+    rngs = random.spawn_generators(0, 3)
+    assert len(rngs) == 3
+    assert all([isinstance(r, np.random.Generator) for r in rngs])
+
+    # reproducible from the parent seed
+    draws = [r.uniform(size=4) for r in rngs]
+    expected = [r.uniform(size=4) for r in random.spawn_generators(0, 3)]
+    assert np.array_equal(draws, expected)
+
+    # and independent
+    assert not np.allclose(draws[0], draws[1])
+
+    # a Generator parent is advanced
+    parent = np.random.default_rng(1)
+    first = random.spawn_generators(parent, 1)[0].uniform()
+    second = random.spawn_generators(parent, 1)[0].uniform()
+    assert first != second
+
+    # indexed from start
+    rngs = random.spawn_generators(0, 2, start=1)
+    assert np.array_equal([r.uniform(size=4) for r in rngs], draws[1:])
+
+    # a SeedSequence is spawned from directly
+    rngs = random.spawn_generators(np.random.SeedSequence(5), 2)
+    seeds = np.random.SeedSequence(5).spawn(2)
+    assert [r.uniform() for r in rngs] == [
+        np.random.default_rng(s).uniform() for s in seeds
+    ]
+
+
+# /def
+
+
+def test_spawn_random_states():
+    """Test :func:`~discO.utils.random.spawn_random_states`."""
+    randoms = random.spawn_random_states(0, 3)
+    assert len(randoms) == 3
+    assert all([isinstance(r, np.random.RandomState) for r in randoms])
+
+    # reproducible from the parent seed
+    draws = [r.uniform(size=4) for r in randoms]
+    expected = [r.uniform(size=4) for r in random.spawn_random_states(0, 3)]
+    assert np.array_equal(draws, expected)
+
+    # and independent
+    assert not np.allclose(draws[0], draws[1])
+
+    # indexed from start
+    randoms = random.spawn_random_states(0, 2, start=1)
+    assert np.array_equal([r.uniform(size=4) for r in randoms], draws[1:])
+
+    # a RandomState parent is advanced
+    parent = np.random.RandomState(1)
+    first = random.spawn_random_states(parent, 1)[0].uniform()
+    second = random.spawn_random_states(parent, 1)[0].uniform()
+    assert first != second
+
+
+# /def
+
+
 ##############################################################################
 # END